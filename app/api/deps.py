@@ -1,16 +1,51 @@
-from typing import Generator
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+import hmac
+from datetime import datetime
+from typing import Generator, Optional, Tuple
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, OAuth2PasswordBearer
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.core.config import settings
 from app.db.database import SessionLocal
 from app.db.models import User
-from app.services.auth import decode_access_token, get_user_by_username
+from app.schemas.users import TokenData, TokenUser
+from app.services.auth import decode_access_token, get_cached_user, get_user_by_username
+from app.services.pagination import decode_cursor
+from app.services.tokens import revoked_access_tokens
 
 
 # OAuth2 scheme for JWT token (FastAPI standard)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Same scheme, but yields None instead of raising 401 when no token is sent
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+
+# Static bearer token for operational endpoints, checked against settings
+metrics_scheme = HTTPBearer(auto_error=False)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def _verified_token_data(token: str, db: Session) -> TokenData:
+    """Decode a token and reject it if invalid or revoked."""
+    token_data = decode_access_token(token)
+    if token_data is None:
+        raise _credentials_exception()
+    
+    if revoked_access_tokens.is_stale():
+        await run_in_threadpool(revoked_access_tokens.reload, db)
+    if revoked_access_tokens.rejects(token_data):
+        raise _credentials_exception()
+    
+    return token_data
+
 
 def get_db() -> Generator:
     """
@@ -41,25 +76,63 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    credentials_exception = _credentials_exception()
     
-    # Decode token
-    token_data = decode_access_token(token)
-    if token_data is None or token_data.username is None:
-        raise credentials_exception
+    # Decode token and check it was not revoked
+    token_data = await _verified_token_data(token, db)
     
-    # Get user from database
-    user = get_user_by_username(db, username=token_data.username)
-    if user is None:
+    if token_data.user_id is not None:
+        # Get user from the cache, falling back to the database; a token newer
+        # than the cached user means the cached copy is stale
+        user = await run_in_threadpool(
+            get_cached_user, db, token_data.user_id, token_data.token_version
+        )
+        if user is None or user.token_version != token_data.token_version:
+            raise credentials_exception
+        return user
+    
+    # Tokens issued before user IDs were embedded only carry the username
+    user = await run_in_threadpool(get_user_by_username, db, token_data.username)
+    if user is None or user.deletion_requested_at is not None:
         raise credentials_exception
     
     return user
 
 
+async def get_token_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> TokenUser:
+    """
+    Dependency function to get the current user's identity from JWT claims.
+    
+    For endpoints that only need the user ID: the signed uid claim is
+    trusted as is, so no users row is read. Logged-out tokens and tokens
+    issued before a token version bump (password change, account deletion)
+    are rejected through the in-process revocation list.
+    
+    Args:
+        token: JWT token from Authorization header
+        db: Database session (only used for tokens without a uid claim)
+        
+    Returns:
+        Identity of the authenticated user
+        
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    token_data = await _verified_token_data(token, db)
+    
+    if token_data.user_id is not None:
+        return TokenUser(id=token_data.user_id, username=token_data.username)
+    
+    user = await run_in_threadpool(get_user_by_username, db, token_data.username)
+    if user is None or user.deletion_requested_at is not None:
+        raise _credentials_exception()
+    
+    return TokenUser(id=user.id, username=user.username)
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -81,3 +154,59 @@ async def get_current_active_user(
     #     raise HTTPException(status_code=400, detail="Inactive user")
     
     return current_user
+
+
+def get_page_cursor(
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page"
+    )
+) -> Optional[Tuple[datetime, int]]:
+    """
+    Dependency function to decode the keyset pagination cursor.
+    
+    Args:
+        cursor: Cursor string from the query string
+        
+    Returns:
+        Decoded cursor, or None when offset pagination is used
+        
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if cursor is None:
+        return None
+    
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def require_metrics_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(metrics_scheme)
+) -> None:
+    """
+    Dependency function to guard the /metrics endpoint.
+    
+    Args:
+        credentials: Bearer token from the Authorization header, if any
+        
+    Raises:
+        HTTPException: 404 if METRICS_TOKEN is not set, 401 if the token is
+            missing or does not match
+    """
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    
+    if credentials is None or not hmac.compare_digest(
+        credentials.credentials.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
@@ -0,0 +1,151 @@
+from datetime import datetime, timezone
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_token_user
+from app.db.async_database import get_service_db, run_service
+from app.schemas.users import TokenUser
+from app.schemas.analytics import (
+    AnalyticsSummary,
+    ExerciseProgression,
+    PersonalRecord,
+    ProgressionMetric,
+    TimeRange,
+    TrainingCalendar,
+)
+from app.services.analytics import (
+    get_analytics_summary,
+    get_exercise_progression,
+    get_training_calendar,
+)
+from app.services.catalog import find_exercise
+from app.services.records import get_personal_records
+
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"])
+
+
+@router.get("/summary", response_model=AnalyticsSummary)
+async def read_analytics_summary(
+    time_range: TimeRange = Query("all", alias="range", description="Time window to aggregate"),
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Get aggregated workout statistics for the current user.
+    
+    Args:
+        time_range: Time window (day, week, month or all)
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Workout totals, completion rate and averages for the range
+    """
+    return await run_service(
+        db,
+        get_analytics_summary,
+        user_id=current_user.id,
+        time_range=time_range
+    )
+
+
+@router.get("/records", response_model=List[PersonalRecord])
+async def read_personal_records(
+    exercise: Optional[str] = Query(None, description="Only return the record for this exercise"),
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Get personal records of the current user.
+    
+    Args:
+        exercise: Optional exercise name or alias filter
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Max weight, reps at max weight, best estimated 1RM and best
+        volume for each exercise
+    """
+    exercise_name = None
+    if exercise is not None:
+        # Accept any spelling or alias of the exercise
+        entry = await run_service(db, find_exercise, exercise)
+        if entry is None:
+            return []
+        exercise_name = entry[1]
+    
+    return await run_service(
+        db,
+        get_personal_records,
+        user_id=current_user.id,
+        exercise_name=exercise_name
+    )
+
+
+@router.get("/exercises/{name}/progression", response_model=ExerciseProgression)
+async def read_exercise_progression(
+    name: str,
+    points: int = Query(200, ge=3, le=2000, description="Maximum number of points to return"),
+    metric: ProgressionMetric = Query("estimated_1rm", description="Series preserved when downsampling"),
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Get the current user's progression on one exercise over time.
+    
+    Args:
+        name: Exercise name or alias
+        points: Maximum number of points to return
+        metric: Series used to pick points when downsampling
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Per-workout top set, volume and estimated 1RM
+        
+    Raises:
+        HTTPException: If the exercise is unknown
+    """
+    entry = await run_service(db, find_exercise, name)
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Exercise not found"
+        )
+    
+    catalog_id, exercise_name = entry
+    progression = await run_service(
+        db,
+        get_exercise_progression,
+        user_id=current_user.id,
+        catalog_id=catalog_id,
+        max_points=points,
+        metric=metric
+    )
+    return {"exercise_name": exercise_name, **progression}
+
+
+@router.get("/calendar", response_model=TrainingCalendar)
+async def read_training_calendar(
+    year: Optional[int] = Query(None, ge=1970, le=9999, description="Calendar year (defaults to the current year)"),
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Get the current user's completed workouts per day and training streaks.
+    
+    Args:
+        year: Calendar year
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Daily completed-workout counts for the year and streaks
+    """
+    if year is None:
+        year = datetime.now(timezone.utc).year
+    return await run_service(db, get_training_calendar, user_id=current_user.id, year=year)
@@ -1,16 +1,26 @@
 from datetime import timedelta
+from typing import Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
-from app.schemas.users import Token, UserCreate, User
+from app.api.deps import optional_oauth2_scheme
+from app.db.async_database import get_service_db, run_service
+from app.schemas.users import LogoutRequest, RefreshRequest, Token, UserCreate, User
 from app.services.auth import (
-    authenticate_user,
-    create_access_token,
-    create_user,
-    get_user_by_username,
-    get_user_by_email,
+    authenticate_user_async,
+    create_user_access_token,
+    create_user_async,
+    decode_access_token,
+    get_user_by_username_async,
+    get_user_by_email_async,
+)
+from app.services.tokens import (
+    issue_refresh_token,
+    revoke_access_token,
+    revoke_refresh_token,
+    rotate_refresh_token,
 )
 from app.core.config import settings
 
@@ -19,7 +29,7 @@ router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: Union[AsyncSession, Session] = Depends(get_service_db)):
     """
     Register a new user.
     
@@ -32,9 +42,10 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         
     Raises:
         HTTPException: If username or email already exists
+        PasswordHashingBusy: If the hashing queue is full (served as 503)
     """
     # Check if username already exists
-    existing_user = get_user_by_username(db, username=user_data.username)
+    existing_user = await get_user_by_username_async(db, username=user_data.username)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -42,7 +53,7 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Check if email already exists
-    existing_email = get_user_by_email(db, email=user_data.email)
+    existing_email = await get_user_by_email_async(db, email=user_data.email)
     if existing_email:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -50,7 +61,7 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    user = create_user(
+    user = await create_user_async(
         db=db,
         username=user_data.username,
         email=user_data.email,
@@ -61,25 +72,26 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
 ):
     """
-    Login to get access token (JWT).
+    Login to get an access token (JWT) and a refresh token.
     
     Args:
         form_data: OAuth2 form with username and password
         db: Database session
         
     Returns:
-        Access token
+        Access token and refresh token
         
     Raises:
         HTTPException: If authentication fails
+        PasswordHashingBusy: If the hashing queue is full (served as 503)
     """
     # Authenticate user
-    user = authenticate_user(db, username=form_data.username, password=form_data.password)
+    user = await authenticate_user_async(db, username=form_data.username, password=form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -89,9 +101,72 @@ def login(
     
     # Create access token
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.username},
-        expires_delta=access_token_expires
-    )
+    access_token = create_user_access_token(user, expires_delta=access_token_expires)
+    refresh_token = await run_service(db, issue_refresh_token, user.id)
+    
+    return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(
+    refresh_data: RefreshRequest,
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Exchange a refresh token for a new access token and refresh token.
+    
+    Skips password verification, so short-lived access tokens can be
+    renewed cheaply. The refresh token is rotated: the one presented
+    stops working.
+    
+    Args:
+        refresh_data: Refresh token from login or the previous refresh
+        db: Database session
+        
+    Returns:
+        New access token and refresh token
+        
+    Raises:
+        HTTPException: If the refresh token is invalid, expired or revoked
+    """
+    rotated = await run_service(db, rotate_refresh_token, refresh_data.refresh_token)
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    user, refresh_token = rotated
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_user_access_token(user, expires_delta=access_token_expires)
+    
+    return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    logout_data: LogoutRequest = LogoutRequest(),
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Revoke the refresh token, if given, and the current access token.
+    
+    The refresh token is revoked even when the access token is missing,
+    expired or invalid, since clients often log out after the short-lived
+    access token has expired; only a still valid access token is revoked.
+    
+    Args:
+        logout_data: Optional refresh token to revoke
+        token: JWT token from Authorization header, if any
+        db: Database session
+    """
+    if logout_data.refresh_token:
+        await run_service(db, revoke_refresh_token, logout_data.refresh_token)
+    
+    token_data = decode_access_token(token) if token else None
+    if token_data is not None and token_data.jti is not None and token_data.expires_at is not None:
+        await run_service(db, revoke_access_token, token_data.jti, token_data.expires_at)
     
-    return {"access_token": access_token, "token_type": "bearer"}
+    return None
@@ -0,0 +1,46 @@
+from typing import Union
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user
+from app.db.async_database import get_service_db, run_service
+from app.db.models import User
+from app.schemas.analytics import TimeRange
+from app.schemas.dashboard import Dashboard
+from app.services.dashboard import get_dashboard
+
+
+router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+
+
+@router.get("", response_model=Dashboard)
+async def read_dashboard(
+    workouts: int = Query(5, ge=1, le=50, description="Number of recent workouts"),
+    time_range: TimeRange = Query("week", alias="range"),
+    current_user: User = Depends(get_current_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Get the dashboard for the current user in a single round trip.
+    
+    The queries run back to back in a single run_service call, so they
+    never block the event loop.
+    
+    Args:
+        workouts: Number of recent workout summaries to include
+        time_range: Time range of the headline stats
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        User profile, recent workouts, last week of sleep and nutrition logs
+        and headline stats
+    """
+    return await run_service(
+        db,
+        get_dashboard,
+        user=current_user,
+        workout_limit=workouts,
+        time_range=time_range
+    )
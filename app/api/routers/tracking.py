@@ -1,15 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import date
+from typing import List, Optional, Tuple, Union
+from datetime import date, datetime
 
-from app.db.database import get_db
-from app.db.models import User, SleepLog, NutritionLog
+from app.db.async_database import get_service_db
+from app.db.models import SleepLog, NutritionLog
 from app.schemas.tracking import (
-    SleepLogCreate, SleepLogUpdate, SleepLog as SleepLogSchema,
-    NutritionLogCreate, NutritionLogUpdate, NutritionLog as NutritionLogSchema
+    SleepLogCreate, SleepLogUpdate, SleepLogUpsert, SleepLog as SleepLogSchema,
+    NutritionLogCreate, NutritionLogUpdate, NutritionLogUpsert, NutritionLog as NutritionLogSchema
+)
+from app.api.deps import get_token_user, get_page_cursor
+from app.schemas.users import TokenUser
+from app.services.pagination import NEXT_CURSOR_HEADER, next_cursor
+from app.services.tracking import (
+    create_sleep_log_async, upsert_sleep_log_async,
+    create_nutrition_log_async, upsert_nutrition_log_async,
+    get_daily_logs_async, get_daily_log_async, update_daily_log_async, delete_daily_log_async
 )
-from app.api.deps import get_current_user
 
 router = APIRouter()
 
@@ -19,54 +27,45 @@ router = APIRouter()
 @router.post("/sleep", response_model=SleepLogSchema, status_code=status.HTTP_201_CREATED)
 async def create_sleep_log(
     sleep_data: SleepLogCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
     """Create a new sleep log entry"""
-    # Check if entry already exists for this date
-    existing_log = db.query(SleepLog).filter(
-        SleepLog.user_id == current_user.id,
-        SleepLog.date == sleep_data.date
-    ).first()
-    
-    if existing_log:
+    new_log = await create_sleep_log_async(db, current_user.id, sleep_data.date, sleep_data.model_dump(exclude={"date"}))
+    if new_log is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Sleep log already exists for this date"
         )
-    
-    new_log = SleepLog(**sleep_data.model_dump(), user_id=current_user.id)
-    db.add(new_log)
-    db.commit()
-    db.refresh(new_log)
     return new_log
 
 
 @router.get("/sleep", response_model=List[SleepLogSchema])
 async def get_sleep_logs(
-    skip: int = 0,
-    limit: int = 30,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(30, ge=1, le=100, description="Maximum number of records to return"),
+    cursor: Optional[Tuple[datetime, int]] = Depends(get_page_cursor),
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
-    """Get all sleep logs for current user"""
-    logs = db.query(SleepLog).filter(
-        SleepLog.user_id == current_user.id
-    ).order_by(SleepLog.date.desc()).offset(skip).limit(limit).all()
+    """Get all sleep logs for current user, newest first (offset or cursor paginated)"""
+    logs = await get_daily_logs_async(db, SleepLog, current_user.id, skip, limit, cursor)
+    
+    page_cursor = next_cursor(logs, limit)
+    if page_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page_cursor
     return logs
 
 
 @router.get("/sleep/{log_id}", response_model=SleepLogSchema)
 async def get_sleep_log(
     log_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
     """Get a specific sleep log"""
-    log = db.query(SleepLog).filter(
-        SleepLog.id == log_id,
-        SleepLog.user_id == current_user.id
-    ).first()
+    log = await get_daily_log_async(db, SleepLog, log_id, current_user.id)
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,107 +74,94 @@ async def get_sleep_log(
     return log
 
 
+@router.put("/sleep/by-date/{log_date}", response_model=SleepLogSchema)
+async def put_sleep_log_by_date(
+    log_date: date,
+    sleep_data: SleepLogUpsert,
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
+):
+    """Create or replace the sleep log for a date"""
+    return await upsert_sleep_log_async(db, current_user.id, log_date, sleep_data.model_dump())
+
+
 @router.put("/sleep/{log_id}", response_model=SleepLogSchema)
 async def update_sleep_log(
     log_id: int,
     sleep_data: SleepLogUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
     """Update a sleep log"""
-    log = db.query(SleepLog).filter(
-        SleepLog.id == log_id,
-        SleepLog.user_id == current_user.id
-    ).first()
+    log = await update_daily_log_async(
+        db, SleepLog, log_id, current_user.id, sleep_data.model_dump(exclude_unset=True)
+    )
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Sleep log not found"
         )
-    
-    update_data = sleep_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(log, field, value)
-    
-    db.commit()
-    db.refresh(log)
     return log
 
 
 @router.delete("/sleep/{log_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_sleep_log(
     log_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
     """Delete a sleep log"""
-    log = db.query(SleepLog).filter(
-        SleepLog.id == log_id,
-        SleepLog.user_id == current_user.id
-    ).first()
-    if not log:
+    if not await delete_daily_log_async(db, SleepLog, log_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Sleep log not found"
         )
-    
-    db.delete(log)
-    db.commit()
 
 
 # Nutrition Tracking Endpoints
 
 @router.post("/nutrition", response_model=NutritionLogSchema, status_code=status.HTTP_201_CREATED)
-def create_nutrition_log(
+async def create_nutrition_log(
     nutrition_data: NutritionLogCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
     """Create a new nutrition log entry"""
-    # Check if entry already exists for this date
-    existing_log = db.query(NutritionLog).filter(
-        NutritionLog.user_id == current_user.id,
-        NutritionLog.date == nutrition_data.date
-    ).first()
-    
-    if existing_log:
+    new_log = await create_nutrition_log_async(db, current_user.id, nutrition_data.date, nutrition_data.model_dump(exclude={"date"}))
+    if new_log is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Nutrition log already exists for this date"
         )
-    
-    new_log = NutritionLog(**nutrition_data.model_dump(), user_id=current_user.id)
-    db.add(new_log)
-    db.commit()
-    db.refresh(new_log)
     return new_log
 
 
 @router.get("/nutrition", response_model=List[NutritionLogSchema])
-def get_nutrition_logs(
-    skip: int = 0,
-    limit: int = 30,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def get_nutrition_logs(
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(30, ge=1, le=100, description="Maximum number of records to return"),
+    cursor: Optional[Tuple[datetime, int]] = Depends(get_page_cursor),
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
-    """Get all nutrition logs for current user"""
-    logs = db.query(NutritionLog).filter(
-        NutritionLog.user_id == current_user.id
-    ).order_by(NutritionLog.date.desc()).offset(skip).limit(limit).all()
+    """Get all nutrition logs for current user, newest first (offset or cursor paginated)"""
+    logs = await get_daily_logs_async(db, NutritionLog, current_user.id, skip, limit, cursor)
+    
+    page_cursor = next_cursor(logs, limit)
+    if page_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page_cursor
     return logs
 
 
 @router.get("/nutrition/{log_id}", response_model=NutritionLogSchema)
-def get_nutrition_log(
+async def get_nutrition_log(
     log_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
     """Get a specific nutrition log"""
-    log = db.query(NutritionLog).filter(
-        NutritionLog.id == log_id,
-        NutritionLog.user_id == current_user.id
-    ).first()
+    log = await get_daily_log_async(db, NutritionLog, log_id, current_user.id)
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -184,49 +170,45 @@ def get_nutrition_log(
     return log
 
 
+@router.put("/nutrition/by-date/{log_date}", response_model=NutritionLogSchema)
+async def put_nutrition_log_by_date(
+    log_date: date,
+    nutrition_data: NutritionLogUpsert,
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
+):
+    """Create or replace the nutrition log for a date"""
+    return await upsert_nutrition_log_async(db, current_user.id, log_date, nutrition_data.model_dump())
+
+
 @router.put("/nutrition/{log_id}", response_model=NutritionLogSchema)
-def update_nutrition_log(
+async def update_nutrition_log(
     log_id: int,
     nutrition_data: NutritionLogUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
     """Update a nutrition log"""
-    log = db.query(NutritionLog).filter(
-        NutritionLog.id == log_id,
-        NutritionLog.user_id == current_user.id
-    ).first()
+    log = await update_daily_log_async(
+        db, NutritionLog, log_id, current_user.id, nutrition_data.model_dump(exclude_unset=True)
+    )
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Nutrition log not found"
         )
-    
-    update_data = nutrition_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(log, field, value)
-    
-    db.commit()
-    db.refresh(log)
     return log
 
 
 @router.delete("/nutrition/{log_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_nutrition_log(
+async def delete_nutrition_log(
     log_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Union[AsyncSession, Session] = Depends(get_service_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
     """Delete a nutrition log"""
-    log = db.query(NutritionLog).filter(
-        NutritionLog.id == log_id,
-        NutritionLog.user_id == current_user.id
-    ).first()
-    if not log:
+    if not await delete_daily_log_async(db, NutritionLog, log_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Nutrition log not found"
         )
-    
-    db.delete(log)
-    db.commit()
@@ -1,10 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Union
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
-from app.schemas.users import User, UserUpdate
+from app.db.async_database import get_service_db, run_service
+from app.schemas.users import AccountDeletionJob, User, UserUpdate
 from app.db.models import User as UserModel
-from app.services.auth import hash_password, get_user_by_username, get_user_by_email
+from app.services.account_deletion import (
+    get_account_deletion_job,
+    purge_account,
+    request_account_deletion,
+)
+from app.services.auth import (
+    hash_password_async,
+    get_user_by_username,
+    get_user_by_email,
+    update_user,
+)
 
 
 router = APIRouter(prefix="/api/users", tags=["users"])
@@ -33,6 +46,9 @@ async def update_user_me(
     """
     Update current user information.
     
+    Queries run through run_service on the session current_user is
+    attached to, so they stay off the event loop.
+    
     Args:
         user_update: User update data
         current_user: Current authenticated user
@@ -43,62 +59,98 @@ async def update_user_me(
         
     Raises:
         HTTPException: If username or email already taken by another user
+        PasswordHashingBusy: If the hashing queue is full (served as 503)
     """
+    fields = {}
+    
     # Check if username is being changed and if it's already taken
     if user_update.username and user_update.username != current_user.username:
-        existing_user = get_user_by_username(db, username=user_update.username)
+        existing_user = await run_service(db, get_user_by_username, user_update.username)
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already taken"
             )
-        current_user.username = user_update.username
+        fields["username"] = user_update.username
     
     # Check if email is being changed and if it's already taken
     if user_update.email and user_update.email != current_user.email:
-        existing_email = get_user_by_email(db, email=user_update.email)
+        existing_email = await run_service(db, get_user_by_email, user_update.email)
         if existing_email:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already taken"
             )
-        current_user.email = user_update.email
-    
-    # Update password if provided
-    if user_update.password:
-        current_user.password = hash_password(user_update.password)
+        fields["email"] = user_update.email
     
     # Update personal stats if provided
-    if user_update.age is not None:
-        current_user.age = user_update.age
-    if user_update.height is not None:
-        current_user.height = user_update.height
-    if user_update.weight is not None:
-        current_user.weight = user_update.weight
-    if user_update.gender is not None:
-        current_user.gender = user_update.gender
-    if user_update.fitness_goal is not None:
-        current_user.fitness_goal = user_update.fitness_goal
+    for field in ("age", "height", "weight", "gender", "fitness_goal"):
+        value = getattr(user_update, field)
+        if value is not None:
+            fields[field] = value
     
-    db.commit()
-    db.refresh(current_user)
+    # Tokens issued with the old password stop working
+    hashed_password = None
+    if user_update.password:
+        hashed_password = await hash_password_async(user_update.password)
     
-    return current_user
+    return await run_service(db, update_user, current_user, fields, hashed_password)
 
 
-@router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/me", response_model=AccountDeletionJob, status_code=status.HTTP_202_ACCEPTED)
 async def delete_user_me(
+    background_tasks: BackgroundTasks,
+    response: Response,
     current_user: UserModel = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Delete current user account.
     
+    Every token issued to the account stops working at once and its data
+    is purged in the background; poll the returned job (also in the
+    Location header) to follow progress.
+    
     Args:
+        background_tasks: Runs the purge after the response is sent
+        response: Response, for the Location header
         current_user: Current authenticated user
         db: Database session
+        
+    Returns:
+        Pending account deletion job
     """
-    db.delete(current_user)
-    db.commit()
+    job = await run_service(db, request_account_deletion, current_user)
+    background_tasks.add_task(purge_account, job.id)
+    response.headers["Location"] = f"/api/users/deletion-jobs/{job.id}"
+    return job
+
+
+@router.get("/deletion-jobs/{job_id}", response_model=AccountDeletionJob)
+async def read_deletion_job(
+    job_id: str,
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Get the progress of an account deletion.
+    
+    Needs no token, since the account's tokens stop working once deletion
+    is requested; the random job ID is the only handle.
     
-    return None
+    Args:
+        job_id: Job ID returned when the deletion was requested
+        db: Database session
+        
+    Returns:
+        Account deletion job
+        
+    Raises:
+        HTTPException: If the job does not exist
+    """
+    job = await run_service(db, get_account_deletion_job, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Deletion job not found"
+        )
+    return job
@@ -1,8 +1,10 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime
+from typing import List, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_token_user, get_page_cursor
 from app.schemas.workouts import (
     WorkoutSession,
     WorkoutSessionCreate,
@@ -10,17 +12,30 @@ from app.schemas.workouts import (
     WorkoutSessionList,
     Exercise,
     ExerciseCreate,
+    ExerciseUpdate,
+    WorkoutSet,
+    WorkoutSetCreate,
+    WorkoutSetUpdate,
 )
-from app.db.models import User
+from app.schemas.users import TokenUser
+from app.db.async_database import get_service_db
 from app.services.workouts import (
-    create_workout_session,
-    get_workout_session,
-    get_user_workouts,
-    update_workout_session,
-    delete_workout_session,
-    add_exercise_to_workout,
-    delete_exercise,
+    create_workout_session_async,
+    get_workout_session_async,
+    get_user_workouts_async,
+    get_user_workout_summaries_async,
+    update_workout_session_async,
+    delete_workout_session_async,
+    add_exercise_to_workout_async,
+    delete_exercise_async,
+    toggle_exercise_completion_async,
+    complete_workout_session_async,
+    update_exercise_async,
+    add_set_to_exercise_async,
+    update_workout_set_async,
+    delete_workout_set_async,
 )
+from app.services.pagination import NEXT_CURSOR_HEADER, next_cursor
 
 
 router = APIRouter(prefix="/api/workouts", tags=["workouts"])
@@ -29,8 +44,8 @@ router = APIRouter(prefix="/api/workouts", tags=["workouts"])
 @router.post("", response_model=WorkoutSession, status_code=status.HTTP_201_CREATED)
 async def create_workout(
     workout_data: WorkoutSessionCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
 ):
     """
     Create a new workout session with exercises and sets.
@@ -43,7 +58,7 @@ async def create_workout(
     Returns:
         Created workout session
     """
-    workout = create_workout_session(
+    workout = await create_workout_session_async(
         db=db,
         workout_data=workout_data,
         user_id=current_user.id
@@ -53,37 +68,92 @@ async def create_workout(
 
 @router.get("", response_model=List[WorkoutSession])
 async def list_workouts(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[Tuple[datetime, int]] = Depends(get_page_cursor),
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
 ):
     """
-    List all workout sessions for the current user.
+    List all workout sessions for the current user, newest first.
+    
+    The cursor for the next page is returned in the X-Next-Cursor header;
+    pass it back as ``cursor`` for constant-cost keyset pagination.
     
     Args:
-        skip: Number of records to skip (pagination)
+        response: Response used to set the next-page cursor header
+        skip: Number of records to skip (legacy offset pagination)
         limit: Maximum number of records to return
+        cursor: Decoded keyset cursor from the previous page
         current_user: Current authenticated user
         db: Database session
         
     Returns:
         List of workout sessions
     """
-    workouts = get_user_workouts(
+    workouts = await get_user_workouts_async(
         db=db,
         user_id=current_user.id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
+    
+    page_cursor = next_cursor(workouts, limit)
+    if page_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page_cursor
+    
     return workouts
 
 
+@router.get("/summary", response_model=List[WorkoutSessionList])
+async def list_workout_summaries(
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
+    cursor: Optional[Tuple[datetime, int]] = Depends(get_page_cursor),
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    List workout sessions for the current user without nested exercises.
+    
+    Each row carries exercise count, set count and total volume, making
+    this the lightweight alternative to the full listing for dashboards.
+    Paginates like the full listing.
+    
+    Args:
+        response: Response used to set the next-page cursor header
+        skip: Number of records to skip (legacy offset pagination)
+        limit: Maximum number of records to return
+        cursor: Decoded keyset cursor from the previous page
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        List of workout session summaries
+    """
+    summaries = await get_user_workout_summaries_async(
+        db=db,
+        user_id=current_user.id,
+        skip=skip,
+        limit=limit,
+        cursor=cursor
+    )
+    
+    page_cursor = next_cursor(summaries, limit)
+    if page_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page_cursor
+    
+    return summaries
+
+
 @router.get("/{workout_id}", response_model=WorkoutSession)
 async def get_workout(
     workout_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
 ):
     """
     Get a specific workout session by ID.
@@ -99,7 +169,7 @@ async def get_workout(
     Raises:
         HTTPException: If workout not found or doesn't belong to user
     """
-    workout = get_workout_session(
+    workout = await get_workout_session_async(
         db=db,
         workout_id=workout_id,
         user_id=current_user.id
@@ -118,8 +188,8 @@ async def get_workout(
 async def update_workout(
     workout_id: int,
     workout_data: WorkoutSessionUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
 ):
     """
     Update a workout session.
@@ -136,7 +206,7 @@ async def update_workout(
     Raises:
         HTTPException: If workout not found or doesn't belong to user
     """
-    workout = update_workout_session(
+    workout = await update_workout_session_async(
         db=db,
         workout_id=workout_id,
         workout_data=workout_data,
@@ -155,8 +225,8 @@ async def update_workout(
 @router.delete("/{workout_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_workout(
     workout_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
 ):
     """
     Delete a workout session.
@@ -169,7 +239,7 @@ async def delete_workout(
     Raises:
         HTTPException: If workout not found or doesn't belong to user
     """
-    success = delete_workout_session(
+    success = await delete_workout_session_async(
         db=db,
         workout_id=workout_id,
         user_id=current_user.id
@@ -188,8 +258,8 @@ async def delete_workout(
 async def add_exercise(
     workout_id: int,
     exercise_data: ExerciseCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
 ):
     """
     Add an exercise to a workout session.
@@ -206,7 +276,7 @@ async def add_exercise(
     Raises:
         HTTPException: If workout not found or doesn't belong to user
     """
-    exercise = add_exercise_to_workout(
+    exercise = await add_exercise_to_workout_async(
         db=db,
         workout_id=workout_id,
         exercise_data=exercise_data,
@@ -225,8 +295,8 @@ async def add_exercise(
 @router.delete("/exercises/{exercise_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_exercise(
     exercise_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
 ):
     """
     Delete an exercise from a workout session.
@@ -239,7 +309,7 @@ async def remove_exercise(
     Raises:
         HTTPException: If exercise not found or doesn't belong to user
     """
-    success = delete_exercise(
+    success = await delete_exercise_async(
         db=db,
         exercise_id=exercise_id,
         user_id=current_user.id
@@ -254,56 +324,167 @@ async def remove_exercise(
     return None
 
 
-@router.patch("/{workout_id}/exercises/{exercise_id}/complete", response_model=WorkoutSession)
-async def toggle_exercise_completion(
-    workout_id: int,
+@router.patch("/exercises/{exercise_id}", response_model=Exercise)
+async def update_exercise(
     exercise_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    exercise_data: ExerciseUpdate,
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
 ):
-    """Toggle exercise completion status and check if workout is complete"""
-    from app.db.models import WorkoutSession as WorkoutModel, Exercise as ExerciseModel
-    from datetime import datetime
+    """
+    Rename an exercise.
     
-    # Get workout and verify ownership
-    workout = db.query(WorkoutModel).filter(
-        WorkoutModel.id == workout_id,
-        WorkoutModel.user_id == current_user.id
-    ).first()
+    Args:
+        exercise_id: Exercise ID
+        exercise_data: Updated exercise data
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Updated exercise
+        
+    Raises:
+        HTTPException: If exercise not found or doesn't belong to user
+    """
+    exercise = await update_exercise_async(
+        db=db,
+        exercise_id=exercise_id,
+        exercise_data=exercise_data,
+        user_id=current_user.id
+    )
     
-    if not workout:
+    if not exercise:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Workout not found"
+            detail="Exercise not found"
         )
     
-    # Get exercise and verify it belongs to this workout
-    exercise = db.query(ExerciseModel).filter(
-        ExerciseModel.id == exercise_id,
-        ExerciseModel.session_id == workout_id
-    ).first()
+    return exercise
+
+
+@router.post("/exercises/{exercise_id}/sets", response_model=WorkoutSet, status_code=status.HTTP_201_CREATED)
+async def add_set(
+    exercise_id: int,
+    set_data: WorkoutSetCreate,
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Add a set to an exercise.
     
-    if not exercise:
+    Args:
+        exercise_id: Exercise ID
+        set_data: Set data
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Created set
+        
+    Raises:
+        HTTPException: If exercise not found or doesn't belong to user
+    """
+    workout_set = await add_set_to_exercise_async(
+        db=db,
+        exercise_id=exercise_id,
+        set_data=set_data,
+        user_id=current_user.id
+    )
+    
+    if not workout_set:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Exercise not found"
         )
     
-    # Toggle exercise completion
-    exercise.is_completed = not exercise.is_completed
+    return workout_set
+
+
+@router.patch("/sets/{set_id}", response_model=WorkoutSet)
+async def update_set(
+    set_id: int,
+    set_data: WorkoutSetUpdate,
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Update a set's reps or weight.
     
-    # Check if all exercises are completed
-    all_completed = all(ex.is_completed for ex in workout.exercises)
+    Args:
+        set_id: Set ID
+        set_data: Updated set data
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Updated set
+        
+    Raises:
+        HTTPException: If set not found or doesn't belong to user
+    """
+    workout_set = await update_workout_set_async(
+        db=db,
+        set_id=set_id,
+        set_data=set_data,
+        user_id=current_user.id
+    )
     
-    if all_completed and not workout.is_completed:
-        workout.is_completed = True
-        workout.completed_at = datetime.now()
-    elif not all_completed and workout.is_completed:
-        workout.is_completed = False
-        workout.completed_at = None
+    if not workout_set:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Set not found"
+        )
     
-    db.commit()
-    db.refresh(workout)
+    return workout_set
+
+
+@router.delete("/sets/{set_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remove_set(
+    set_id: int,
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """
+    Delete a set from an exercise.
+    
+    Args:
+        set_id: Set ID
+        current_user: Current authenticated user
+        db: Database session
+        
+    Raises:
+        HTTPException: If set not found or doesn't belong to user
+    """
+    success = await delete_workout_set_async(
+        db=db,
+        set_id=set_id,
+        user_id=current_user.id
+    )
+    
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Set not found"
+        )
+    
+    return None
+
+
+@router.patch("/{workout_id}/exercises/{exercise_id}/complete", response_model=WorkoutSession)
+async def toggle_exercise_completion(
+    workout_id: int,
+    exercise_id: int,
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
+):
+    """Toggle exercise completion status and check if workout is complete"""
+    workout = await toggle_exercise_completion_async(db, workout_id, exercise_id, current_user.id)
+    
+    if not workout:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Exercise not found"
+        )
     
     return workout
 
@@ -311,17 +492,11 @@ async def toggle_exercise_completion(
 @router.patch("/{workout_id}/complete", response_model=WorkoutSession)
 async def mark_workout_complete(
     workout_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Union[AsyncSession, Session] = Depends(get_service_db)
 ):
     """Mark all exercises and workout as complete"""
-    from app.db.models import WorkoutSession as WorkoutModel
-    from datetime import datetime
-    
-    workout = db.query(WorkoutModel).filter(
-        WorkoutModel.id == workout_id,
-        WorkoutModel.user_id == current_user.id
-    ).first()
+    workout = await complete_workout_session_async(db, workout_id, current_user.id)
     
     if not workout:
         raise HTTPException(
@@ -329,15 +504,4 @@ async def mark_workout_complete(
             detail="Workout not found"
         )
     
-    # Mark all exercises as completed
-    for exercise in workout.exercises:
-        exercise.is_completed = True
-    
-    # Mark workout as completed
-    workout.is_completed = True
-    workout.completed_at = datetime.now()
-    
-    db.commit()
-    db.refresh(workout)
-    
     return workout
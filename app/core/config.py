@@ -13,6 +13,17 @@ class Settings:
         "DATABASE_URL", 
         "postgresql://gymtrack:gymtrack@db:5432/gymtrack"
     )
+    # Connection pool, per engine and worker process (recycle -1 keeps connections
+    # indefinitely; pre-ping tests each connection on checkout, set 0 to rely on recycle)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "-1"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "1").lower() in ("1", "true", "yes")
+    # Serve services through the async engine (asyncpg / aiosqlite) instead of the thread pool
+    DB_ASYNC: bool = os.getenv("DB_ASYNC", "0").lower() in ("1", "true", "yes")
+    # Rows removed per transaction when purging a deleted account
+    ACCOUNT_PURGE_BATCH_SIZE: int = int(os.getenv("ACCOUNT_PURGE_BATCH_SIZE", "500"))
     
     # JWT Authentication
     SECRET_KEY: str = os.getenv(
@@ -21,6 +32,28 @@ class Settings:
     )
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "30"))
+    # How often each process reloads the set of revoked access tokens from the database
+    REVOCATION_RELOAD_SECONDS: float = float(os.getenv("REVOCATION_RELOAD_SECONDS", "15"))
+    
+    # Authenticated user cache (per process; the TTL bounds staleness across workers)
+    USER_CACHE_SIZE: int = int(os.getenv("USER_CACHE_SIZE", "1024"))
+    USER_CACHE_TTL_SECONDS: float = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+    
+    # Password hashing (stored hashes with other parameters are upgraded on login;
+    # run scripts/calibrate_password_hasher.py to pick values for this host)
+    PASSWORD_HASHER: str = os.getenv("PASSWORD_HASHER", "pbkdf2_sha256")  # pbkdf2_sha256 or scrypt
+    PBKDF2_ITERATIONS: int = int(os.getenv("PBKDF2_ITERATIONS", "260000"))
+    SCRYPT_N: int = int(os.getenv("SCRYPT_N", str(2 ** 14)))
+    SCRYPT_R: int = int(os.getenv("SCRYPT_R", "8"))
+    SCRYPT_P: int = int(os.getenv("SCRYPT_P", "1"))
+    
+    # Password hashing pool (0 workers hashes on the event loop's thread pool)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+    PASSWORD_HASH_QUEUE_SIZE: int = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))
+    
+    # Bearer token scrapers must send to read /metrics (unset disables the endpoint)
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")
     
     # Application
     APP_NAME: str = "GymTrack API"
@@ -0,0 +1,102 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when too many password hashing jobs are already queued."""
+
+
+class PasswordHashingPool:
+    """
+    Bounded executor for CPU-heavy password hashing.
+
+    Jobs run in a process pool so key derivation neither blocks the event
+    loop nor competes with request handling for the GIL. At most
+    max_pending jobs may be queued or running; further jobs are rejected
+    immediately with PasswordHashingBusy instead of piling up latency.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        """
+        Args:
+            workers: Number of worker processes (0 runs jobs on the event
+                loop's default thread pool instead)
+            max_pending: Maximum number of queued or running jobs
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.rejected = 0
+
+    def _get_executor(self) -> Optional[Executor]:
+        """
+        Start the worker processes on first use.
+
+        Workers are spawned rather than forked: forking a server process
+        that already runs threads and holds pooled database connections
+        can deadlock on locks held by other threads and shares the
+        connections' sockets with the children.
+        """
+        if self.workers <= 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    async def run(self, func: Callable, *args) -> Any:
+        """
+        Run a picklable function in the pool.
+
+        Args:
+            func: Module-level function to run
+            args: Positional arguments for func
+
+        Returns:
+            The function's return value
+
+        Raises:
+            PasswordHashingBusy: If max_pending jobs are already in flight
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHashingBusy()
+            self.pending += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (they are restarted on next use)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary with workers, max_pending, pending and rejected
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "rejected": self.rejected,
+            }
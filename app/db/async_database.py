@@ -0,0 +1,109 @@
+from functools import lru_cache
+from typing import AsyncGenerator, Callable, Union
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.database import enable_sqlite_foreign_keys, get_db, pool_options
+from app.db.pool import InstrumentedAsyncQueuePool
+
+
+# Async drivers used for each sync database URL scheme
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    Convert a sync database URL to its async driver equivalent.
+    
+    Args:
+        url: Database URL such as postgresql://... or sqlite:///...
+        
+    Returns:
+        URL using asyncpg or aiosqlite
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    return parsed.set(drivername=ASYNC_DRIVERS.get(backend, parsed.drivername)).render_as_string(hide_password=False)
+
+
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async engine, creating it on first use.
+    
+    Created lazily so deployments running the sync path do not need the
+    async drivers installed.
+    """
+    engine = create_async_engine(
+        to_async_url(settings.DATABASE_URL),
+        poolclass=InstrumentedAsyncQueuePool,
+        echo=False,
+        **pool_options()
+    )
+    enable_sqlite_foreign_keys(engine.sync_engine)
+    return engine
+
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker() -> async_sessionmaker:
+    """Get the AsyncSession factory bound to the async engine."""
+    # Keep loaded attributes after commit: expired ones cannot be lazily
+    # refreshed once the response is serialized outside the session
+    return async_sessionmaker(
+        get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get an async database session.
+    Yields an AsyncSession and closes it after use.
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def get_service_db() -> AsyncGenerator[Union[AsyncSession, Session], None]:
+    """
+    Dependency function to get the session used by service calls.
+    
+    Yields an AsyncSession when settings.DB_ASYNC is enabled and a regular
+    Session otherwise; pass it to run_service (or an *_async service).
+    """
+    if settings.DB_ASYNC:
+        async for db in get_async_db():
+            yield db
+    else:
+        for db in get_db():
+            yield db
+
+
+async def run_service(db: Union[AsyncSession, Session], func: Callable, *args, **kwargs):
+    """
+    Run a synchronous service function without blocking the event loop.
+    
+    With an AsyncSession the function runs on the async connection via
+    AsyncSession.run_sync (same ORM code, non-blocking driver); with a
+    regular Session it runs in the thread pool.
+    
+    Args:
+        db: Session from get_service_db
+        func: Service function taking the session as first argument
+        args: Positional arguments for func
+        kwargs: Keyword arguments for func
+        
+    Returns:
+        The function's return value
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(func, *args, **kwargs)
+    return await run_in_threadpool(func, db, *args, **kwargs)
@@ -1,14 +1,56 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool
+
+
+def pool_options() -> dict:
+    """
+    Connection pool arguments shared by the sync and async engines.
+    
+    Each worker process holds up to pool_size + max_overflow connections,
+    so size them so that workers * (pool_size + max_overflow) stays below
+    Postgres max_connections.
+    """
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def enable_sqlite_foreign_keys(engine) -> None:
+    """
+    Turn on foreign key enforcement for an engine's SQLite connections.
+    
+    SQLite ignores foreign keys, including ON DELETE CASCADE, unless each
+    connection enables them; other databases are left untouched.
+    
+    Args:
+        engine: Sync engine (for an AsyncEngine, pass engine.sync_engine)
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    
+    @event.listens_for(engine, "connect")
+    def _set_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=False
+    poolclass=InstrumentedQueuePool,
+    echo=False,
+    **pool_options()
 )
+enable_sqlite_foreign_keys(engine)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(
@@ -31,3 +73,19 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def insert_on_conflict(db, model):
+    """
+    Build an INSERT for the session's dialect that supports ON CONFLICT.
+    
+    Args:
+        db: Database session
+        model: Mapped class or table to insert into
+        
+    Returns:
+        Dialect-specific Insert construct exposing on_conflict_do_update
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
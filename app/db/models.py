@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Date, Text, Boolean
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Date, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -13,6 +14,8 @@ class User(Base):
     username = Column(String, unique=True, index=True, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
     password = Column(String, nullable=False)  # Hashed password
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)  # Bumped to revoke issued tokens
+    deletion_requested_at = Column(DateTime(timezone=True), nullable=True)  # Set while the account is being purged
     
     # Personal stats
     age = Column(Integer, nullable=True)
@@ -22,9 +25,12 @@ class User(Base):
     fitness_goal = Column(String, nullable=True)  # Weight Loss, Muscle Gain, General Fitness, etc.
     
     # Relationships
-    workouts = relationship("WorkoutSession", back_populates="user", cascade="all, delete-orphan")
-    sleep_logs = relationship("SleepLog", back_populates="user", cascade="all, delete-orphan")
-    nutrition_logs = relationship("NutritionLog", back_populates="user", cascade="all, delete-orphan")
+    workouts = relationship("WorkoutSession", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    sleep_logs = relationship("SleepLog", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    nutrition_logs = relationship("NutritionLog", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    daily_stats = relationship("UserDailyStats", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    personal_records = relationship("PersonalRecord", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class WorkoutSession(Base):
@@ -33,15 +39,26 @@ class WorkoutSession(Base):
     __tablename__ = "workout_sessions"
     
     id = Column(Integer, primary_key=True, index=True)
-    date = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Set client-side as well so the full-precision value is known after flush
+    date = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        nullable=False
+    )
     title = Column(String, nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     is_completed = Column(Boolean, default=False, nullable=False)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     user = relationship("User", back_populates="workouts")
-    exercises = relationship("Exercise", back_populates="session", cascade="all, delete-orphan")
+    exercises = relationship("Exercise", back_populates="session", cascade="all, delete-orphan", passive_deletes=True)
+    
+    __table_args__ = (
+        # A user's workouts newest first, matching the keyset pagination order
+        Index("ix_workout_sessions_user_id_date_id", user_id, date.desc(), id.desc()),
+    )
 
 
 class Exercise(Base):
@@ -50,13 +67,50 @@ class Exercise(Base):
     __tablename__ = "exercises"
     
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False)
-    session_id = Column(Integer, ForeignKey("workout_sessions.id"), nullable=False)
+    name = Column(String, nullable=False)  # As entered by the user
+    session_id = Column(Integer, ForeignKey("workout_sessions.id", ondelete="CASCADE"), nullable=False)
+    catalog_id = Column(Integer, ForeignKey("exercise_catalog.id"), nullable=True)
     is_completed = Column(Boolean, default=False, nullable=False)
     
     # Relationships
     session = relationship("WorkoutSession", back_populates="exercises")
-    sets = relationship("WorkoutSet", back_populates="exercise", cascade="all, delete-orphan")
+    catalog = relationship("ExerciseCatalog")
+    sets = relationship("WorkoutSet", back_populates="exercise", cascade="all, delete-orphan", passive_deletes=True)
+    
+    __table_args__ = (
+        # Loading a workout's exercises, and the session foreign key
+        Index("ix_exercises_session_id_catalog_id", "session_id", "catalog_id"),
+        # One exercise's history: find the sessions it appears in, then keep
+        # the user's through ix_workout_sessions_user_id_date_id
+        Index("ix_exercises_catalog_id_session_id", "catalog_id", "session_id"),
+    )
+
+
+class ExerciseCatalog(Base):
+    """Canonical exercise shared by every entry that refers to the same movement"""
+    
+    __tablename__ = "exercise_catalog"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)  # Canonical display name
+    normalized_name = Column(String, unique=True, index=True, nullable=False)
+    muscle_group = Column(String, nullable=True)  # Chest, Back, Legs, etc.
+    
+    # Relationships
+    aliases = relationship("ExerciseAlias", back_populates="catalog", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class ExerciseAlias(Base):
+    """Normalized spelling that resolves to a catalog exercise"""
+    
+    __tablename__ = "exercise_aliases"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    alias = Column(String, unique=True, index=True, nullable=False)  # Normalized
+    catalog_id = Column(Integer, ForeignKey("exercise_catalog.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    # Relationships
+    catalog = relationship("ExerciseCatalog", back_populates="aliases")
 
 
 class WorkoutSet(Base):
@@ -67,7 +121,7 @@ class WorkoutSet(Base):
     id = Column(Integer, primary_key=True, index=True)
     reps = Column(Integer, nullable=False)
     weight = Column(Float, nullable=False)
-    exercise_id = Column(Integer, ForeignKey("exercises.id"), nullable=False)
+    exercise_id = Column(Integer, ForeignKey("exercises.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Relationships
     exercise = relationship("Exercise", back_populates="sets")
@@ -83,10 +137,15 @@ class SleepLog(Base):
     hours = Column(Float, nullable=False)
     quality = Column(Integer, nullable=False)  # 1-5 rating
     notes = Column(Text, nullable=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="sleep_logs")
+    
+    __table_args__ = (
+        # One log per user and day; also serves the newest-first list queries
+        Index("uq_sleep_logs_user_id_date", user_id, date, unique=True),
+    )
 
 
 class NutritionLog(Base):
@@ -102,7 +161,96 @@ class NutritionLog(Base):
     fats = Column(Float, nullable=True)
     water = Column(Float, nullable=True)  # in liters
     notes = Column(Text, nullable=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="nutrition_logs")
+    
+    __table_args__ = (
+        # One log per user and day; also serves the newest-first list queries
+        Index("uq_nutrition_logs_user_id_date", user_id, date, unique=True),
+    )
+
+
+class UserDailyStats(Base):
+    """Per-user, per-day training totals maintained on every workout write"""
+    
+    __tablename__ = "user_daily_stats"
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)  # UTC date of the workout
+    workouts = Column(Integer, default=0, nullable=False)
+    completed_workouts = Column(Integer, default=0, nullable=False)
+    exercises = Column(Integer, default=0, nullable=False)
+    sets = Column(Integer, default=0, nullable=False)
+    reps = Column(Integer, default=0, nullable=False)
+    volume = Column(Float, default=0.0, nullable=False)  # sum of reps * weight, in kg
+    
+    # Relationships
+    user = relationship("User", back_populates="daily_stats")
+
+
+class PersonalRecord(Base):
+    """Best lifts per user and exercise, maintained when sets are written"""
+    
+    __tablename__ = "personal_records"
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    exercise_name = Column(String, primary_key=True)
+    max_weight = Column(Float, nullable=False)  # heaviest set, in kg
+    max_weight_reps = Column(Integer, nullable=False)  # most reps done at max_weight
+    best_e1rm = Column(Float, nullable=False)  # best estimated one-rep max (Epley)
+    best_volume = Column(Float, nullable=False)  # best reps * weight total for one exercise entry
+    
+    # Relationships
+    user = relationship("User", back_populates="personal_records")
+
+
+class RefreshToken(Base):
+    """Refresh token, stored hashed; each use rotates it within its family"""
+    
+    __tablename__ = "refresh_tokens"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_hash = Column(String, unique=True, index=True, nullable=False)  # SHA-256 of the token
+    family_id = Column(String, index=True, nullable=False)  # shared by all rotations of one login
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)  # set when rotated or revoked
+    
+    # Relationships
+    user = relationship("User", back_populates="refresh_tokens")
+
+
+class RevokedToken(Base):
+    """Access token revoked before expiry (e.g. on logout), by JWT ID"""
+    
+    __tablename__ = "revoked_tokens"
+    
+    jti = Column(String, primary_key=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # row can be purged after this
+
+
+class RevokedTokenVersion(Base):
+    """Cutoff revoking a user's access tokens issued below a token version"""
+    
+    __tablename__ = "revoked_token_versions"
+    
+    user_id = Column(Integer, primary_key=True)  # No foreign key: must outlive deleted users
+    min_version = Column(Integer, nullable=False)  # Tokens with a lower ver claim are rejected
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # older tokens have expired by then
+
+
+class AccountDeletionJob(Base):
+    """Background purge of a deleted account's data, kept after the user row is gone"""
+    
+    __tablename__ = "account_deletion_jobs"
+    
+    id = Column(String, primary_key=True)  # Random; doubles as the handle for polling progress
+    user_id = Column(Integer, nullable=False, index=True)  # No foreign key: the user row is deleted last
+    status = Column(String, nullable=False, default="pending")  # pending, running, completed, failed
+    rows_deleted = Column(Integer, default=0, nullable=False)  # Rows removed so far, across all tables
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
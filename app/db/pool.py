@@ -0,0 +1,86 @@
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetricsMixin:
+    """
+    Collects checkout and connect timings for a queue pool.
+
+    Checkout time covers everything Pool.connect() does before handing
+    out a connection: waiting for a free one, opening a new one and the
+    pre-ping. Connect time covers opening new database connections only,
+    so checkout time minus connect time approximates time spent waiting.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self._checkouts = 0
+        self._checkout_seconds = 0.0
+        self._max_checkout_seconds = 0.0
+        self._timeouts = 0
+        self._connects = 0
+        self._connect_seconds = 0.0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self._timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._metrics_lock:
+                self._checkouts += 1
+                self._checkout_seconds += elapsed
+                self._max_checkout_seconds = max(self._max_checkout_seconds, elapsed)
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            with self._metrics_lock:
+                self._connects += 1
+                self._connect_seconds += time.perf_counter() - start
+
+    def metrics(self) -> dict:
+        """
+        Get the pool's current state and cumulative timings.
+
+        Returns:
+            Dictionary with pool size and overflow limits, connections
+            checked out / idle / in overflow, and checkout and connect
+            counts with total, mean and max latencies in milliseconds
+        """
+        with self._metrics_lock:
+            checkouts = self._checkouts
+            return {
+                "pool_size": self.size(),
+                "max_overflow": self._max_overflow,
+                "timeout": self._timeout,
+                "checked_out": self.checkedout(),
+                "idle": self.checkedin(),
+                # Negative while the pool has not yet opened pool_size connections
+                "overflow": max(self.overflow(), 0),
+                "checkouts": checkouts,
+                "checkout_timeouts": self._timeouts,
+                "checkout_ms_total": round(self._checkout_seconds * 1000, 3),
+                "checkout_ms_mean": round(self._checkout_seconds * 1000 / checkouts, 3) if checkouts else 0.0,
+                "checkout_ms_max": round(self._max_checkout_seconds * 1000, 3),
+                "connects": self._connects,
+                "connect_ms_total": round(self._connect_seconds * 1000, 3),
+            }
+
+
+class InstrumentedQueuePool(PoolMetricsMixin, QueuePool):
+    """QueuePool reporting metrics() for the sync engine."""
+
+
+class InstrumentedAsyncQueuePool(PoolMetricsMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool reporting metrics() for the async engine."""
@@ -1,10 +1,18 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from app.api.deps import require_metrics_token
 from app.core.config import settings
+from app.core.password_pool import PasswordHashingBusy
+from app.db.async_database import get_async_engine
 from app.db.database import engine
 from app.db.models import Base
-from app.api.routers import auth, users, workouts, tracking
+from app.api.routers import auth, users, workouts, tracking, analytics, dashboard
+from app.services.auth import password_pool, user_cache
+from app.services.hashers import get_hasher
+from app.services.pagination import NEXT_CURSOR_HEADER
 import os
 
 
@@ -12,8 +20,20 @@ import os
 if os.getenv("TESTING") != "1":
     Base.metadata.create_all(bind=engine)
 
+# Fail at startup rather than on every login if PASSWORD_HASHER is unknown
+get_hasher()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Stop the password hashing worker processes when the server shuts down"""
+    yield
+    password_pool.shutdown()
+
+
 # Initialize FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     title=settings.APP_NAME,
     description=settings.DESCRIPTION,
     version=settings.VERSION,
@@ -28,13 +48,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    """Shed authentication load instead of queueing it when hashing is saturated"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Too many authentication requests, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(workouts.router)
 app.include_router(tracking.router, prefix="/api/tracking", tags=["tracking"])
+app.include_router(analytics.router)
+app.include_router(dashboard.router)
 
 
 @app.get("/")
@@ -53,6 +85,19 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    """In-process cache, worker pool and connection pool metrics (requires METRICS_TOKEN)"""
+    result = {
+        "user_cache": user_cache.stats(),
+        "password_pool": password_pool.stats(),
+        "db_pool": engine.pool.metrics(),
+    }
+    if settings.DB_ASYNC:
+        result["async_db_pool"] = get_async_engine().pool.metrics()
+    return result
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,71 @@
+"""Add composite indexes for the per-user list queries and foreign keys
+
+Creates, without locking writes (CREATE INDEX CONCURRENTLY on Postgres):
+- workout_sessions, sleep_logs, nutrition_logs (user_id, date DESC, id DESC),
+  matching the keyset pagination order of the list endpoints
+- workout_sets (exercise_id), used when loading and deleting an exercise's sets
+- exercises (catalog_id, session_id), used to find every workout containing
+  one exercise for its history and progression
+
+exercises.session_id is already the leading column of
+ix_exercises_session_id_catalog_id, so it needs no index of its own.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+
+
+# (index name, table, column list)
+INDEXES = [
+    ("ix_workout_sessions_user_id_date_id", "workout_sessions", "user_id, date DESC, id DESC"),
+    ("ix_sleep_logs_user_id_date_id", "sleep_logs", "user_id, date DESC, id DESC"),
+    ("ix_nutrition_logs_user_id_date_id", "nutrition_logs", "user_id, date DESC, id DESC"),
+    ("ix_workout_sets_exercise_id", "workout_sets", "exercise_id"),
+    ("ix_exercises_catalog_id_session_id", "exercises", "catalog_id, session_id"),
+]
+
+
+def _drop_if_invalid(conn, name):
+    """Drop an index left invalid by an interrupted concurrent build"""
+    invalid = conn.execute(text(
+        "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE c.relname = :name AND NOT i.indisvalid"
+    ), {"name": name}).first()
+    if invalid:
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+        print(f"  Dropped invalid index {name} from an earlier attempt")
+
+
+def upgrade():
+    """Create the composite and foreign key indexes"""
+    # CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        postgres = conn.dialect.name == "postgresql"
+        for name, table, columns in INDEXES:
+            if postgres:
+                _drop_if_invalid(conn, name)
+                conn.execute(text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})"
+                ))
+            else:
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+            print(f"✓ Created {name} index")
+
+
+def downgrade():
+    """Drop the composite and foreign key indexes"""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        concurrently = "CONCURRENTLY " if conn.dialect.name == "postgresql" else ""
+        for name, _, _ in INDEXES:
+            conn.execute(text(f"DROP INDEX {concurrently}IF EXISTS {name}"))
+        print("✓ Removed access path indexes")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add access path indexes...")
+    upgrade()
+    print("Migration complete!")
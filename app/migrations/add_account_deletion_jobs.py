@@ -0,0 +1,43 @@
+"""Add background account deletion
+
+Adds users.deletion_requested_at, set while a deleted account's data is
+being purged, and the account_deletion_jobs table tracking each purge
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+from app.db.models import Base, AccountDeletionJob
+
+
+def upgrade():
+    """Add deletion_requested_at column and account_deletion_jobs table"""
+    with engine.connect() as conn:
+        try:
+            conn.execute(text(
+                "ALTER TABLE users ADD COLUMN deletion_requested_at TIMESTAMP WITH TIME ZONE"
+            ))
+            conn.commit()
+            print("✓ Added deletion_requested_at column to users")
+        except Exception as e:
+            print(f"deletion_requested_at column may already exist in users: {e}")
+
+    Base.metadata.create_all(bind=engine, tables=[AccountDeletionJob.__table__])
+    print("✓ Created account_deletion_jobs table")
+
+
+def downgrade():
+    """Remove deletion_requested_at column and account_deletion_jobs table"""
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS account_deletion_jobs"))
+        conn.execute(text("ALTER TABLE users DROP COLUMN deletion_requested_at"))
+        print("✓ Removed account deletion tables")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add account deletion jobs...")
+    upgrade()
+    print("Migration complete!")
@@ -0,0 +1,75 @@
+"""Add ON DELETE CASCADE to the foreign keys of user-owned data
+
+Deleting a user, workout or exercise now removes dependent rows in the
+database instead of the ORM loading and deleting them one at a time (the
+relationships use passive_deletes). Each constraint is re-added NOT VALID
+and validated separately, so existing rows are checked without blocking
+writes for the whole scan.
+
+Postgres only: SQLite cannot alter constraints, so recreate SQLite
+databases from the models instead.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+
+
+# (table, column, referenced table)
+FOREIGN_KEYS = [
+    ("workout_sessions", "user_id", "users"),
+    ("exercises", "session_id", "workout_sessions"),
+    ("workout_sets", "exercise_id", "exercises"),
+    ("exercise_aliases", "catalog_id", "exercise_catalog"),
+    ("sleep_logs", "user_id", "users"),
+    ("nutrition_logs", "user_id", "users"),
+    ("user_daily_stats", "user_id", "users"),
+    ("personal_records", "user_id", "users"),
+    ("refresh_tokens", "user_id", "users"),
+]
+
+
+def _constraint_name(conn, table, column):
+    """Find the name of the foreign key constraint on a single column"""
+    return conn.execute(text(
+        "SELECT c.conname FROM pg_constraint c "
+        "JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = ANY(c.conkey) "
+        "WHERE c.contype = 'f' AND c.conrelid = CAST(:table AS regclass) AND a.attname = :column"
+    ), {"table": table, "column": column}).scalar()
+
+
+def _replace_foreign_keys(on_delete):
+    with engine.connect() as conn:
+        if conn.dialect.name != "postgresql":
+            print(f"  Skipped: {conn.dialect.name} cannot alter foreign keys")
+            return
+        for table, column, referenced in FOREIGN_KEYS:
+            name = _constraint_name(conn, table, column) or f"{table}_{column}_fkey"
+            conn.execute(text(
+                f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}, "
+                f"ADD CONSTRAINT {name} FOREIGN KEY ({column}) "
+                f"REFERENCES {referenced} (id) {on_delete} NOT VALID"
+            ))
+            conn.commit()
+            conn.execute(text(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}"))
+            conn.commit()
+            print(f"✓ Updated {name}")
+
+
+def upgrade():
+    """Make the foreign keys cascade on delete"""
+    _replace_foreign_keys("ON DELETE CASCADE")
+
+
+def downgrade():
+    """Restore the foreign keys without cascades"""
+    _replace_foreign_keys("")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add cascade deletes...")
+    upgrade()
+    print("Migration complete!")
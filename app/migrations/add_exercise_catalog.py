@@ -0,0 +1,83 @@
+"""
+Migration: Add the exercise catalog and link existing exercises to it
+
+Creates exercise_catalog and exercise_aliases, adds exercises.catalog_id
+with its composite index, backfills catalog entries from the distinct
+exercise names already stored, and rebuilds personal records so they are
+keyed by canonical names.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import inspect, text
+from app.db.database import engine, SessionLocal
+from app.db.models import Base, ExerciseCatalog, ExerciseAlias
+from app.services.catalog import resolve_exercises
+from app.services.records import rebuild_personal_records
+
+
+def upgrade():
+    """Add the exercise catalog and backfill exercises.catalog_id"""
+    print("Running migration: add_exercise_catalog")
+
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[ExerciseCatalog.__table__, ExerciseAlias.__table__]
+    )
+    print("✓ Created exercise_catalog and exercise_aliases tables")
+
+    # Check first rather than catching the error: on Postgres a failed
+    # statement aborts the rest of its transaction
+    columns = {column["name"] for column in inspect(engine).get_columns("exercises")}
+    if "catalog_id" in columns:
+        print("  catalog_id column already exists")
+    else:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE exercises ADD COLUMN catalog_id INTEGER REFERENCES exercise_catalog(id)"
+            ))
+        print("✓ Added catalog_id column to exercises")
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_exercises_session_id_catalog_id "
+            "ON exercises (session_id, catalog_id)"
+        ))
+        print("✓ Created ix_exercises_session_id_catalog_id index")
+
+    db = SessionLocal()
+    try:
+        names = [name for (name,) in db.execute(text(
+            "SELECT DISTINCT name FROM exercises WHERE catalog_id IS NULL"
+        ))]
+        catalog = resolve_exercises(db, names)
+        for name, (catalog_id, _) in catalog.items():
+            db.execute(
+                text("UPDATE exercises SET catalog_id = :catalog_id WHERE name = :name AND catalog_id IS NULL"),
+                {"catalog_id": catalog_id, "name": name}
+            )
+        db.commit()
+        print(f"✓ Linked {len(names)} distinct exercise names to {len(set(catalog.values()))} catalog entries")
+
+        records = rebuild_personal_records(db)
+        print(f"✓ Rebuilt {records} personal records")
+    finally:
+        db.close()
+
+    print("Migration completed: add_exercise_catalog")
+
+
+def downgrade():
+    """Remove the exercise catalog"""
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ix_exercises_session_id_catalog_id"))
+        conn.execute(text("ALTER TABLE exercises DROP COLUMN catalog_id"))
+        conn.execute(text("DROP TABLE exercise_aliases"))
+        conn.execute(text("DROP TABLE exercise_catalog"))
+        print("✓ Removed exercise catalog")
+
+
+if __name__ == "__main__":
+    upgrade()
@@ -0,0 +1,36 @@
+"""Add refresh token tables
+
+Creates refresh_tokens (hashed, rotated refresh tokens) and revoked_tokens
+(access tokens revoked before expiry, by jti)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+from app.db.models import Base, RefreshToken, RevokedToken
+
+
+def upgrade():
+    """Create refresh_tokens and revoked_tokens tables"""
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[RefreshToken.__table__, RevokedToken.__table__]
+    )
+    print("✓ Created refresh_tokens and revoked_tokens tables")
+
+
+def downgrade():
+    """Drop refresh_tokens and revoked_tokens tables"""
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS refresh_tokens"))
+        conn.execute(text("DROP TABLE IF EXISTS revoked_tokens"))
+        print("✓ Removed refresh token tables")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add refresh token tables...")
+    upgrade()
+    print("Migration complete!")
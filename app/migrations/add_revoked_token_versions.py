@@ -0,0 +1,33 @@
+"""Add per-user token version cutoffs
+
+Creates revoked_token_versions, recording the minimum token version a
+user's access tokens must carry after a password change or account
+deletion, so endpoints that trust token claims reject older tokens
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+from app.db.models import Base, RevokedTokenVersion
+
+
+def upgrade():
+    """Create revoked_token_versions table"""
+    Base.metadata.create_all(bind=engine, tables=[RevokedTokenVersion.__table__])
+    print("✓ Created revoked_token_versions table")
+
+
+def downgrade():
+    """Drop revoked_token_versions table"""
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS revoked_token_versions"))
+        print("✓ Removed revoked_token_versions table")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add per-user token version cutoffs...")
+    upgrade()
+    print("Migration complete!")
@@ -0,0 +1,58 @@
+"""Make sleep and nutrition logs unique per user and day
+
+Removes duplicate days left by concurrent submits (keeping the newest row),
+then builds unique (user_id, date) indexes, which the by-date upserts use as
+their ON CONFLICT target. They replace the (user_id, date DESC, id DESC)
+list indexes, since ids no longer break ties within a user's day.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+
+
+TABLES = ["sleep_logs", "nutrition_logs"]
+
+
+def upgrade():
+    """Deduplicate days and create the unique indexes"""
+    with engine.begin() as conn:
+        for table in TABLES:
+            result = conn.execute(text(
+                f"DELETE FROM {table} WHERE id NOT IN "
+                f"(SELECT MAX(id) FROM {table} GROUP BY user_id, date)"
+            ))
+            print(f"✓ Removed {result.rowcount} duplicate {table} rows")
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        concurrently = "CONCURRENTLY " if conn.dialect.name == "postgresql" else ""
+        for table in TABLES:
+            conn.execute(text(
+                f"CREATE UNIQUE INDEX {concurrently}IF NOT EXISTS uq_{table}_user_id_date "
+                f"ON {table} (user_id, date)"
+            ))
+            conn.execute(text(f"DROP INDEX {concurrently}IF EXISTS ix_{table}_user_id_date_id"))
+            print(f"✓ Created uq_{table}_user_id_date index")
+
+
+def downgrade():
+    """Restore the non-unique list indexes"""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        concurrently = "CONCURRENTLY " if conn.dialect.name == "postgresql" else ""
+        for table in TABLES:
+            conn.execute(text(
+                f"CREATE INDEX {concurrently}IF NOT EXISTS ix_{table}_user_id_date_id "
+                f"ON {table} (user_id, date DESC, id DESC)"
+            ))
+            conn.execute(text(f"DROP INDEX {concurrently}IF EXISTS uq_{table}_user_id_date"))
+        print("✓ Removed unique date indexes")
+
+
+if __name__ == "__main__":
+    print("Running migration: Make tracking logs unique per day...")
+    upgrade()
+    print("Migration complete!")
@@ -0,0 +1,39 @@
+"""Add token version column
+
+Adds token_version to users so issued access tokens can be revoked by
+bumping it (tokens carry the version in their "ver" claim)
+"""
+
+from sqlalchemy import text
+from app.db.database import engine
+
+
+def upgrade():
+    """Add token_version column"""
+    with engine.connect() as conn:
+        try:
+            conn.execute(text("""
+                ALTER TABLE users 
+                ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0
+            """))
+            conn.commit()
+            print("✓ Added token_version column to users")
+        except Exception as e:
+            print(f"token_version column may already exist in users: {e}")
+
+
+def downgrade():
+    """Remove token_version column"""
+    with engine.connect() as conn:
+        try:
+            conn.execute(text("ALTER TABLE users DROP COLUMN token_version"))
+            conn.commit()
+            print("✓ Removed token_version column")
+        except Exception as e:
+            print(f"Error removing column: {e}")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add token version column...")
+    upgrade()
+    print("Migration complete!")
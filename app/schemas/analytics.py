@@ -0,0 +1,62 @@
+from datetime import datetime
+from pydantic import BaseModel
+from typing import List, Literal
+
+
+# Time windows accepted by the analytics endpoints
+TimeRange = Literal["day", "week", "month", "all"]
+
+# Series used to choose which points survive downsampling
+ProgressionMetric = Literal["estimated_1rm", "top_set_weight", "volume"]
+
+
+class AnalyticsSummary(BaseModel):
+    """Schema for aggregated workout statistics over a time range"""
+    range: TimeRange
+    total_workouts: int = 0
+    completed_workouts: int = 0
+    in_progress_workouts: int = 0
+    completion_rate: float = 0.0  # percentage
+    total_exercises: int = 0
+    total_sets: int = 0
+    total_reps: int = 0
+    total_volume: float = 0.0  # kg
+    avg_exercises_per_workout: float = 0.0
+    avg_volume_per_workout: float = 0.0  # kg, per completed workout
+    completed_last_7_days: int = 0
+
+
+class PersonalRecord(BaseModel):
+    """Schema for a user's best lifts on one exercise"""
+    exercise_name: str
+    max_weight: float  # kg
+    max_weight_reps: int
+    best_e1rm: float  # estimated one-rep max, kg
+    best_volume: float  # best reps * weight total for one exercise entry, kg
+    
+    class Config:
+        from_attributes = True
+
+
+class ProgressionPoint(BaseModel):
+    """Schema for one workout's performance on an exercise"""
+    workout_id: int
+    date: datetime
+    top_set_weight: float  # kg
+    volume: float  # reps * weight over the exercise's sets, kg
+    estimated_1rm: float  # best Epley estimate among the sets, kg
+
+
+class ExerciseProgression(BaseModel):
+    """Schema for an exercise's progression over time"""
+    exercise_name: str
+    total_points: int  # points before downsampling
+    points: List[ProgressionPoint] = []
+
+
+class TrainingCalendar(BaseModel):
+    """Schema for a year of completed-workout counts and streaks"""
+    year: int
+    counts: List[int] = []  # completed workouts per day, index 0 is January 1st
+    current_streak: int  # consecutive active days ending today or yesterday
+    longest_streak: int
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import List
+
+from app.schemas.analytics import AnalyticsSummary
+from app.schemas.tracking import SleepLog, NutritionLog
+from app.schemas.users import User
+from app.schemas.workouts import WorkoutSessionList
+
+
+class Dashboard(BaseModel):
+    """Schema for everything the dashboard page shows, in one response"""
+    user: User
+    recent_workouts: List[WorkoutSessionList] = []
+    sleep_logs: List[SleepLog] = []  # last 7 days, newest first
+    nutrition_logs: List[NutritionLog] = []  # last 7 days, newest first
+    stats: AnalyticsSummary
@@ -3,13 +3,17 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
-class SleepLogBase(BaseModel):
-    date: date
+class SleepLogUpsert(BaseModel):
+    """Full sleep log for a day given in the URL"""
     hours: float = Field(ge=0, le=24, description="Hours of sleep")
     quality: int = Field(ge=1, le=5, description="Sleep quality rating 1-5")
     notes: Optional[str] = None
 
 
+class SleepLogBase(SleepLogUpsert):
+    date: date
+
+
 class SleepLogCreate(SleepLogBase):
     pass
 
@@ -28,8 +32,8 @@ class SleepLog(SleepLogBase):
         from_attributes = True
 
 
-class NutritionLogBase(BaseModel):
-    date: date
+class NutritionLogUpsert(BaseModel):
+    """Full nutrition log for a day given in the URL"""
     calories: int = Field(ge=0, description="Total calories consumed")
     protein: float = Field(ge=0, description="Protein in grams")
     carbs: Optional[float] = Field(None, ge=0, description="Carbohydrates in grams")
@@ -38,6 +42,10 @@ class NutritionLogBase(BaseModel):
     notes: Optional[str] = None
 
 
+class NutritionLogBase(NutritionLogUpsert):
+    date: date
+
+
 class NutritionLogCreate(NutritionLogBase):
     pass
 
@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
 
@@ -46,9 +47,42 @@ class User(UserInDB):
 class Token(BaseModel):
     """Schema for JWT token response"""
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: str = "bearer"
 
 
+class RefreshRequest(BaseModel):
+    """Schema for exchanging a refresh token for new tokens"""
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    """Schema for logging out (the refresh token is revoked too if given)"""
+    refresh_token: Optional[str] = None
+
+
 class TokenData(BaseModel):
     """Schema for data encoded in JWT token"""
     username: Optional[str] = None
+    user_id: Optional[int] = None
+    token_version: Optional[int] = None
+    jti: Optional[str] = None  # token ID, used for revocation
+    expires_at: Optional[datetime] = None
+
+
+class TokenUser(BaseModel):
+    """Schema for the identity carried by a verified access token"""
+    id: int
+    username: Optional[str] = None
+
+
+class AccountDeletionJob(BaseModel):
+    """Schema for the progress of an account deletion"""
+    id: str
+    status: str  # pending, running, completed, failed
+    rows_deleted: int
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
@@ -48,6 +48,7 @@ class Exercise(ExerciseBase):
     """Schema for exercise response"""
     id: int
     session_id: int
+    catalog_id: Optional[int] = None
     is_completed: bool = False
     sets: List[WorkoutSet] = []
     
@@ -92,6 +93,8 @@ class WorkoutSessionList(BaseModel):
     is_completed: bool = False
     completed_at: Optional[datetime] = None
     exercise_count: int = 0
+    set_count: int = 0
+    total_volume: float = 0.0
     
     class Config:
         from_attributes = True
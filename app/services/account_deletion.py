@@ -0,0 +1,159 @@
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.db.models import (
+    AccountDeletionJob, Exercise, NutritionLog, PersonalRecord, RefreshToken, SleepLog,
+    User, UserDailyStats, WorkoutSession, WorkoutSet,
+)
+from app.services.auth import invalidate_cached_user
+from app.services.tokens import revoke_user_access_tokens, revoke_user_refresh_tokens
+
+
+logger = logging.getLogger(__name__)
+
+
+def _workout_ids(user_id: int):
+    return select(WorkoutSession.id).where(WorkoutSession.user_id == user_id)
+
+
+def _exercise_ids(user_id: int):
+    return select(Exercise.id).where(Exercise.session_id.in_(_workout_ids(user_id)))
+
+
+# (model, column identifying a row, rows owned by a user), purged in order.
+# Sets and exercises are deleted before their workouts so no batch cascades
+# to an unbounded number of child rows.
+PURGE_ORDER = [
+    (WorkoutSet, WorkoutSet.id, lambda user_id: WorkoutSet.exercise_id.in_(_exercise_ids(user_id))),
+    (Exercise, Exercise.id, lambda user_id: Exercise.session_id.in_(_workout_ids(user_id))),
+    (WorkoutSession, WorkoutSession.id, lambda user_id: WorkoutSession.user_id == user_id),
+    (SleepLog, SleepLog.id, lambda user_id: SleepLog.user_id == user_id),
+    (NutritionLog, NutritionLog.id, lambda user_id: NutritionLog.user_id == user_id),
+    (UserDailyStats, UserDailyStats.day, lambda user_id: UserDailyStats.user_id == user_id),
+    (PersonalRecord, PersonalRecord.exercise_name, lambda user_id: PersonalRecord.user_id == user_id),
+    (RefreshToken, RefreshToken.id, lambda user_id: RefreshToken.user_id == user_id),
+]
+
+
+def request_account_deletion(db: Session, user: User) -> AccountDeletionJob:
+    """
+    Lock an account out immediately and queue the purge of its data.
+
+    Bumping the token version revokes every access token issued so far,
+    revoking refresh tokens ends all sessions, and deletion_requested_at
+    blocks logging in again while the purge runs.
+
+    Args:
+        db: Database session
+        user: User to delete
+
+    Returns:
+        Pending AccountDeletionJob to pass to purge_account
+    """
+    user.deletion_requested_at = datetime.now(timezone.utc)
+    revoke_user_access_tokens(db, user.id)
+    revoke_user_refresh_tokens(db, user.id)
+    job = AccountDeletionJob(id=uuid.uuid4().hex, user_id=user.id, status="pending")
+    db.add(job)
+    db.commit()
+    invalidate_cached_user(user.id)
+    db.refresh(job)
+    return job
+
+
+def get_account_deletion_job(db: Session, job_id: str) -> Optional[AccountDeletionJob]:
+    """
+    Get an account deletion job by ID.
+
+    Args:
+        db: Database session
+        job_id: Job ID
+
+    Returns:
+        AccountDeletionJob object if found, None otherwise
+    """
+    return db.get(AccountDeletionJob, job_id)
+
+
+def _delete_batch(db: Session, model, key, owned, batch_size: int) -> int:
+    """Delete up to batch_size of a user's rows from one table; returns rows deleted."""
+    batch = select(key).where(owned).limit(batch_size)
+    result = db.execute(
+        delete(model).where(owned, key.in_(batch)).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def purge_account(job_id: str, batch_size: Optional[int] = None) -> None:
+    """
+    Delete a user's data in bounded batches, then the user row.
+
+    Each batch is one DELETE ... WHERE key IN (SELECT ... LIMIT n) in its
+    own transaction, so no rows are loaded into memory, locks are held
+    briefly and progress is visible through the job while it runs. An
+    interrupted job can simply be run again. Uses its own session, so it
+    can run after the request that queued it has finished. A failure is
+    logged and recorded on the job rather than raised, since there is no
+    caller left to handle it.
+
+    Args:
+        job_id: AccountDeletionJob ID
+        batch_size: Rows per transaction (defaults to ACCOUNT_PURGE_BATCH_SIZE)
+    """
+    batch_size = batch_size or settings.ACCOUNT_PURGE_BATCH_SIZE
+    db = SessionLocal()
+    try:
+        job = db.get(AccountDeletionJob, job_id)
+        if job is None or job.status == "completed":
+            return
+        job.status = "running"
+        job.error = None
+        db.commit()
+
+        try:
+            for model, key, owned_by in PURGE_ORDER:
+                owned = owned_by(job.user_id)
+                while True:
+                    deleted = _delete_batch(db, model, key, owned, batch_size)
+                    job.rows_deleted += deleted
+                    db.commit()
+                    if deleted < batch_size:
+                        break
+
+            job.rows_deleted += db.execute(
+                delete(User).where(User.id == job.user_id)
+            ).rowcount
+            job.status = "completed"
+            job.finished_at = datetime.now(timezone.utc)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            job.status = "failed"
+            job.error = str(e)
+            db.commit()
+            logger.exception("Account deletion job %s failed", job_id)
+    finally:
+        db.close()
+
+
+def get_unfinished_account_deletion_jobs(db: Session) -> List[str]:
+    """
+    Get IDs of jobs that never completed (e.g. the process stopped mid-purge).
+
+    Args:
+        db: Database session
+
+    Returns:
+        Job IDs, oldest first
+    """
+    return list(db.scalars(
+        select(AccountDeletionJob.id).where(
+            AccountDeletionJob.status != "completed"
+        ).order_by(AccountDeletionJob.created_at)
+    ))
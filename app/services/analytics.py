@@ -0,0 +1,298 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.db.models import UserDailyStats, WorkoutSession, Exercise, WorkoutSet
+
+
+# Number of calendar days covered by each rolling time range, today included
+RANGE_DAYS = {
+    "week": 7,
+    "month": 30,
+}
+
+
+def get_range_start(time_range: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Get the start of a time range.
+
+    Args:
+        time_range: One of day, week, month or all
+        now: Reference time (defaults to the current UTC time)
+
+    Returns:
+        Start datetime of the range (midnight of the first day, so "week"
+        covers today and the six days before it), or None for all time
+    """
+    if time_range == "all":
+        return None
+
+    now = now or datetime.now(timezone.utc)
+    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if time_range == "day":
+        return start_of_day
+
+    return start_of_day - timedelta(days=RANGE_DAYS[time_range] - 1)
+
+
+def get_analytics_summary(db: Session, user_id: int, time_range: str = "all") -> dict:
+    """
+    Compute workout statistics for a user from the daily rollup.
+
+    Totals are summed over user_daily_stats rows (at most one per day), so
+    the cost depends on the length of the range, not on how many sets the
+    user has logged.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        time_range: One of day, week, month or all
+
+    Returns:
+        Dictionary matching the AnalyticsSummary schema
+    """
+    range_start = get_range_start(time_range)
+    week_start = get_range_start("week").date()
+
+    def range_sum(column, start=None):
+        """Sum a rollup column over rows on or after start (all rows if None)"""
+        if start is not None:
+            column = case((UserDailyStats.day >= start, column), else_=0)
+        return func.coalesce(func.sum(column), 0)
+
+    range_day = range_start.date() if range_start is not None else None
+    totals_query = db.query(
+        range_sum(UserDailyStats.workouts, range_day).label("total_workouts"),
+        range_sum(UserDailyStats.completed_workouts, range_day).label("completed_workouts"),
+        range_sum(UserDailyStats.exercises, range_day).label("total_exercises"),
+        range_sum(UserDailyStats.sets, range_day).label("total_sets"),
+        range_sum(UserDailyStats.reps, range_day).label("total_reps"),
+        range_sum(UserDailyStats.volume, range_day).label("total_volume"),
+        range_sum(UserDailyStats.completed_workouts, week_start).label("completed_last_7_days"),
+    ).filter(
+        UserDailyStats.user_id == user_id
+    )
+
+    if range_day is not None:
+        # Only scan the days needed by both the range and the 7-day count
+        totals_query = totals_query.filter(UserDailyStats.day >= min(range_day, week_start))
+
+    totals = totals_query.one()
+
+    total_workouts = int(totals.total_workouts)
+    completed_workouts = int(totals.completed_workouts)
+    total_exercises = int(totals.total_exercises)
+    total_volume = float(totals.total_volume)
+
+    return {
+        "range": time_range,
+        "total_workouts": total_workouts,
+        "completed_workouts": completed_workouts,
+        "in_progress_workouts": total_workouts - completed_workouts,
+        "completion_rate": round(completed_workouts / total_workouts * 100, 1) if total_workouts else 0.0,
+        "total_exercises": total_exercises,
+        "total_sets": int(totals.total_sets),
+        "total_reps": int(totals.total_reps),
+        "total_volume": total_volume,
+        "avg_exercises_per_workout": round(total_exercises / total_workouts, 1) if total_workouts else 0.0,
+        "avg_volume_per_workout": round(total_volume / completed_workouts, 1) if completed_workouts else 0.0,
+        "completed_last_7_days": int(totals.completed_last_7_days),
+    }
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """
+    Pick points to keep with the Largest-Triangle-Three-Buckets algorithm.
+
+    Keeps the first and last points and, for every bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves peaks and trends.
+
+    Args:
+        xs: X coordinates, in increasing order
+        ys: Y coordinates
+        threshold: Maximum number of points to keep
+
+    Returns:
+        Sorted indices of the points to keep
+    """
+    count = len(xs)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    bucket_size = (count - 2) / (threshold - 2)
+    indices = [0]
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        next_size = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / next_size
+        avg_y = sum(ys[next_start:next_end]) / next_size
+
+        best_area = -1.0
+        best_index = start
+        for index in range(start, end):
+            area = abs(
+                (xs[previous] - avg_x) * (ys[index] - ys[previous])
+                - (xs[previous] - xs[index]) * (avg_y - ys[previous])
+            )
+            if area > best_area:
+                best_area = area
+                best_index = index
+
+        indices.append(best_index)
+        previous = best_index
+
+    indices.append(count - 1)
+    return indices
+
+
+def get_exercise_progression(
+    db: Session,
+    user_id: int,
+    catalog_id: int,
+    max_points: int = 200,
+    metric: str = "estimated_1rm"
+) -> dict:
+    """
+    Compute per-workout performance on one exercise, downsampled.
+
+    Top set, volume and estimated 1RM are aggregated per workout in SQL;
+    long histories are then reduced with LTTB on the chosen metric so the
+    payload stays bounded.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        catalog_id: Catalog ID of the exercise
+        max_points: Maximum number of points to return
+        metric: Series used to choose the kept points
+
+    Returns:
+        Dictionary with total_points and points (ProgressionPoint fields)
+    """
+    estimated_1rm = case(
+        (WorkoutSet.reps <= 1, WorkoutSet.weight),
+        else_=WorkoutSet.weight * (1 + WorkoutSet.reps / 30.0)
+    )
+
+    rows = db.query(
+        WorkoutSession.id,
+        WorkoutSession.date,
+        func.max(WorkoutSet.weight),
+        func.sum(WorkoutSet.reps * WorkoutSet.weight),
+        func.max(estimated_1rm),
+    ).join(
+        Exercise, Exercise.session_id == WorkoutSession.id
+    ).join(
+        WorkoutSet, WorkoutSet.exercise_id == Exercise.id
+    ).filter(
+        WorkoutSession.user_id == user_id,
+        Exercise.catalog_id == catalog_id
+    ).group_by(
+        WorkoutSession.id, WorkoutSession.date
+    ).order_by(
+        WorkoutSession.date, WorkoutSession.id
+    ).all()
+
+    points = [
+        {
+            "workout_id": workout_id,
+            "date": workout_date,
+            "top_set_weight": float(top_set_weight),
+            "volume": float(volume),
+            "estimated_1rm": float(best_e1rm),
+        }
+        for workout_id, workout_date, top_set_weight, volume, best_e1rm in rows
+    ]
+
+    kept = lttb_indices(
+        [point["date"].timestamp() for point in points],
+        [point[metric] for point in points],
+        max_points
+    )
+
+    return {
+        "total_points": len(points),
+        "points": [points[index] for index in kept],
+    }
+
+
+def compute_streaks(days: Sequence[date], today: date) -> Tuple[int, int]:
+    """
+    Compute training streaks from active days.
+
+    The current streak may end yesterday, so it is not reset before the
+    user has trained today.
+
+    Args:
+        days: Distinct active days in increasing order
+        today: Reference day
+
+    Returns:
+        Tuple of (current streak, longest streak) in days
+    """
+    longest = 0
+    run = 0
+    previous = None
+    for day in days:
+        run = run + 1 if previous is not None and day - previous == timedelta(days=1) else 1
+        longest = max(longest, run)
+        previous = day
+
+    current = run if previous is not None and today - previous <= timedelta(days=1) else 0
+    return current, longest
+
+
+def get_training_calendar(
+    db: Session,
+    user_id: int,
+    year: int,
+    today: Optional[date] = None
+) -> dict:
+    """
+    Get completed-workout counts per day of a year and training streaks.
+
+    Counts come straight from the daily rollup, which completion changes
+    keep up to date, so only active days are read.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        year: Calendar year
+        today: Reference day for the current streak (defaults to today in UTC)
+
+    Returns:
+        Dictionary matching the TrainingCalendar schema
+    """
+    today = today or datetime.now(timezone.utc).date()
+    active_days = [
+        (day, completed) for day, completed in db.query(
+            UserDailyStats.day, UserDailyStats.completed_workouts
+        ).filter(
+            UserDailyStats.user_id == user_id,
+            UserDailyStats.completed_workouts > 0
+        ).order_by(UserDailyStats.day)
+    ]
+
+    start = date(year, 1, 1)
+    counts = [0] * (date(year + 1, 1, 1) - start).days
+    for day, completed in active_days:
+        if day.year == year:
+            counts[(day - start).days] = completed
+
+    current_streak, longest_streak = compute_streaks([day for day, _ in active_days], today)
+
+    return {
+        "year": year,
+        "counts": counts,
+        "current_streak": current_streak,
+        "longest_streak": longest_streak,
+    }
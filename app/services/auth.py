@@ -1,49 +1,48 @@
-import hashlib
-import os
-import base64
-from datetime import datetime, timedelta
-from typing import Optional
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Union
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.password_pool import PasswordHashingPool
+from app.db.async_database import run_service
 from app.db.models import User
 from app.schemas.users import TokenData
+from app.services.hashers import get_hasher, identify_hasher
+from app.services.tokens import revoke_user_access_tokens, revoke_user_refresh_tokens
+
+
+# Detached copies of recently authenticated users, keyed by user ID
+user_cache = TTLCache(settings.USER_CACHE_SIZE, settings.USER_CACHE_TTL_SECONDS)
+
+# Worker processes for password hashing from request handlers
+password_pool = PasswordHashingPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE)
 
 
-# PBKDF2-HMAC-SHA256 implementation (Django-style)
 def hash_password(password: str) -> str:
     """
-    Hash password using PBKDF2-HMAC-SHA256 (similar to Django's default hasher).
+    Hash password with the configured hasher (PBKDF2-HMAC-SHA256 by default).
     
     Args:
         password: Plain text password
         
     Returns:
-        Hashed password string in format: pbkdf2_sha256$iterations$salt$hash
+        Encoded hash string, e.g. pbkdf2_sha256$iterations$salt$hash
     """
-    iterations = 260000  # Django's default iterations for PBKDF2
-    salt = base64.b64encode(os.urandom(16)).decode('utf-8')
-    
-    # Compute hash using PBKDF2-HMAC-SHA256
-    pwd_hash = hashlib.pbkdf2_hmac(
-        'sha256',
-        password.encode('utf-8'),
-        salt.encode('utf-8'),
-        iterations
-    )
-    
-    # Encode hash to base64
-    hash_b64 = base64.b64encode(pwd_hash).decode('utf-8')
-    
-    # Return in Django format
-    return f"pbkdf2_sha256${iterations}${salt}${hash_b64}"
+    return get_hasher().encode(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash.
     
+    The hasher is picked from the hash's algorithm prefix, so hashes made
+    with other algorithms or parameters keep verifying.
+    
     Args:
         plain_password: Plain text password to verify
         hashed_password: Hashed password from database
@@ -52,27 +51,62 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         True if password matches, False otherwise
     """
     try:
-        # Parse the stored hash
-        algorithm, iterations, salt, stored_hash = hashed_password.split('$')
-        
-        if algorithm != 'pbkdf2_sha256':
-            return False
-        
-        # Compute hash of provided password
-        pwd_hash = hashlib.pbkdf2_hmac(
-            'sha256',
-            plain_password.encode('utf-8'),
-            salt.encode('utf-8'),
-            int(iterations)
+        return identify_hasher(hashed_password).verify(plain_password, hashed_password)
+    except (ValueError, AttributeError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash differs from the configured hasher and parameters.
+    
+    Args:
+        hashed_password: Hashed password from database
+        
+    Returns:
+        True if the hash should be replaced on the next successful login
+    """
+    hasher = get_hasher()
+    try:
+        return (
+            not hashed_password.startswith(hasher.algorithm + "$")
+            or hasher.needs_update(hashed_password)
         )
+    except (ValueError, AttributeError):
+        return True
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in the password hashing pool (see hash_password).
+    
+    Args:
+        password: Plain text password
         
-        # Encode to base64
-        hash_b64 = base64.b64encode(pwd_hash).decode('utf-8')
+    Returns:
+        Hashed password string
         
-        # Compare hashes (constant-time comparison)
-        return hash_b64 == stored_hash
-    except (ValueError, AttributeError):
-        return False
+    Raises:
+        PasswordHashingBusy: If the hashing queue is full
+    """
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the password hashing pool (see verify_password).
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password from database
+        
+    Returns:
+        True if password matches, False otherwise
+        
+    Raises:
+        PasswordHashingBusy: If the hashing queue is full
+    """
+    return await password_pool.run(verify_password, plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -99,6 +133,33 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def create_user_access_token(user: User, expires_delta: Optional[timedelta] = None) -> str:
+    """
+    Create a JWT access token identifying a user.
+    
+    Besides the username (sub), the token carries the numeric user ID (uid),
+    the user's token version (ver), so it survives username changes and
+    can be revoked by bumping User.token_version, and a unique ID (jti) so
+    it can be revoked on its own (see app.services.tokens).
+    
+    Args:
+        user: User the token is issued to
+        expires_delta: Optional expiration time delta
+        
+    Returns:
+        Encoded JWT token string
+    """
+    return create_access_token(
+        data={
+            "sub": user.username,
+            "uid": user.id,
+            "ver": user.token_version,
+            "jti": uuid.uuid4().hex,
+        },
+        expires_delta=expires_delta
+    )
+
+
 def decode_access_token(token: str) -> Optional[TokenData]:
     """
     Decode and validate a JWT access token.
@@ -112,19 +173,37 @@ def decode_access_token(token: str) -> Optional[TokenData]:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         username: str = payload.get("sub")
+        user_id = payload.get("uid")
         
-        if username is None:
+        if username is None and user_id is None:
             return None
         
-        return TokenData(username=username)
-    except JWTError:
+        expires = payload.get("exp")
+        return TokenData(
+            username=username,
+            user_id=user_id,
+            token_version=payload.get("ver"),
+            jti=payload.get("jti"),
+            expires_at=datetime.fromtimestamp(expires, tz=timezone.utc) if expires else None
+        )
+    except (JWTError, ValueError):
         return None
 
 
+def _store_password_hash(db: Session, user: User, hashed_password: str) -> None:
+    """Replace a verified user's hash after the hasher or its parameters changed."""
+    user.password = hashed_password
+    db.commit()
+    invalidate_cached_user(user.id)
+
+
 def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
     """
     Authenticate a user by username and password.
     
+    Stored hashes made with another hasher or other parameters are
+    replaced with the configured ones once the password has verified.
+    
     Args:
         db: Database session
         username: Username
@@ -135,12 +214,53 @@ def authenticate_user(db: Session, username: str, password: str) -> Optional[Use
     """
     user = db.query(User).filter(User.username == username).first()
     
-    if not user:
+    # Accounts being deleted can no longer log in
+    if not user or user.deletion_requested_at is not None:
         return None
     
     if not verify_password(password, user.password):
         return None
     
+    if password_needs_rehash(user.password):
+        _store_password_hash(db, user, hash_password(password))
+    
+    return user
+
+
+async def authenticate_user_async(
+    db: Union[AsyncSession, Session],
+    username: str,
+    password: str
+) -> Optional[User]:
+    """
+    Authenticate a user without blocking the event loop.
+    
+    Queries go through run_service and the password is verified in the
+    hashing pool. Like authenticate_user, outdated hashes are replaced
+    after verifying.
+    
+    Args:
+        db: Database session (AsyncSession or Session)
+        username: Username
+        password: Plain text password
+        
+    Returns:
+        User object if authentication successful, None otherwise
+        
+    Raises:
+        PasswordHashingBusy: If the hashing queue is full
+    """
+    user = await get_user_by_username_async(db, username)
+    
+    if not user or user.deletion_requested_at is not None:
+        return None
+    
+    if not await verify_password_async(password, user.password):
+        return None
+    
+    if password_needs_rehash(user.password):
+        await run_service(db, _store_password_hash, user, await hash_password_async(password))
+    
     return user
 
 
@@ -158,6 +278,97 @@ def get_user_by_username(db: Session, username: str) -> Optional[User]:
     return db.query(User).filter(User.username == username).first()
 
 
+def _detached_copy(user: User) -> User:
+    """Copy a user's column values into a detached instance safe to share."""
+    copy = User(**{
+        attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs
+    })
+    make_transient_to_detached(copy)
+    return copy
+
+
+def get_cached_user(
+    db: Session,
+    user_id: int,
+    min_token_version: Optional[int] = None
+) -> Optional[User]:
+    """
+    Get user by ID, serving repeat lookups from the user cache.
+    
+    Cache hits are merged into the session without a SELECT, so the
+    returned object can still be modified and committed by the caller.
+    A cached copy older than min_token_version was cached before another
+    process bumped the version, so it is reloaded from the database.
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        min_token_version: Token version the cached copy must have reached
+        
+    Returns:
+        User object attached to db if found, None otherwise
+    """
+    cached = user_cache.get(user_id)
+    if cached is not None and (
+        min_token_version is None or cached.token_version >= min_token_version
+    ):
+        return db.merge(cached, load=False)
+    
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is not None:
+        user_cache.set(user_id, _detached_copy(user))
+    return user
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drop a user from the user cache after the row changed or was deleted.
+    
+    Args:
+        user_id: User ID
+    """
+    user_cache.pop(user_id)
+
+
+def update_user(
+    db: Session,
+    user: User,
+    fields: dict,
+    hashed_password: Optional[str] = None
+) -> User:
+    """
+    Apply profile changes to a user and commit them.
+    
+    A new password revokes every access and refresh token issued so far.
+    
+    Args:
+        db: Database session the user is attached to
+        user: User to update
+        fields: Column values to set (uniqueness is checked by the caller)
+        hashed_password: New password hash, if the password changes
+        
+    Returns:
+        Updated User object
+    """
+    for field, value in fields.items():
+        setattr(user, field, value)
+    
+    if hashed_password is not None:
+        user.password = hashed_password
+        revoke_user_access_tokens(db, user.id)
+        revoke_user_refresh_tokens(db, user.id)
+    
+    db.commit()
+    invalidate_cached_user(user.id)
+    db.refresh(user)
+    return user
+
+
+async def get_user_by_username_async(db: Union[AsyncSession, Session], username: str) -> Optional[User]:
+    """Async variant of get_user_by_username."""
+    return await run_service(db, get_user_by_username, username)
+
+
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """
     Get user by email.
@@ -172,6 +383,26 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
 
+async def get_user_by_email_async(db: Union[AsyncSession, Session], email: str) -> Optional[User]:
+    """Async variant of get_user_by_email."""
+    return await run_service(db, get_user_by_email, email)
+
+
+def _add_user(db: Session, username: str, email: str, hashed_password: str) -> User:
+    """Insert a user with an already hashed password."""
+    db_user = User(
+        username=username,
+        email=email,
+        password=hashed_password
+    )
+    
+    db.add(db_user)
+    db.commit()
+    db.refresh(db_user)
+    
+    return db_user
+
+
 def create_user(db: Session, username: str, email: str, password: str) -> User:
     """
     Create a new user.
@@ -185,15 +416,32 @@ def create_user(db: Session, username: str, email: str, password: str) -> User:
     Returns:
         Created User object
     """
-    hashed_password = hash_password(password)
-    db_user = User(
-        username=username,
-        email=email,
-        password=hashed_password
-    )
+    return _add_user(db, username, email, hash_password(password))
+
+
+async def create_user_async(
+    db: Union[AsyncSession, Session],
+    username: str,
+    email: str,
+    password: str
+) -> User:
+    """
+    Create a new user without blocking the event loop.
     
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    The password is hashed in the hashing pool and the insert goes through
+    run_service.
     
-    return db_user
+    Args:
+        db: Database session (AsyncSession or Session)
+        username: Username
+        email: Email address
+        password: Plain text password
+        
+    Returns:
+        Created User object
+        
+    Raises:
+        PasswordHashingBusy: If the hashing queue is full
+    """
+    hashed_password = await hash_password_async(password)
+    return await run_service(db, _add_user, username, email, hashed_password)
@@ -0,0 +1,165 @@
+import re
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.database import insert_on_conflict
+from app.db.models import ExerciseCatalog, ExerciseAlias
+
+
+# Maximum number of spellings kept in the in-process resolution cache
+CACHE_MAX_SIZE = 10000
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Normalized spelling -> (catalog ID, canonical name)
+_cache: Dict[str, Tuple[int, str]] = {}
+_cache_lock = threading.Lock()
+
+
+def normalize_exercise_name(name: str) -> str:
+    """
+    Normalize an exercise name for matching.
+
+    Args:
+        name: Exercise name as entered
+
+    Returns:
+        Case-folded name with surrounding and repeated whitespace removed
+    """
+    return _WHITESPACE.sub(" ", name).strip().casefold()
+
+
+def clear_exercise_cache() -> None:
+    """Drop every cached name resolution (e.g. after the catalog was edited)."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _remember(key: str, entry: Tuple[int, str]) -> None:
+    with _cache_lock:
+        if len(_cache) >= CACHE_MAX_SIZE:
+            _cache.clear()
+        _cache[key] = entry
+
+
+def _lookup(db: Session, keys: Iterable[str]) -> Dict[str, Tuple[int, str]]:
+    """Resolve normalized spellings through the alias table in one query."""
+    rows = db.query(
+        ExerciseAlias.alias, ExerciseCatalog.id, ExerciseCatalog.name
+    ).join(
+        ExerciseCatalog, ExerciseAlias.catalog_id == ExerciseCatalog.id
+    ).filter(
+        ExerciseAlias.alias.in_(list(keys))
+    )
+    return {alias: (catalog_id, name) for alias, catalog_id, name in rows}
+
+
+def _create(db: Session, key: str, display_name: str) -> Tuple[int, str]:
+    """
+    Add a catalog entry for an unknown spelling.
+
+    Runs in a SAVEPOINT on the caller's connection, so creating an entry
+    never needs a second pooled connection, and uses ON CONFLICT so
+    concurrent requests creating the same exercise converge on one row.
+    The entry commits or rolls back with the caller's transaction.
+    """
+    try:
+        with db.begin_nested():
+            db.execute(
+                insert_on_conflict(db, ExerciseCatalog).values(
+                    name=display_name,
+                    normalized_name=key
+                ).on_conflict_do_nothing(index_elements=[ExerciseCatalog.normalized_name])
+            )
+            catalog_id = db.query(ExerciseCatalog.id).filter(
+                ExerciseCatalog.normalized_name == key
+            ).scalar()
+            db.execute(
+                insert_on_conflict(db, ExerciseAlias).values(
+                    alias=key,
+                    catalog_id=catalog_id
+                ).on_conflict_do_nothing(index_elements=[ExerciseAlias.alias])
+            )
+    except IntegrityError:
+        # Lost a race the conflict clauses do not cover; the rows exist now
+        pass
+    return _lookup(db, [key])[key]
+
+
+def resolve_exercises(db: Session, names: Iterable[str]) -> Dict[str, Tuple[int, str]]:
+    """
+    Resolve exercise names to catalog entries, creating unknown ones.
+
+    Cached spellings cost nothing; the rest are looked up with a single
+    query. Entries created here are only cached once a later lookup finds
+    them committed, since the caller's transaction may still roll back.
+
+    Args:
+        db: Database session
+        names: Exercise names as entered
+
+    Returns:
+        Dictionary mapping each name to (catalog ID, canonical name)
+    """
+    resolved = {}
+    pending = {}
+    for name in names:
+        key = normalize_exercise_name(name)
+        cached = _cache.get(key)
+        if cached is not None:
+            resolved[name] = cached
+        else:
+            pending.setdefault(key, []).append(name)
+
+    if not pending:
+        return resolved
+
+    found = _lookup(db, pending.keys())
+    for key, spellings in pending.items():
+        entry = found.get(key)
+        if entry is None:
+            entry = _create(db, key, _WHITESPACE.sub(" ", spellings[0]).strip())
+        else:
+            _remember(key, entry)
+        for name in spellings:
+            resolved[name] = entry
+
+    return resolved
+
+
+def resolve_exercise(db: Session, name: str) -> Tuple[int, str]:
+    """
+    Resolve a single exercise name (see resolve_exercises).
+
+    Args:
+        db: Database session
+        name: Exercise name as entered
+
+    Returns:
+        Tuple of (catalog ID, canonical name)
+    """
+    return resolve_exercises(db, [name])[name]
+
+
+def find_exercise(db: Session, name: str) -> Optional[Tuple[int, str]]:
+    """
+    Look up an exercise name without creating a catalog entry.
+
+    Args:
+        db: Database session
+        name: Exercise name or alias
+
+    Returns:
+        Tuple of (catalog ID, canonical name), or None if unknown
+    """
+    key = normalize_exercise_name(name)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    entry = _lookup(db, [key]).get(key)
+    if entry is not None:
+        _remember(key, entry)
+    return entry
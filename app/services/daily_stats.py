@@ -0,0 +1,181 @@
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Iterable, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.db.database import insert_on_conflict
+from app.db.models import UserDailyStats, WorkoutSession, Exercise, WorkoutSet
+
+
+# Counter columns of the rollup, in the order used by the rebuild query
+STAT_FIELDS = ("workouts", "completed_workouts", "exercises", "sets", "reps", "volume")
+
+
+def workout_day(workout_date: datetime) -> date:
+    """
+    Get the rollup day of a workout.
+
+    Args:
+        workout_date: WorkoutSession.date value
+
+    Returns:
+        UTC calendar date of the workout
+    """
+    if workout_date.tzinfo is not None:
+        workout_date = workout_date.astimezone(timezone.utc)
+    return workout_date.date()
+
+
+def set_totals(sets: Iterable) -> dict:
+    """
+    Sum set, rep and volume counters for a collection of sets.
+
+    Args:
+        sets: Objects exposing reps and weight (ORM rows or schemas)
+
+    Returns:
+        Dictionary with sets, reps and volume keys
+    """
+    totals = {"sets": 0, "reps": 0, "volume": 0.0}
+    for workout_set in sets:
+        totals["sets"] += 1
+        totals["reps"] += workout_set.reps
+        totals["volume"] += workout_set.reps * workout_set.weight
+    return totals
+
+
+def stored_set_totals(db: Session, *criteria) -> dict:
+    """
+    Sum set, rep and volume counters for stored sets in one aggregate query.
+
+    Args:
+        db: Database session
+        criteria: Filter expressions over Exercise/WorkoutSet
+
+    Returns:
+        Dictionary with sets, reps and volume keys
+    """
+    row = db.query(
+        func.count(WorkoutSet.id),
+        func.coalesce(func.sum(WorkoutSet.reps), 0),
+        func.coalesce(func.sum(WorkoutSet.reps * WorkoutSet.weight), 0.0),
+    ).join(
+        Exercise, WorkoutSet.exercise_id == Exercise.id
+    ).filter(*criteria).one()
+
+    return {"sets": row[0], "reps": int(row[1]), "volume": float(row[2])}
+
+
+def bump_daily_stats(
+    db: Session,
+    user_id: int,
+    day: date,
+    workouts: int = 0,
+    completed_workouts: int = 0,
+    exercises: int = 0,
+    sets: int = 0,
+    reps: int = 0,
+    volume: float = 0.0
+) -> None:
+    """
+    Add deltas to a user's rollup row for one day.
+
+    Runs as a single atomic upsert in the caller's transaction, so the
+    rollup commits or rolls back together with the write it describes.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        day: Rollup day (see workout_day)
+        workouts: Change in number of workouts
+        completed_workouts: Change in number of completed workouts
+        exercises: Change in number of exercises
+        sets: Change in number of sets
+        reps: Change in number of repetitions
+        volume: Change in volume (reps * weight)
+    """
+    deltas = {
+        "workouts": workouts,
+        "completed_workouts": completed_workouts,
+        "exercises": exercises,
+        "sets": sets,
+        "reps": reps,
+        "volume": volume,
+    }
+    if not any(deltas.values()):
+        return
+
+    stmt = insert_on_conflict(db, UserDailyStats).values(user_id=user_id, day=day, **deltas)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserDailyStats.user_id, UserDailyStats.day],
+        set_={
+            field: getattr(UserDailyStats, field) + getattr(stmt.excluded, field)
+            for field in STAT_FIELDS
+        }
+    )
+    db.execute(stmt)
+
+
+def rebuild_daily_stats(db: Session, user_id: Optional[int] = None) -> int:
+    """
+    Recompute the rollup from workout data (backfill or repair).
+
+    Aggregates are computed per workout in SQL and folded into days in
+    Python, so memory grows with the number of workouts, not sets.
+
+    Args:
+        db: Database session
+        user_id: Only rebuild this user's rows (all users if None)
+
+    Returns:
+        Number of rollup rows written
+    """
+    set_counts = db.query(
+        Exercise.session_id.label("session_id"),
+        func.count(WorkoutSet.id).label("sets"),
+        func.coalesce(func.sum(WorkoutSet.reps), 0).label("reps"),
+        func.coalesce(func.sum(WorkoutSet.reps * WorkoutSet.weight), 0.0).label("volume"),
+    ).outerjoin(
+        WorkoutSet, WorkoutSet.exercise_id == Exercise.id
+    ).group_by(Exercise.id).subquery()
+
+    query = db.query(
+        WorkoutSession.user_id,
+        WorkoutSession.date,
+        WorkoutSession.is_completed,
+        func.count(set_counts.c.session_id),
+        func.coalesce(func.sum(set_counts.c.sets), 0),
+        func.coalesce(func.sum(set_counts.c.reps), 0),
+        func.coalesce(func.sum(set_counts.c.volume), 0.0),
+    ).outerjoin(
+        set_counts, set_counts.c.session_id == WorkoutSession.id
+    ).group_by(WorkoutSession.id)
+
+    delete_query = db.query(UserDailyStats)
+    if user_id is not None:
+        query = query.filter(WorkoutSession.user_id == user_id)
+        delete_query = delete_query.filter(UserDailyStats.user_id == user_id)
+
+    days = defaultdict(lambda: dict.fromkeys(STAT_FIELDS, 0))
+    for owner_id, workout_date, is_completed, exercises, sets, reps, volume in query.yield_per(1000):
+        totals = days[(owner_id, workout_day(workout_date))]
+        totals["workouts"] += 1
+        totals["completed_workouts"] += 1 if is_completed else 0
+        totals["exercises"] += exercises
+        totals["sets"] += int(sets)
+        totals["reps"] += int(reps)
+        totals["volume"] += float(volume)
+
+    delete_query.delete(synchronize_session=False)
+    if days:
+        db.execute(
+            UserDailyStats.__table__.insert(),
+            [
+                {"user_id": owner_id, "day": day, **totals}
+                for (owner_id, day), totals in days.items()
+            ]
+        )
+    db.commit()
+
+    return len(days)
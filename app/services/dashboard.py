@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session
+
+from app.db.models import User, SleepLog, NutritionLog
+from app.services.analytics import get_analytics_summary
+from app.services.workouts import get_user_workout_summaries
+
+
+# Number of days of sleep and nutrition logs shown on the dashboard
+DASHBOARD_LOG_DAYS = 7
+
+
+def get_dashboard(
+    db: Session,
+    user: User,
+    workout_limit: int = 5,
+    time_range: str = "week"
+) -> dict:
+    """
+    Collect the dashboard data for a user with one database session.
+
+    Every part is a single indexed query (workout summaries are one grouped
+    query and the stats come from the daily rollup), so the whole page costs
+    four statements and one authentication instead of four requests.
+
+    Args:
+        db: Database session
+        user: Authenticated user
+        workout_limit: Number of recent workout summaries to include
+        time_range: Time range of the headline stats
+
+    Returns:
+        Dictionary matching the Dashboard schema
+    """
+    since = datetime.now(timezone.utc).date() - timedelta(days=DASHBOARD_LOG_DAYS - 1)
+
+    sleep_logs = db.query(SleepLog).filter(
+        SleepLog.user_id == user.id,
+        SleepLog.date >= since
+    ).order_by(SleepLog.date.desc()).all()
+
+    nutrition_logs = db.query(NutritionLog).filter(
+        NutritionLog.user_id == user.id,
+        NutritionLog.date >= since
+    ).order_by(NutritionLog.date.desc()).all()
+
+    return {
+        "user": user,
+        "recent_workouts": get_user_workout_summaries(db, user.id, limit=workout_limit),
+        "sleep_logs": sleep_logs,
+        "nutrition_logs": nutrition_logs,
+        "stats": get_analytics_summary(db, user.id, time_range),
+    }
@@ -0,0 +1,211 @@
+import base64
+import hashlib
+import hmac
+import os
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode('utf-8')
+
+
+def _new_salt() -> str:
+    return _b64(os.urandom(16))
+
+
+class PBKDF2SHA256Hasher:
+    """
+    PBKDF2-HMAC-SHA256 (Django-compatible).
+
+    Encoded format: pbkdf2_sha256$iterations$salt$hash
+    """
+
+    algorithm = "pbkdf2_sha256"
+
+    def __init__(self, iterations: int = 260000):
+        self.iterations = iterations
+
+    def _derive(self, password: str, salt: str, iterations: int) -> str:
+        return _b64(hashlib.pbkdf2_hmac(
+            'sha256',
+            password.encode('utf-8'),
+            salt.encode('utf-8'),
+            iterations
+        ))
+
+    def encode(self, password: str, salt: Optional[str] = None) -> str:
+        """
+        Hash a password with this hasher's parameters.
+
+        Args:
+            password: Plain text password
+            salt: Salt to use (random if None)
+
+        Returns:
+            Encoded hash string
+        """
+        salt = salt or _new_salt()
+        return f"{self.algorithm}${self.iterations}${salt}${self._derive(password, salt, self.iterations)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        """
+        Check a password against an encoded hash (with the hash's own parameters).
+
+        Args:
+            password: Plain text password
+            encoded: Encoded hash string
+
+        Returns:
+            True if the password matches
+        """
+        algorithm, iterations, salt, stored_hash = encoded.split('$')
+        if algorithm != self.algorithm:
+            return False
+        computed = self._derive(password, salt, int(iterations))
+        return hmac.compare_digest(computed.encode('utf-8'), stored_hash.encode('utf-8'))
+
+    def needs_update(self, encoded: str) -> bool:
+        """
+        Check whether an encoded hash uses different parameters.
+
+        Args:
+            encoded: Encoded hash string
+
+        Returns:
+            True if the hash should be recomputed with current parameters
+        """
+        return int(encoded.split('$')[1]) != self.iterations
+
+
+class ScryptHasher:
+    """
+    scrypt from the standard library (memory-hard).
+
+    Encoded format: scrypt$n$r$p$salt$hash
+    """
+
+    algorithm = "scrypt"
+
+    def __init__(self, n: int = 2 ** 14, r: int = 8, p: int = 1):
+        self.n = n
+        self.r = r
+        self.p = p
+
+    def _derive(self, password: str, salt: str, n: int, r: int, p: int) -> str:
+        return _b64(hashlib.scrypt(
+            password.encode('utf-8'),
+            salt=salt.encode('utf-8'),
+            n=n,
+            r=r,
+            p=p,
+            maxmem=256 * n * r,  # twice the 128 * n * r bytes scrypt needs
+            dklen=32
+        ))
+
+    def encode(self, password: str, salt: Optional[str] = None) -> str:
+        """
+        Hash a password with this hasher's parameters.
+
+        Args:
+            password: Plain text password
+            salt: Salt to use (random if None)
+
+        Returns:
+            Encoded hash string
+        """
+        salt = salt or _new_salt()
+        derived = self._derive(password, salt, self.n, self.r, self.p)
+        return f"{self.algorithm}${self.n}${self.r}${self.p}${salt}${derived}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        """
+        Check a password against an encoded hash (with the hash's own parameters).
+
+        Args:
+            password: Plain text password
+            encoded: Encoded hash string
+
+        Returns:
+            True if the password matches
+        """
+        algorithm, n, r, p, salt, stored_hash = encoded.split('$')
+        if algorithm != self.algorithm:
+            return False
+        computed = self._derive(password, salt, int(n), int(r), int(p))
+        return hmac.compare_digest(computed.encode('utf-8'), stored_hash.encode('utf-8'))
+
+    def needs_update(self, encoded: str) -> bool:
+        """
+        Check whether an encoded hash uses different parameters.
+
+        Args:
+            encoded: Encoded hash string
+
+        Returns:
+            True if the hash should be recomputed with current parameters
+        """
+        _, n, r, p, _, _ = encoded.split('$')
+        return (int(n), int(r), int(p)) != (self.n, self.r, self.p)
+
+
+# Hasher factories by the algorithm prefix of their encoded hashes; each
+# builds its hasher with this deployment's parameters from settings
+HASHERS: Dict[str, Callable[[], object]] = {
+    PBKDF2SHA256Hasher.algorithm: lambda: PBKDF2SHA256Hasher(
+        iterations=settings.PBKDF2_ITERATIONS
+    ),
+    ScryptHasher.algorithm: lambda: ScryptHasher(
+        n=settings.SCRYPT_N, r=settings.SCRYPT_R, p=settings.SCRYPT_P
+    ),
+}
+
+
+def register_hasher(algorithm: str, factory: Callable[[], object]) -> None:
+    """
+    Make a hasher available for hashing (via settings.PASSWORD_HASHER) and verifying.
+
+    Args:
+        algorithm: Algorithm prefix of the hasher's encoded hashes
+        factory: Callable returning a configured hasher instance, with
+            the same encode, verify and needs_update methods as the
+            built-in hashers
+    """
+    HASHERS[algorithm] = factory
+
+
+def get_hasher(algorithm: Optional[str] = None):
+    """
+    Get a hasher configured with this deployment's parameters.
+
+    Args:
+        algorithm: Hasher name (defaults to settings.PASSWORD_HASHER)
+
+    Returns:
+        Hasher instance
+
+    Raises:
+        ValueError: If the algorithm is unknown
+    """
+    algorithm = algorithm or settings.PASSWORD_HASHER
+    factory = HASHERS.get(algorithm)
+    if factory is None:
+        raise ValueError(f"Unknown password hasher: {algorithm}")
+    return factory()
+
+
+def identify_hasher(encoded: str):
+    """
+    Get the hasher that produced an encoded hash.
+
+    Args:
+        encoded: Encoded hash string
+
+    Returns:
+        Hasher instance
+
+    Raises:
+        ValueError: If the hash format is not recognized
+    """
+    return get_hasher(encoded.split('$', 1)[0])
@@ -0,0 +1,108 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy import Date, and_, or_
+from sqlalchemy.orm import Query
+
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(value, row_id: int) -> str:
+    """
+    Encode the position of a row into an opaque cursor.
+
+    Args:
+        value: Date or datetime the list is ordered by
+        row_id: Row ID used as a tie-breaker
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"d": value.isoformat(), "i": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (position datetime, row ID)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("utf-8")))
+        return datetime.fromisoformat(payload["d"]), int(payload["i"])
+    except (TypeError, KeyError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def paginate(
+    query: Query,
+    date_column,
+    id_column,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Tuple[datetime, int]] = None
+) -> Query:
+    """
+    Order a query newest first and apply offset or keyset pagination.
+
+    With a cursor, rows strictly after the cursor position in
+    (date desc, id desc) order are returned and skip is ignored, so
+    deep pages cost the same as the first one.
+
+    Args:
+        query: Query to paginate
+        date_column: Date or datetime column the list is ordered by
+        id_column: Primary key column used as a tie-breaker
+        skip: Number of records to skip (legacy offset mode)
+        limit: Maximum number of records to return
+        cursor: Decoded cursor from decode_cursor, if any
+
+    Returns:
+        Paginated query
+    """
+    query = query.order_by(date_column.desc(), id_column.desc())
+
+    if cursor is None:
+        return query.offset(skip).limit(limit)
+
+    last_value, last_id = cursor
+    if isinstance(date_column.type, Date):
+        last_value = last_value.date()
+
+    return query.filter(
+        or_(
+            date_column < last_value,
+            and_(date_column == last_value, id_column < last_id)
+        )
+    ).limit(limit)
+
+
+def next_cursor(rows: Sequence, limit: int) -> Optional[str]:
+    """
+    Build the cursor for the page following the given rows.
+
+    Args:
+        rows: Rows of the current page (must expose date and id)
+        limit: Page size that was requested
+
+    Returns:
+        Cursor string, or None if this was the last page
+    """
+    if not rows or len(rows) < limit:
+        return None
+
+    last = rows[-1]
+    return encode_cursor(last.date, last.id)
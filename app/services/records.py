@@ -0,0 +1,304 @@
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.db.database import insert_on_conflict
+from app.db.models import PersonalRecord, WorkoutSession, Exercise, ExerciseCatalog, WorkoutSet
+
+
+def estimated_1rm(weight: float, reps: int) -> float:
+    """
+    Estimate a one-rep max with the Epley formula.
+
+    Args:
+        weight: Weight lifted in kg
+        reps: Number of repetitions
+
+    Returns:
+        Estimated one-rep max in kg
+    """
+    if reps <= 1:
+        return weight
+    return weight * (1 + reps / 30)
+
+
+def summarize_sets(sets: Iterable) -> Optional[dict]:
+    """
+    Compute record candidates for the sets of one exercise entry.
+
+    Args:
+        sets: Objects exposing reps and weight
+
+    Returns:
+        Dictionary of record fields, or None if there are no sets
+    """
+    summary = None
+    for workout_set in sets:
+        e1rm = estimated_1rm(workout_set.weight, workout_set.reps)
+        volume = workout_set.reps * workout_set.weight
+        if summary is None:
+            summary = {
+                "max_weight": workout_set.weight,
+                "max_weight_reps": workout_set.reps,
+                "best_e1rm": e1rm,
+                "best_volume": volume,
+            }
+            continue
+        if workout_set.weight > summary["max_weight"]:
+            summary["max_weight"] = workout_set.weight
+            summary["max_weight_reps"] = workout_set.reps
+        elif workout_set.weight == summary["max_weight"]:
+            summary["max_weight_reps"] = max(summary["max_weight_reps"], workout_set.reps)
+        summary["best_e1rm"] = max(summary["best_e1rm"], e1rm)
+        summary["best_volume"] += volume
+    return summary
+
+
+def _merge_summaries(first: dict, second: dict) -> dict:
+    """Combine the record candidates of two entries of the same exercise."""
+    if second["max_weight"] > first["max_weight"]:
+        max_weight, max_weight_reps = second["max_weight"], second["max_weight_reps"]
+    elif second["max_weight"] == first["max_weight"]:
+        max_weight = first["max_weight"]
+        max_weight_reps = max(first["max_weight_reps"], second["max_weight_reps"])
+    else:
+        max_weight, max_weight_reps = first["max_weight"], first["max_weight_reps"]
+    return {
+        "max_weight": max_weight,
+        "max_weight_reps": max_weight_reps,
+        "best_e1rm": max(first["best_e1rm"], second["best_e1rm"]),
+        # Volume is per entry, so two entries compete rather than add up
+        "best_volume": max(first["best_volume"], second["best_volume"]),
+    }
+
+
+def record_entries(db: Session, user_id: int, entries: Iterable[Tuple[str, Iterable]]) -> None:
+    """
+    Merge newly written exercise entries into the user's records.
+
+    Runs as a single multi-row upsert that only ever raises stored values,
+    so it is safe under concurrent writes and needs no read of existing sets.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        entries: (canonical catalog name, new sets) per exercise entry; sets
+            are objects exposing reps and weight
+    """
+    summaries = {}
+    for exercise_name, sets in entries:
+        summary = summarize_sets(sets)
+        if summary is None:
+            continue
+        if exercise_name in summaries:
+            summary = _merge_summaries(summaries[exercise_name], summary)
+        summaries[exercise_name] = summary
+    if not summaries:
+        return
+
+    # One row per name: ON CONFLICT cannot update the same row twice
+    stmt = insert_on_conflict(db, PersonalRecord).values([
+        {"user_id": user_id, "exercise_name": exercise_name, **summary}
+        for exercise_name, summary in summaries.items()
+    ])
+    new = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PersonalRecord.user_id, PersonalRecord.exercise_name],
+        set_={
+            "max_weight": case(
+                (new.max_weight > PersonalRecord.max_weight, new.max_weight),
+                else_=PersonalRecord.max_weight
+            ),
+            "max_weight_reps": case(
+                (new.max_weight > PersonalRecord.max_weight, new.max_weight_reps),
+                (
+                    (new.max_weight == PersonalRecord.max_weight)
+                    & (new.max_weight_reps > PersonalRecord.max_weight_reps),
+                    new.max_weight_reps
+                ),
+                else_=PersonalRecord.max_weight_reps
+            ),
+            "best_e1rm": case(
+                (new.best_e1rm > PersonalRecord.best_e1rm, new.best_e1rm),
+                else_=PersonalRecord.best_e1rm
+            ),
+            "best_volume": case(
+                (new.best_volume > PersonalRecord.best_volume, new.best_volume),
+                else_=PersonalRecord.best_volume
+            ),
+        }
+    )
+    db.execute(stmt)
+
+
+def record_exercise_sets(db: Session, user_id: int, exercise_name: str, sets: Iterable) -> None:
+    """
+    Merge newly written sets of one exercise entry into the user's records.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        exercise_name: Canonical catalog name of the exercise
+        sets: New sets (objects exposing reps and weight)
+    """
+    record_entries(db, user_id, [(exercise_name, sets)])
+
+
+def _compute_records(db: Session, *criteria) -> dict:
+    """
+    Compute records from stored sets with two aggregate queries.
+
+    Args:
+        db: Database session
+        criteria: Filter expressions over WorkoutSession/Exercise/ExerciseCatalog
+
+    Returns:
+        Dictionary mapping (user_id, canonical exercise name) to record fields
+    """
+    # Best reps for every distinct weight gives max weight, reps at it and e1RM
+    by_weight = db.query(
+        WorkoutSession.user_id,
+        ExerciseCatalog.name,
+        WorkoutSet.weight,
+        func.max(WorkoutSet.reps),
+    ).join(
+        Exercise, Exercise.session_id == WorkoutSession.id
+    ).join(
+        ExerciseCatalog, Exercise.catalog_id == ExerciseCatalog.id
+    ).join(
+        WorkoutSet, WorkoutSet.exercise_id == Exercise.id
+    ).filter(*criteria).group_by(
+        WorkoutSession.user_id, ExerciseCatalog.name, WorkoutSet.weight
+    )
+
+    records = {}
+    for user_id, name, weight, reps in by_weight:
+        record = records.get((user_id, name))
+        if record is None:
+            records[(user_id, name)] = {
+                "max_weight": weight,
+                "max_weight_reps": reps,
+                "best_e1rm": estimated_1rm(weight, reps),
+                "best_volume": 0.0,
+            }
+            continue
+        if weight > record["max_weight"]:
+            record["max_weight"] = weight
+            record["max_weight_reps"] = reps
+        record["best_e1rm"] = max(record["best_e1rm"], estimated_1rm(weight, reps))
+
+    entry_volumes = db.query(
+        WorkoutSession.user_id.label("user_id"),
+        ExerciseCatalog.name.label("name"),
+        func.sum(WorkoutSet.reps * WorkoutSet.weight).label("volume"),
+    ).join(
+        Exercise, Exercise.session_id == WorkoutSession.id
+    ).join(
+        ExerciseCatalog, Exercise.catalog_id == ExerciseCatalog.id
+    ).join(
+        WorkoutSet, WorkoutSet.exercise_id == Exercise.id
+    ).filter(*criteria).group_by(
+        Exercise.id, WorkoutSession.user_id, ExerciseCatalog.name
+    ).subquery()
+
+    by_entry = db.query(
+        entry_volumes.c.user_id,
+        entry_volumes.c.name,
+        func.max(entry_volumes.c.volume),
+    ).group_by(entry_volumes.c.user_id, entry_volumes.c.name)
+
+    for user_id, name, best_volume in by_entry:
+        records[(user_id, name)]["best_volume"] = float(best_volume)
+
+    return records
+
+
+def _insert_records(db: Session, records: dict) -> None:
+    """Insert computed records with one multi-row INSERT"""
+    if not records:
+        return
+    db.execute(
+        PersonalRecord.__table__.insert(),
+        [
+            {"user_id": owner_id, "exercise_name": name, **fields}
+            for (owner_id, name), fields in records.items()
+        ]
+    )
+
+
+def refresh_personal_records(db: Session, user_id: int, exercise_names: Iterable[str]) -> None:
+    """
+    Recompute records for specific exercises after sets were removed.
+
+    Records can only be raised incrementally, so deletions recompute the
+    affected exercises from their remaining sets. Pending deletes must be
+    flushed before calling this.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        exercise_names: Canonical names of the exercises whose sets changed
+    """
+    names = set(exercise_names)
+    if not names:
+        return
+
+    records = _compute_records(
+        db,
+        WorkoutSession.user_id == user_id,
+        ExerciseCatalog.name.in_(names)
+    )
+
+    db.query(PersonalRecord).filter(
+        PersonalRecord.user_id == user_id,
+        PersonalRecord.exercise_name.in_(names)
+    ).delete(synchronize_session=False)
+    _insert_records(db, records)
+
+
+def rebuild_personal_records(db: Session, user_id: Optional[int] = None) -> int:
+    """
+    Recompute all personal records from workout data (backfill or repair).
+
+    Args:
+        db: Database session
+        user_id: Only rebuild this user's records (all users if None)
+
+    Returns:
+        Number of records written
+    """
+    criteria = []
+    delete_query = db.query(PersonalRecord)
+    if user_id is not None:
+        criteria.append(WorkoutSession.user_id == user_id)
+        delete_query = delete_query.filter(PersonalRecord.user_id == user_id)
+
+    records = _compute_records(db, *criteria)
+
+    delete_query.delete(synchronize_session=False)
+    _insert_records(db, records)
+    db.commit()
+
+    return len(records)
+
+
+def get_personal_records(
+    db: Session,
+    user_id: int,
+    exercise_name: Optional[str] = None
+) -> List[PersonalRecord]:
+    """
+    Get a user's personal records.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        exercise_name: Only return the record for this canonical exercise name
+
+    Returns:
+        List of PersonalRecord objects ordered by exercise name
+    """
+    query = db.query(PersonalRecord).filter(PersonalRecord.user_id == user_id)
+    if exercise_name is not None:
+        query = query.filter(PersonalRecord.exercise_name == exercise_name)
+    return query.order_by(PersonalRecord.exercise_name).all()
@@ -0,0 +1,304 @@
+import hashlib
+import secrets
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set, Tuple
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import insert_on_conflict
+from app.db.models import RefreshToken, RevokedToken, RevokedTokenVersion, User
+from app.schemas.users import TokenData
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (e.g. read back from SQLite) as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _hash_token(token: str) -> str:
+    """Refresh tokens are random, so a fast unsalted hash is enough to store them."""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+class RevocationList:
+    """
+    In-process revoked access tokens, reloaded from the database.
+
+    Holds the IDs of single revoked tokens and, per user, the minimum
+    token version still accepted. Checking a token is a set and a dict
+    lookup; both are reloaded at most every reload_interval seconds, which
+    bounds how long a revocation made through another process takes to
+    apply here. Revocations made through this process apply immediately.
+    """
+
+    def __init__(self, reload_interval: float):
+        self.reload_interval = reload_interval
+        self._jtis: Set[str] = set()
+        self._min_versions: Dict[int, int] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def is_stale(self) -> bool:
+        """Check whether the set should be reloaded before use."""
+        loaded_at = self._loaded_at
+        return loaded_at is None or time.monotonic() - loaded_at >= self.reload_interval
+
+    def reload(self, db: Session) -> None:
+        """
+        Replace the revocations with the unexpired ones stored in the database.
+
+        Args:
+            db: Database session
+        """
+        now = _utcnow()
+        jtis = {
+            jti for (jti,) in db.query(RevokedToken.jti).filter(
+                RevokedToken.expires_at > now
+            )
+        }
+        min_versions = dict(
+            db.query(RevokedTokenVersion.user_id, RevokedTokenVersion.min_version).filter(
+                RevokedTokenVersion.expires_at > now
+            )
+        )
+        with self._lock:
+            self._jtis = jtis
+            self._min_versions = min_versions
+            self._loaded_at = time.monotonic()
+
+    def add(self, jti: str) -> None:
+        """Mark a token as revoked in this process."""
+        with self._lock:
+            self._jtis.add(jti)
+
+    def add_min_version(self, user_id: int, min_version: int) -> None:
+        """Mark a user's tokens below min_version as revoked in this process."""
+        with self._lock:
+            if min_version > self._min_versions.get(user_id, 0):
+                self._min_versions[user_id] = min_version
+
+    def rejects(self, token_data: TokenData) -> bool:
+        """
+        Check whether a decoded access token has been revoked.
+
+        Args:
+            token_data: Decoded token claims
+
+        Returns:
+            True if the token's ID or its user's token version was revoked
+        """
+        if token_data.jti is not None and token_data.jti in self._jtis:
+            return True
+        if token_data.user_id is not None:
+            min_version = self._min_versions.get(token_data.user_id)
+            if min_version is not None and (token_data.token_version or 0) < min_version:
+                return True
+        return False
+
+    def clear(self) -> None:
+        """Forget every revocation and force a reload on next use."""
+        with self._lock:
+            self._jtis = set()
+            self._min_versions = {}
+            self._loaded_at = None
+
+    def __contains__(self, jti: str) -> bool:
+        return jti in self._jtis
+
+
+# Revoked access token IDs for this process
+revoked_access_tokens = RevocationList(settings.REVOCATION_RELOAD_SECONDS)
+
+
+def revoke_access_token(db: Session, jti: str, expires_at: datetime) -> None:
+    """
+    Revoke an access token before it expires.
+
+    Args:
+        db: Database session
+        jti: Token ID (jti claim)
+        expires_at: Token expiry; the revocation is kept until then
+    """
+    if db.get(RevokedToken, jti) is None:
+        db.add(RevokedToken(jti=jti, expires_at=expires_at))
+        db.commit()
+    revoked_access_tokens.add(jti)
+
+
+def revoke_user_access_tokens(db: Session, user_id: int) -> int:
+    """
+    Revoke every access token issued to a user so far (commit is left to the caller).
+
+    The token version is incremented in SQL, so concurrent bumps from
+    different processes never write the same version, and the new version
+    is recorded as the user's cutoff until tokens issued before it have
+    expired. In-session User objects keep their old token_version until
+    refreshed.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        New token version
+    """
+    version = db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+        .returning(User.token_version)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+
+    stmt = insert_on_conflict(db, RevokedTokenVersion).values(
+        user_id=user_id,
+        min_version=version,
+        expires_at=_utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[RevokedTokenVersion.user_id],
+        set_={
+            "min_version": stmt.excluded.min_version,
+            "expires_at": stmt.excluded.expires_at,
+        }
+    ))
+    revoked_access_tokens.add_min_version(user_id, version)
+    return version
+
+
+def _add_refresh_token(db: Session, user_id: int, family_id: str) -> str:
+    """Add a refresh token row (without committing) and return the token."""
+    token = secrets.token_urlsafe(32)
+    db.add(RefreshToken(
+        user_id=user_id,
+        token_hash=_hash_token(token),
+        family_id=family_id,
+        expires_at=_utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    ))
+    return token
+
+
+def issue_refresh_token(db: Session, user_id: int) -> str:
+    """
+    Issue a refresh token starting a new rotation family (one per login).
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        Opaque refresh token (only its hash is stored)
+    """
+    token = _add_refresh_token(db, user_id, uuid.uuid4().hex)
+    db.commit()
+    return token
+
+
+def _revoke_family(db: Session, family_id: str) -> None:
+    db.query(RefreshToken).filter(
+        RefreshToken.family_id == family_id,
+        RefreshToken.revoked_at.is_(None)
+    ).update({RefreshToken.revoked_at: _utcnow()}, synchronize_session=False)
+
+
+def rotate_refresh_token(db: Session, token: str) -> Optional[Tuple[User, str]]:
+    """
+    Exchange a refresh token for its successor.
+
+    The presented token is revoked and a new one is issued in the same
+    family. Presenting an already rotated token means it was copied, so
+    the whole family is revoked and both holders must log in again.
+
+    Args:
+        db: Database session
+        token: Refresh token
+
+    Returns:
+        Tuple of (user, new refresh token), or None if the token is
+        unknown, expired or revoked
+    """
+    row = db.query(RefreshToken).filter(
+        RefreshToken.token_hash == _hash_token(token)
+    ).with_for_update().first()
+
+    if row is None:
+        return None
+
+    if row.revoked_at is not None:
+        _revoke_family(db, row.family_id)
+        db.commit()
+        return None
+
+    if _as_utc(row.expires_at) <= _utcnow():
+        return None
+
+    row.revoked_at = _utcnow()
+    new_token = _add_refresh_token(db, row.user_id, row.family_id)
+    user = db.get(User, row.user_id)
+    db.commit()
+
+    return user, new_token
+
+
+def revoke_refresh_token(db: Session, token: str) -> None:
+    """
+    Revoke a refresh token and every rotation of it (e.g. on logout).
+
+    Args:
+        db: Database session
+        token: Refresh token
+    """
+    row = db.query(RefreshToken).filter(
+        RefreshToken.token_hash == _hash_token(token)
+    ).first()
+    if row is not None:
+        _revoke_family(db, row.family_id)
+        db.commit()
+
+
+def revoke_user_refresh_tokens(db: Session, user_id: int) -> None:
+    """
+    Revoke all of a user's refresh tokens (commit is left to the caller).
+
+    Args:
+        db: Database session
+        user_id: User ID
+    """
+    db.query(RefreshToken).filter(
+        RefreshToken.user_id == user_id,
+        RefreshToken.revoked_at.is_(None)
+    ).update({RefreshToken.revoked_at: _utcnow()}, synchronize_session=False)
+
+
+def purge_expired_tokens(db: Session) -> int:
+    """
+    Delete expired refresh tokens and revocations of expired access tokens.
+
+    Token version cutoffs are deleted once every token they revoke has expired.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of rows deleted
+    """
+    now = _utcnow()
+    deleted = db.query(RefreshToken).filter(
+        RefreshToken.expires_at <= now
+    ).delete(synchronize_session=False)
+    deleted += db.query(RevokedToken).filter(
+        RevokedToken.expires_at <= now
+    ).delete(synchronize_session=False)
+    deleted += db.query(RevokedTokenVersion).filter(
+        RevokedTokenVersion.expires_at <= now
+    ).delete(synchronize_session=False)
+    db.commit()
+    return deleted
@@ -0,0 +1,276 @@
+from datetime import date, datetime
+from typing import Optional, Tuple, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.async_database import run_service
+from app.db.database import insert_on_conflict
+from app.db.models import SleepLog, NutritionLog
+from app.services.pagination import paginate
+
+
+def _insert_daily_log(db: Session, model, user_id: int, log_date: date, fields: dict, overwrite: bool) -> Optional[dict]:
+    """
+    Insert a user's log for one day in a single statement.
+
+    The (user_id, date) unique index arbitrates concurrent writes, so there
+    is no read-before-write and no window for duplicate days.
+
+    Args:
+        db: Database session
+        model: SleepLog or NutritionLog
+        user_id: User ID
+        log_date: Day the log is for
+        fields: Log values other than user_id and date
+        overwrite: Replace an existing log for the day instead of leaving it
+
+    Returns:
+        Column values of the stored row, or None if a log already existed
+        and overwrite is False
+    """
+    stmt = insert_on_conflict(db, model).values(user_id=user_id, date=log_date, **fields)
+    index_elements = [model.user_id, model.date]
+    if overwrite:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={field: getattr(stmt.excluded, field) for field in fields}
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+    row = db.execute(stmt.returning(*model.__table__.c)).mappings().first()
+    db.commit()
+    return dict(row) if row else None
+
+
+def create_sleep_log(db: Session, user_id: int, log_date: date, fields: dict) -> Optional[dict]:
+    """
+    Create a sleep log unless one exists for the day.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        log_date: Night the log is for
+        fields: hours, quality and notes
+
+    Returns:
+        Stored sleep log values, or None if the day is already logged
+    """
+    return _insert_daily_log(db, SleepLog, user_id, log_date, fields, overwrite=False)
+
+
+def upsert_sleep_log(db: Session, user_id: int, log_date: date, fields: dict) -> dict:
+    """
+    Create or replace the sleep log for a day.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        log_date: Night the log is for
+        fields: hours, quality and notes
+
+    Returns:
+        Stored sleep log values
+    """
+    return _insert_daily_log(db, SleepLog, user_id, log_date, fields, overwrite=True)
+
+
+def create_nutrition_log(db: Session, user_id: int, log_date: date, fields: dict) -> Optional[dict]:
+    """
+    Create a nutrition log unless one exists for the day.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        log_date: Day the log is for
+        fields: calories, macros, water and notes
+
+    Returns:
+        Stored nutrition log values, or None if the day is already logged
+    """
+    return _insert_daily_log(db, NutritionLog, user_id, log_date, fields, overwrite=False)
+
+
+def upsert_nutrition_log(db: Session, user_id: int, log_date: date, fields: dict) -> dict:
+    """
+    Create or replace the nutrition log for a day.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        log_date: Day the log is for
+        fields: calories, macros, water and notes
+
+    Returns:
+        Stored nutrition log values
+    """
+    return _insert_daily_log(db, NutritionLog, user_id, log_date, fields, overwrite=True)
+
+
+def get_daily_logs(
+    db: Session,
+    model,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 30,
+    cursor: Optional[Tuple[datetime, int]] = None
+) -> list:
+    """
+    Get a page of a user's logs, newest first.
+
+    Args:
+        db: Database session
+        model: SleepLog or NutritionLog
+        user_id: User ID
+        skip: Number of records to skip (offset pagination)
+        limit: Maximum number of records to return
+        cursor: (date, id) of the last log on the previous page (keyset pagination)
+
+    Returns:
+        List of logs
+    """
+    query = db.query(model).filter(model.user_id == user_id)
+    return paginate(query, model.date, model.id, skip, limit, cursor).all()
+
+
+def get_daily_log(db: Session, model, log_id: int, user_id: int):
+    """
+    Get one of a user's logs by ID.
+
+    Args:
+        db: Database session
+        model: SleepLog or NutritionLog
+        log_id: Log ID
+        user_id: User ID
+
+    Returns:
+        Log if found and owned by the user, None otherwise
+    """
+    return db.query(model).filter(
+        model.id == log_id,
+        model.user_id == user_id
+    ).first()
+
+
+def update_daily_log(db: Session, model, log_id: int, user_id: int, fields: dict):
+    """
+    Update one of a user's logs.
+
+    Args:
+        db: Database session
+        model: SleepLog or NutritionLog
+        log_id: Log ID
+        user_id: User ID
+        fields: Column values to set
+
+    Returns:
+        Updated log, or None if not found
+    """
+    log = get_daily_log(db, model, log_id, user_id)
+    if log is None:
+        return None
+
+    for field, value in fields.items():
+        setattr(log, field, value)
+
+    db.commit()
+    db.refresh(log)
+    return log
+
+
+def delete_daily_log(db: Session, model, log_id: int, user_id: int) -> bool:
+    """
+    Delete one of a user's logs.
+
+    Args:
+        db: Database session
+        model: SleepLog or NutritionLog
+        log_id: Log ID
+        user_id: User ID
+
+    Returns:
+        True if deleted, False if not found
+    """
+    log = get_daily_log(db, model, log_id, user_id)
+    if log is None:
+        return False
+
+    db.delete(log)
+    db.commit()
+    return True
+
+# Async variants: the same service logic run through run_service, so they
+# accept either an AsyncSession (non-blocking driver) or a Session (thread pool)
+
+async def create_sleep_log_async(
+    db: Union[AsyncSession, Session],
+    user_id: int,
+    log_date: date,
+    fields: dict
+) -> Optional[dict]:
+    """Async variant of create_sleep_log."""
+    return await run_service(db, create_sleep_log, user_id, log_date, fields)
+
+
+async def upsert_sleep_log_async(
+    db: Union[AsyncSession, Session],
+    user_id: int,
+    log_date: date,
+    fields: dict
+) -> dict:
+    """Async variant of upsert_sleep_log."""
+    return await run_service(db, upsert_sleep_log, user_id, log_date, fields)
+
+
+async def create_nutrition_log_async(
+    db: Union[AsyncSession, Session],
+    user_id: int,
+    log_date: date,
+    fields: dict
+) -> Optional[dict]:
+    """Async variant of create_nutrition_log."""
+    return await run_service(db, create_nutrition_log, user_id, log_date, fields)
+
+
+async def upsert_nutrition_log_async(
+    db: Union[AsyncSession, Session],
+    user_id: int,
+    log_date: date,
+    fields: dict
+) -> dict:
+    """Async variant of upsert_nutrition_log."""
+    return await run_service(db, upsert_nutrition_log, user_id, log_date, fields)
+
+
+async def get_daily_logs_async(
+    db: Union[AsyncSession, Session],
+    model,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 30,
+    cursor: Optional[Tuple[datetime, int]] = None
+) -> list:
+    """Async variant of get_daily_logs."""
+    return await run_service(db, get_daily_logs, model, user_id, skip, limit, cursor)
+
+
+async def get_daily_log_async(db: Union[AsyncSession, Session], model, log_id: int, user_id: int):
+    """Async variant of get_daily_log."""
+    return await run_service(db, get_daily_log, model, log_id, user_id)
+
+
+async def update_daily_log_async(
+    db: Union[AsyncSession, Session],
+    model,
+    log_id: int,
+    user_id: int,
+    fields: dict
+):
+    """Async variant of update_daily_log."""
+    return await run_service(db, update_daily_log, model, log_id, user_id, fields)
+
+
+async def delete_daily_log_async(db: Union[AsyncSession, Session], model, log_id: int, user_id: int) -> bool:
+    """Async variant of delete_daily_log."""
+    return await run_service(db, delete_daily_log, model, log_id, user_id)
@@ -1,16 +1,43 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple, Union
+from sqlalchemy import case, exists, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from fastapi import HTTPException, status
 
-from app.db.models import WorkoutSession, Exercise, WorkoutSet, User
+from app.db.async_database import run_service
+from app.db.models import WorkoutSession, Exercise, ExerciseCatalog, WorkoutSet, User
+from app.services.catalog import resolve_exercise, resolve_exercises
+from app.services.daily_stats import (
+    bump_daily_stats,
+    set_totals,
+    stored_set_totals,
+    workout_day,
+)
+from app.services.pagination import paginate
+from app.services.records import record_entries, record_exercise_sets, refresh_personal_records
 from app.schemas.workouts import (
     WorkoutSessionCreate,
     WorkoutSessionUpdate,
     ExerciseCreate,
+    ExerciseUpdate,
     WorkoutSetCreate,
+    WorkoutSetUpdate,
 )
 
 
+def _workout_tree_options():
+    """
+    Loader options that fetch a workout's exercises and their sets eagerly.
+
+    Uses one SELECT ... IN per level, so serializing any number of workouts
+    costs a fixed number of statements instead of one per exercise.
+    """
+    return (
+        selectinload(WorkoutSession.exercises).selectinload(Exercise.sets),
+    )
+
+
 def create_workout_session(
     db: Session, 
     workout_data: WorkoutSessionCreate, 
@@ -19,6 +46,11 @@ def create_workout_session(
     """
     Create a new workout session with exercises and sets.
     
+    The session, its exercises and their sets are each written with one
+    multi-row INSERT ... RETURNING (batched by the driver for very large
+    workouts), so the number of statements does not grow with the size
+    of the workout.
+    
     Args:
         db: Database session
         workout_data: Workout session data
@@ -27,36 +59,60 @@ def create_workout_session(
     Returns:
         Created WorkoutSession object
     """
-    # Create workout session
-    db_workout = WorkoutSession(
-        title=workout_data.title,
-        user_id=user_id
-    )
-    db.add(db_workout)
-    db.flush()  # Get the workout ID without committing
-    
-    # Create exercises and sets
-    for exercise_data in workout_data.exercises:
-        db_exercise = Exercise(
-            name=exercise_data.name,
-            session_id=db_workout.id
-        )
-        db.add(db_exercise)
-        db.flush()  # Get the exercise ID
+    # Resolve names before writing; unknown exercises are added to the catalog
+    catalog = resolve_exercises(db, [exercise.name for exercise in workout_data.exercises])
+    
+    workout_id, workout_date = db.execute(
+        insert(WorkoutSession).values(
+            title=workout_data.title,
+            user_id=user_id
+        ).returning(WorkoutSession.id, WorkoutSession.date)
+    ).one()
+    
+    if workout_data.exercises:
+        # Returned in parameter order, so IDs line up with workout_data.exercises
+        # (SQLite cannot order a batched RETURNING and falls back to row by row)
+        exercise_ids = db.scalars(
+            insert(Exercise).returning(Exercise.id, sort_by_parameter_order=True),
+            [
+                {
+                    "name": exercise_data.name,
+                    "session_id": workout_id,
+                    "catalog_id": catalog[exercise_data.name][0],
+                }
+                for exercise_data in workout_data.exercises
+            ]
+        ).all()
         
-        # Create sets for this exercise
-        for set_data in exercise_data.sets:
-            db_set = WorkoutSet(
-                reps=set_data.reps,
-                weight=set_data.weight,
-                exercise_id=db_exercise.id
-            )
-            db.add(db_set)
+        set_rows = [
+            {"reps": set_data.reps, "weight": set_data.weight, "exercise_id": exercise_id}
+            for exercise_id, exercise_data in zip(exercise_ids, workout_data.exercises)
+            for set_data in exercise_data.sets
+        ]
+        if set_rows:
+            db.execute(insert(WorkoutSet), set_rows)
+        
+        record_entries(db, user_id, [
+            (catalog[exercise_data.name][1], exercise_data.sets)
+            for exercise_data in workout_data.exercises
+        ])
+    
+    bump_daily_stats(
+        db,
+        user_id,
+        workout_day(workout_date),
+        workouts=1,
+        exercises=len(workout_data.exercises),
+        **set_totals(
+            set_data
+            for exercise_data in workout_data.exercises
+            for set_data in exercise_data.sets
+        )
+    )
     
     db.commit()
-    db.refresh(db_workout)
     
-    return db_workout
+    return get_workout_session(db, workout_id, user_id)
 
 
 def get_workout_session(
@@ -75,7 +131,9 @@ def get_workout_session(
     Returns:
         WorkoutSession object if found and belongs to user, None otherwise
     """
-    workout = db.query(WorkoutSession).filter(
+    workout = db.query(WorkoutSession).options(
+        *_workout_tree_options()
+    ).filter(
         WorkoutSession.id == workout_id,
         WorkoutSession.user_id == user_id
     ).first()
@@ -87,29 +145,85 @@ def get_user_workouts(
     db: Session, 
     user_id: int, 
     skip: int = 0, 
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[Tuple[datetime, int]] = None
 ) -> List[WorkoutSession]:
     """
-    Get all workout sessions for a user.
+    Get all workout sessions for a user, newest first.
     
     Args:
         db: Database session
         user_id: User ID
-        skip: Number of records to skip (pagination)
+        skip: Number of records to skip (legacy offset pagination)
         limit: Maximum number of records to return
+        cursor: Decoded keyset cursor; when given, skip is ignored
         
     Returns:
         List of WorkoutSession objects
     """
-    workouts = db.query(WorkoutSession).filter(
+    query = db.query(WorkoutSession).options(
+        *_workout_tree_options()
+    ).filter(
         WorkoutSession.user_id == user_id
-    ).order_by(
-        WorkoutSession.date.desc()
-    ).offset(skip).limit(limit).all()
+    )
+    workouts = paginate(
+        query, WorkoutSession.date, WorkoutSession.id, skip, limit, cursor
+    ).all()
     
     return workouts
 
 
+def get_user_workout_summaries(
+    db: Session,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Tuple[datetime, int]] = None
+) -> list:
+    """
+    Get workout sessions for a user with aggregate counts instead of nested data.
+    
+    Exercise count, set count and total volume are computed in a single
+    grouped query, so the cost does not grow with the number of sets loaded.
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        skip: Number of records to skip (legacy offset pagination)
+        limit: Maximum number of records to return
+        cursor: Decoded keyset cursor; when given, skip is ignored
+        
+    Returns:
+        List of rows matching the WorkoutSessionList schema
+    """
+    query = db.query(
+        WorkoutSession.id,
+        WorkoutSession.date,
+        WorkoutSession.title,
+        WorkoutSession.user_id,
+        WorkoutSession.is_completed,
+        WorkoutSession.completed_at,
+        func.count(func.distinct(Exercise.id)).label("exercise_count"),
+        func.count(WorkoutSet.id).label("set_count"),
+        func.coalesce(
+            func.sum(WorkoutSet.reps * WorkoutSet.weight), 0.0
+        ).label("total_volume"),
+    ).outerjoin(
+        Exercise, Exercise.session_id == WorkoutSession.id
+    ).outerjoin(
+        WorkoutSet, WorkoutSet.exercise_id == Exercise.id
+    ).filter(
+        WorkoutSession.user_id == user_id
+    ).group_by(
+        WorkoutSession.id
+    )
+    summaries = paginate(
+        query, WorkoutSession.date, WorkoutSession.id, skip, limit, cursor
+    ).all()
+    
+    return summaries
+
+
 def update_workout_session(
     db: Session, 
     workout_id: int, 
@@ -141,9 +255,8 @@ def update_workout_session(
         workout.title = workout_data.title
     
     db.commit()
-    db.refresh(workout)
     
-    return workout
+    return get_workout_session(db, workout_id, user_id)
 
 
 def delete_workout_session(
@@ -170,7 +283,25 @@ def delete_workout_session(
     if not workout:
         return False
     
+    exercise_names = [
+        name for (name,) in db.query(ExerciseCatalog.name).select_from(Exercise).outerjoin(
+            ExerciseCatalog, Exercise.catalog_id == ExerciseCatalog.id
+        ).filter(Exercise.session_id == workout.id)
+    ]
+    totals = stored_set_totals(db, Exercise.session_id == workout.id)
+    bump_daily_stats(
+        db,
+        user_id,
+        workout_day(workout.date),
+        workouts=-1,
+        completed_workouts=-1 if workout.is_completed else 0,
+        exercises=-len(exercise_names),
+        **{field: -value for field, value in totals.items()}
+    )
+    
     db.delete(workout)
+    db.flush()
+    refresh_personal_records(db, user_id, filter(None, exercise_names))
     db.commit()
     
     return True
@@ -204,9 +335,11 @@ def add_exercise_to_workout(
         return None
     
     # Create exercise
+    catalog_id, canonical_name = resolve_exercise(db, exercise_data.name)
     db_exercise = Exercise(
         name=exercise_data.name,
-        session_id=workout_id
+        session_id=workout_id,
+        catalog_id=catalog_id
     )
     db.add(db_exercise)
     db.flush()
@@ -220,10 +353,69 @@ def add_exercise_to_workout(
         )
         db.add(db_set)
     
+    record_exercise_sets(db, user_id, canonical_name, exercise_data.sets)
+    bump_daily_stats(
+        db,
+        user_id,
+        workout_day(workout.date),
+        exercises=1,
+        **set_totals(exercise_data.sets)
+    )
+    
     db.commit()
-    db.refresh(db_exercise)
     
-    return db_exercise
+    return db.query(Exercise).options(
+        selectinload(Exercise.sets)
+    ).filter(Exercise.id == db_exercise.id).first()
+
+
+def _get_owned_exercise(db: Session, exercise_id: int, user_id: int):
+    """
+    Load an exercise with its workout date and canonical name in one query.
+    
+    Returns:
+        Tuple of (Exercise, workout date, canonical name or None), or None
+        if the exercise is not in one of the user's workouts
+    """
+    return db.query(
+        Exercise, WorkoutSession.date, ExerciseCatalog.name
+    ).join(WorkoutSession).outerjoin(
+        ExerciseCatalog, Exercise.catalog_id == ExerciseCatalog.id
+    ).filter(
+        Exercise.id == exercise_id,
+        WorkoutSession.user_id == user_id
+    ).first()
+
+
+def _get_owned_set(db: Session, set_id: int, user_id: int):
+    """
+    Load a set with its workout date and canonical exercise name in one query.
+    
+    Returns:
+        Tuple of (WorkoutSet, workout date, canonical name or None), or None
+        if the set is not in one of the user's workouts
+    """
+    return db.query(
+        WorkoutSet, WorkoutSession.date, ExerciseCatalog.name
+    ).join(
+        Exercise, WorkoutSet.exercise_id == Exercise.id
+    ).join(
+        WorkoutSession, Exercise.session_id == WorkoutSession.id
+    ).outerjoin(
+        ExerciseCatalog, Exercise.catalog_id == ExerciseCatalog.id
+    ).filter(
+        WorkoutSet.id == set_id,
+        WorkoutSession.user_id == user_id
+    ).first()
+
+
+def _record_entry(db: Session, user_id: int, exercise_id: int, canonical_name: Optional[str]) -> None:
+    """Raise the user's records with the stored sets of one exercise entry."""
+    if canonical_name:
+        sets = db.query(WorkoutSet.reps, WorkoutSet.weight).filter(
+            WorkoutSet.exercise_id == exercise_id
+        ).all()
+        record_exercise_sets(db, user_id, canonical_name, sets)
 
 
 def delete_exercise(
@@ -243,15 +435,465 @@ def delete_exercise(
         True if deleted, False if not found or doesn't belong to user
     """
     # Get exercise with workout verification
-    exercise = db.query(Exercise).join(WorkoutSession).filter(
-        Exercise.id == exercise_id,
-        WorkoutSession.user_id == user_id
-    ).first()
+    result = _get_owned_exercise(db, exercise_id, user_id)
     
-    if not exercise:
+    if not result:
         return False
     
+    exercise, workout_date, canonical_name = result
+    totals = stored_set_totals(db, Exercise.id == exercise.id)
+    bump_daily_stats(
+        db,
+        user_id,
+        workout_day(workout_date),
+        exercises=-1,
+        **{field: -value for field, value in totals.items()}
+    )
+    
     db.delete(exercise)
+    db.flush()
+    refresh_personal_records(db, user_id, filter(None, [canonical_name]))
     db.commit()
     
     return True
+
+
+def update_exercise(
+    db: Session,
+    exercise_id: int,
+    exercise_data: ExerciseUpdate,
+    user_id: int
+) -> Optional[Exercise]:
+    """
+    Rename an exercise.
+    
+    If the new name resolves to another catalog exercise, the entry's sets
+    move to that exercise's records and the old exercise's records are
+    recomputed without them.
+    
+    Args:
+        db: Database session
+        exercise_id: Exercise ID
+        exercise_data: Updated exercise data
+        user_id: ID of the user updating the exercise
+        
+    Returns:
+        Updated Exercise object with its sets if found and belongs to user, None otherwise
+    """
+    result = _get_owned_exercise(db, exercise_id, user_id)
+    
+    if not result:
+        return None
+    
+    exercise, _, old_name = result
+    if exercise_data.name is not None and exercise_data.name != exercise.name:
+        catalog_id, canonical_name = resolve_exercise(db, exercise_data.name)
+        exercise.name = exercise_data.name
+        if catalog_id != exercise.catalog_id:
+            exercise.catalog_id = catalog_id
+            db.flush()
+            refresh_personal_records(db, user_id, filter(None, [old_name]))
+            _record_entry(db, user_id, exercise.id, canonical_name)
+        db.commit()
+    
+    return db.query(Exercise).options(
+        selectinload(Exercise.sets)
+    ).filter(Exercise.id == exercise_id).first()
+
+
+def add_set_to_exercise(
+    db: Session,
+    exercise_id: int,
+    set_data: WorkoutSetCreate,
+    user_id: int
+) -> Optional[WorkoutSet]:
+    """
+    Add a set to an exercise.
+    
+    Args:
+        db: Database session
+        exercise_id: Exercise ID
+        set_data: Set data
+        user_id: ID of the user adding the set
+        
+    Returns:
+        Created WorkoutSet object if exercise found and belongs to user, None otherwise
+    """
+    result = _get_owned_exercise(db, exercise_id, user_id)
+    
+    if not result:
+        return None
+    
+    exercise, workout_date, canonical_name = result
+    db_set = WorkoutSet(
+        reps=set_data.reps,
+        weight=set_data.weight,
+        exercise_id=exercise.id
+    )
+    db.add(db_set)
+    db.flush()
+    
+    # The whole entry, since best_volume covers all of its sets
+    _record_entry(db, user_id, exercise.id, canonical_name)
+    bump_daily_stats(db, user_id, workout_day(workout_date), **set_totals([set_data]))
+    
+    db.commit()
+    db.refresh(db_set)
+    
+    return db_set
+
+
+def update_workout_set(
+    db: Session,
+    set_id: int,
+    set_data: WorkoutSetUpdate,
+    user_id: int
+) -> Optional[WorkoutSet]:
+    """
+    Change a set's reps or weight.
+    
+    Records are raised in place when neither value went down; otherwise
+    the exercise's records are recomputed, since the set may have held one.
+    
+    Args:
+        db: Database session
+        set_id: Set ID
+        set_data: Updated set data
+        user_id: ID of the user updating the set
+        
+    Returns:
+        Updated WorkoutSet object if found and belongs to user, None otherwise
+    """
+    result = _get_owned_set(db, set_id, user_id)
+    
+    if not result:
+        return None
+    
+    workout_set, workout_date, canonical_name = result
+    old_totals = set_totals([workout_set])
+    lowered = (
+        (set_data.reps is not None and set_data.reps < workout_set.reps)
+        or (set_data.weight is not None and set_data.weight < workout_set.weight)
+    )
+    
+    update_data = set_data.model_dump(exclude_unset=True, exclude_none=True)
+    for field, value in update_data.items():
+        setattr(workout_set, field, value)
+    db.flush()
+    
+    if lowered:
+        refresh_personal_records(db, user_id, filter(None, [canonical_name]))
+    else:
+        _record_entry(db, user_id, workout_set.exercise_id, canonical_name)
+    new_totals = set_totals([workout_set])
+    bump_daily_stats(
+        db,
+        user_id,
+        workout_day(workout_date),
+        reps=new_totals["reps"] - old_totals["reps"],
+        volume=new_totals["volume"] - old_totals["volume"]
+    )
+    
+    db.commit()
+    db.refresh(workout_set)
+    
+    return workout_set
+
+
+def delete_workout_set(
+    db: Session,
+    set_id: int,
+    user_id: int
+) -> bool:
+    """
+    Delete a set from an exercise.
+    
+    Args:
+        db: Database session
+        set_id: Set ID
+        user_id: ID of the user deleting the set
+        
+    Returns:
+        True if deleted, False if not found or doesn't belong to user
+    """
+    result = _get_owned_set(db, set_id, user_id)
+    
+    if not result:
+        return False
+    
+    workout_set, workout_date, canonical_name = result
+    bump_daily_stats(
+        db,
+        user_id,
+        workout_day(workout_date),
+        **{field: -value for field, value in set_totals([workout_set]).items()}
+    )
+    
+    db.delete(workout_set)
+    db.flush()
+    refresh_personal_records(db, user_id, filter(None, [canonical_name]))
+    db.commit()
+    
+    return True
+
+
+def toggle_exercise_completion(
+    db: Session,
+    workout_id: int,
+    exercise_id: int,
+    user_id: int
+) -> Optional[WorkoutSession]:
+    """
+    Flip an exercise's completion and recompute its workout's completion.
+    
+    Two UPDATE statements, without loading the workout's exercises. The
+    first locks the workout row (FOR UPDATE on Postgres), so concurrent
+    toggles in one workout run one after another and the second statement's
+    aggregate always sees every committed toggle.
+    
+    Args:
+        db: Database session
+        workout_id: Workout session ID
+        exercise_id: Exercise ID
+        user_id: ID of the user toggling the exercise
+        
+    Returns:
+        Updated WorkoutSession object, or None if the exercise is not in
+        one of the user's workouts
+    """
+    owned_workout = select(WorkoutSession.id).where(
+        WorkoutSession.id == workout_id,
+        WorkoutSession.user_id == user_id
+    ).with_for_update()
+    toggled = db.execute(
+        update(Exercise).where(
+            Exercise.id == exercise_id,
+            Exercise.session_id.in_(owned_workout)
+        ).values(
+            is_completed=~Exercise.is_completed
+        ).returning(Exercise.id).execution_options(synchronize_session=False)
+    ).first()
+    
+    if not toggled:
+        return None
+    
+    all_completed = ~exists().where(
+        Exercise.session_id == workout_id,
+        Exercise.is_completed.is_(False)
+    )
+    # Only matches when the completed state actually changes
+    changed = db.execute(
+        update(WorkoutSession).where(
+            WorkoutSession.id == workout_id,
+            WorkoutSession.is_completed != all_completed
+        ).values(
+            is_completed=all_completed,
+            completed_at=case((all_completed, datetime.now(timezone.utc)), else_=None)
+        ).returning(
+            WorkoutSession.is_completed, WorkoutSession.date
+        ).execution_options(synchronize_session=False)
+    ).first()
+    
+    if changed:
+        is_completed, workout_date = changed
+        bump_daily_stats(
+            db,
+            user_id,
+            workout_day(workout_date),
+            completed_workouts=1 if is_completed else -1
+        )
+    
+    db.commit()
+    
+    return get_workout_session(db, workout_id, user_id)
+
+
+def complete_workout_session(
+    db: Session,
+    workout_id: int,
+    user_id: int
+) -> Optional[WorkoutSession]:
+    """
+    Mark a workout and all of its exercises as completed.
+    
+    One set-based UPDATE covers every unfinished exercise and a second one
+    the workout itself; exercises are never loaded. Like toggling, the
+    first statement locks the workout row. Completing an already completed
+    workout keeps its original completed_at.
+    
+    Args:
+        db: Database session
+        workout_id: Workout session ID
+        user_id: ID of the user completing the workout
+        
+    Returns:
+        Updated WorkoutSession object, or None if not found or not owned by the user
+    """
+    owned_workout = select(WorkoutSession.id).where(
+        WorkoutSession.id == workout_id,
+        WorkoutSession.user_id == user_id
+    ).with_for_update()
+    db.execute(
+        update(Exercise).where(
+            Exercise.session_id.in_(owned_workout),
+            Exercise.is_completed.is_(False)
+        ).values(is_completed=True).execution_options(synchronize_session=False)
+    )
+    
+    completed = db.execute(
+        update(WorkoutSession).where(
+            WorkoutSession.id == workout_id,
+            WorkoutSession.user_id == user_id,
+            WorkoutSession.is_completed.is_(False)
+        ).values(
+            is_completed=True,
+            completed_at=datetime.now(timezone.utc)
+        ).returning(WorkoutSession.date).execution_options(synchronize_session=False)
+    ).first()
+    
+    if completed:
+        bump_daily_stats(db, user_id, workout_day(completed.date), completed_workouts=1)
+    
+    db.commit()
+    
+    # Also the ownership check: None when the workout is not the user's
+    return get_workout_session(db, workout_id, user_id)
+
+
+# Async variants: the same service logic run through run_service, so they
+# accept either an AsyncSession (non-blocking driver) or a Session (thread pool)
+
+async def create_workout_session_async(
+    db: Union[AsyncSession, Session],
+    workout_data: WorkoutSessionCreate,
+    user_id: int
+) -> WorkoutSession:
+    """Async variant of create_workout_session."""
+    return await run_service(db, create_workout_session, workout_data, user_id)
+
+
+async def get_workout_session_async(
+    db: Union[AsyncSession, Session],
+    workout_id: int,
+    user_id: int
+) -> Optional[WorkoutSession]:
+    """Async variant of get_workout_session."""
+    return await run_service(db, get_workout_session, workout_id, user_id)
+
+
+async def get_user_workouts_async(
+    db: Union[AsyncSession, Session],
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Tuple[datetime, int]] = None
+) -> List[WorkoutSession]:
+    """Async variant of get_user_workouts."""
+    return await run_service(db, get_user_workouts, user_id, skip, limit, cursor)
+
+
+async def get_user_workout_summaries_async(
+    db: Union[AsyncSession, Session],
+    user_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Tuple[datetime, int]] = None
+) -> list:
+    """Async variant of get_user_workout_summaries."""
+    return await run_service(db, get_user_workout_summaries, user_id, skip, limit, cursor)
+
+
+async def update_workout_session_async(
+    db: Union[AsyncSession, Session],
+    workout_id: int,
+    workout_data: WorkoutSessionUpdate,
+    user_id: int
+) -> Optional[WorkoutSession]:
+    """Async variant of update_workout_session."""
+    return await run_service(db, update_workout_session, workout_id, workout_data, user_id)
+
+
+async def delete_workout_session_async(
+    db: Union[AsyncSession, Session],
+    workout_id: int,
+    user_id: int
+) -> bool:
+    """Async variant of delete_workout_session."""
+    return await run_service(db, delete_workout_session, workout_id, user_id)
+
+
+async def add_exercise_to_workout_async(
+    db: Union[AsyncSession, Session],
+    workout_id: int,
+    exercise_data: ExerciseCreate,
+    user_id: int
+) -> Optional[Exercise]:
+    """Async variant of add_exercise_to_workout."""
+    return await run_service(db, add_exercise_to_workout, workout_id, exercise_data, user_id)
+
+
+async def update_exercise_async(
+    db: Union[AsyncSession, Session],
+    exercise_id: int,
+    exercise_data: ExerciseUpdate,
+    user_id: int
+) -> Optional[Exercise]:
+    """Async variant of update_exercise."""
+    return await run_service(db, update_exercise, exercise_id, exercise_data, user_id)
+
+
+async def add_set_to_exercise_async(
+    db: Union[AsyncSession, Session],
+    exercise_id: int,
+    set_data: WorkoutSetCreate,
+    user_id: int
+) -> Optional[WorkoutSet]:
+    """Async variant of add_set_to_exercise."""
+    return await run_service(db, add_set_to_exercise, exercise_id, set_data, user_id)
+
+
+async def update_workout_set_async(
+    db: Union[AsyncSession, Session],
+    set_id: int,
+    set_data: WorkoutSetUpdate,
+    user_id: int
+) -> Optional[WorkoutSet]:
+    """Async variant of update_workout_set."""
+    return await run_service(db, update_workout_set, set_id, set_data, user_id)
+
+
+async def delete_workout_set_async(
+    db: Union[AsyncSession, Session],
+    set_id: int,
+    user_id: int
+) -> bool:
+    """Async variant of delete_workout_set."""
+    return await run_service(db, delete_workout_set, set_id, user_id)
+
+
+async def toggle_exercise_completion_async(
+    db: Union[AsyncSession, Session],
+    workout_id: int,
+    exercise_id: int,
+    user_id: int
+) -> Optional[WorkoutSession]:
+    """Async variant of toggle_exercise_completion."""
+    return await run_service(db, toggle_exercise_completion, workout_id, exercise_id, user_id)
+
+
+async def complete_workout_session_async(
+    db: Union[AsyncSession, Session],
+    workout_id: int,
+    user_id: int
+) -> Optional[WorkoutSession]:
+    """Async variant of complete_workout_session."""
+    return await run_service(db, complete_workout_session, workout_id, user_id)
+
+
+async def delete_exercise_async(
+    db: Union[AsyncSession, Session],
+    exercise_id: int,
+    user_id: int
+) -> bool:
+    """Async variant of delete_exercise."""
+    return await run_service(db, delete_exercise, exercise_id, user_id)
@@ -0,0 +1,108 @@
+"""
+Measure concurrent-request throughput of one API worker.
+
+Logs in, then keeps `concurrency` requests in flight, cycling through the
+endpoints given with --path (by default one from each router), until
+`requests` have completed, and reports throughput and latency percentiles
+overall and per endpoint. Run it against a single uvicorn worker once with
+DB_ASYNC=0 and once with DB_ASYNC=1 to compare the thread-pool and
+async-engine paths:
+
+    uvicorn app.main:app --workers 1 --port 8000
+    python scripts/create_demo_user.py
+    python benchmarks/concurrent_requests.py --url http://localhost:8000 --concurrency 50
+
+Usage: python benchmarks/concurrent_requests.py [--url URL] [--path PATH ...]
+       [--concurrency N] [--requests N] [--username U] [--password P]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+# Read endpoints from each router, so a handler blocking the event loop
+# shows up in the tail latency of all of them
+DEFAULT_PATHS = [
+    "/api/workouts/summary?limit=20",
+    "/api/tracking/sleep?limit=30",
+    "/api/tracking/nutrition?limit=30",
+    "/api/analytics/summary?range=month",
+    "/api/analytics/calendar",
+    "/api/dashboard",
+    "/api/users/me",
+]
+
+
+async def login(client: httpx.AsyncClient, username: str, password: str) -> str:
+    response = await client.post(
+        "/api/auth/login",
+        data={"username": username, "password": password}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def run(args) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+        token = await login(client, args.username, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        paths = args.path or DEFAULT_PATHS
+        latencies = {path: [] for path in paths}
+        errors = 0
+        remaining = args.requests
+        
+        async def worker():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                path = paths[remaining % len(paths)]
+                start = time.perf_counter()
+                response = await client.get(path, headers=headers)
+                latencies[path].append(time.perf_counter() - start)
+                if response.status_code >= 400:
+                    errors += 1
+        
+        # Warm up connections and caches before timing
+        await asyncio.gather(*(
+            client.get(paths[i % len(paths)], headers=headers) for i in range(args.concurrency)
+        ))
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+    
+    def summary(samples):
+        samples = sorted(samples)
+        percentile = lambda p: samples[min(len(samples) - 1, int(len(samples) * p))] * 1000
+        return (f"p50 {percentile(0.50):.1f} ms, p95 {percentile(0.95):.1f} ms, "
+                f"p99 {percentile(0.99):.1f} ms, mean {statistics.mean(samples) * 1000:.1f} ms")
+    
+    everything = [sample for samples in latencies.values() for sample in samples]
+    print(f"{len(everything)} GETs over {len(paths)} endpoint(s) with {args.concurrency} in flight")
+    print(f"  throughput: {len(everything) / elapsed:.1f} req/s")
+    print(f"  latency:    {summary(everything)}")
+    print(f"  errors:     {errors}")
+    for path, samples in latencies.items():
+        if samples:
+            print(f"  {path}: {summary(samples)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", action="append", help="Endpoint to request (repeatable)")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--username", default="demo")
+    parser.add_argument("--password", default="demo123")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
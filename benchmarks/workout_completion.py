@@ -0,0 +1,114 @@
+"""
+Compare workout completion paths at increasing workout sizes.
+
+Marks workouts of 5, 50 and 500 exercises complete through the set-based
+complete_workout_session and through the previous ORM path (load every
+exercise, set is_completed on each, reload the tree), reporting median time
+and statements issued for each. Runs directly against DATABASE_URL with a
+throwaway user that is removed afterwards:
+
+    python benchmarks/workout_completion.py --repeat 5
+
+Usage: python benchmarks/workout_completion.py [--sizes N [N ...]] [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, update
+
+from app.db.database import SessionLocal, engine
+from app.db.models import Exercise, User, WorkoutSession
+from app.schemas.workouts import ExerciseCreate, WorkoutSessionCreate, WorkoutSetCreate
+from app.services.daily_stats import bump_daily_stats, workout_day
+from app.services.workouts import complete_workout_session, create_workout_session, get_workout_session
+
+
+def complete_workout_session_per_row(db, workout_id, user_id):
+    """The previous completion path: flag each loaded exercise, then reload"""
+    workout = db.query(WorkoutSession).filter(
+        WorkoutSession.id == workout_id,
+        WorkoutSession.user_id == user_id
+    ).first()
+    for exercise in workout.exercises:
+        exercise.is_completed = True
+    if not workout.is_completed:
+        bump_daily_stats(db, user_id, workout_day(workout.date), completed_workouts=1)
+    workout.is_completed = True
+    workout.completed_at = datetime.now(timezone.utc)
+    db.commit()
+    return get_workout_session(db, workout_id, user_id)
+
+
+def reset(db, workout_id):
+    """Reopen the workout and its exercises between runs"""
+    db.execute(update(Exercise).where(Exercise.session_id == workout_id).values(is_completed=False))
+    db.execute(update(WorkoutSession).where(WorkoutSession.id == workout_id).values(
+        is_completed=False, completed_at=None
+    ))
+    db.commit()
+    db.expunge_all()
+
+
+def measure(complete, db, workout_id, user_id, repeat):
+    """Return (median seconds, statements per call) for one completion path"""
+    statements = 0
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        nonlocal statements
+        # An executemany UPDATE still runs once per parameter set on the server
+        statements += len(parameters) if executemany else 1
+
+    timings = []
+    for _ in range(repeat):
+        reset(db, workout_id)
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            start = time.perf_counter()
+            complete(db, workout_id, user_id)
+            timings.append(time.perf_counter() - start)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+    return statistics.median(timings), statements / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 50, 500])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    user = User(username=f"bench-{uuid.uuid4().hex[:8]}", email=f"{uuid.uuid4().hex}@bench.local", password="!")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    try:
+        print(f"{'exercises':>9} {'path':>8} {'median ms':>10} {'statements':>11}")
+        for size in args.sizes:
+            workout_id = create_workout_session(db, WorkoutSessionCreate(
+                title=f"Benchmark {size} exercises",
+                exercises=[
+                    ExerciseCreate(name=f"Benchmark Lift {i % 10}", sets=[WorkoutSetCreate(reps=5, weight=60.0)] * 3)
+                    for i in range(size)
+                ]
+            ), user_id).id
+            for label, complete in (("per-row", complete_workout_session_per_row), ("bulk", complete_workout_session)):
+                seconds, statements = measure(complete, db, workout_id, user_id, args.repeat)
+                print(f"{size:>9} {label:>8} {seconds * 1000:>10.1f} {statements:>11.0f}")
+    finally:
+        db.rollback()
+        db.delete(db.get(User, user_id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Compare workout creation paths at increasing workout sizes.
+
+Creates workouts of 10, 100 and 1000 sets (spread over 10 exercises)
+through the bulk INSERT ... RETURNING path in create_workout_session and
+through the previous per-row ORM path (flush per exercise, one object per
+set), reporting median time and statements issued for each. Runs directly
+against DATABASE_URL with a throwaway user that is removed afterwards:
+
+    python benchmarks/workout_creation.py --repeat 5
+
+Usage: python benchmarks/workout_creation.py [--sizes N [N ...]]
+       [--exercises N] [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from app.db.database import SessionLocal, engine
+from app.db.models import Exercise, User, WorkoutSession, WorkoutSet
+from app.schemas.workouts import ExerciseCreate, WorkoutSessionCreate, WorkoutSetCreate
+from app.services.catalog import resolve_exercises
+from app.services.daily_stats import bump_daily_stats, set_totals, workout_day
+from app.services.records import record_exercise_sets
+from app.services.workouts import create_workout_session, get_workout_session
+
+
+def create_workout_session_per_row(db, workout_data, user_id):
+    """The previous creation path: flush per exercise, add sets one by one"""
+    catalog = resolve_exercises(db, [exercise.name for exercise in workout_data.exercises])
+    db_workout = WorkoutSession(title=workout_data.title, user_id=user_id)
+    db.add(db_workout)
+    db.flush()
+    for exercise_data in workout_data.exercises:
+        catalog_id, canonical_name = catalog[exercise_data.name]
+        db_exercise = Exercise(name=exercise_data.name, session_id=db_workout.id, catalog_id=catalog_id)
+        db.add(db_exercise)
+        db.flush()
+        for set_data in exercise_data.sets:
+            db.add(WorkoutSet(reps=set_data.reps, weight=set_data.weight, exercise_id=db_exercise.id))
+        record_exercise_sets(db, user_id, canonical_name, exercise_data.sets)
+    bump_daily_stats(
+        db,
+        user_id,
+        workout_day(db_workout.date),
+        workouts=1,
+        exercises=len(workout_data.exercises),
+        **set_totals(s for e in workout_data.exercises for s in e.sets)
+    )
+    db.commit()
+    return get_workout_session(db, db_workout.id, user_id)
+
+
+def build_workout(total_sets: int, exercises: int) -> WorkoutSessionCreate:
+    per_exercise = max(1, total_sets // exercises)
+    return WorkoutSessionCreate(
+        title=f"Benchmark {total_sets} sets",
+        exercises=[
+            ExerciseCreate(
+                name=f"Benchmark Lift {i}",
+                sets=[WorkoutSetCreate(reps=5, weight=60.0 + j % 20) for j in range(per_exercise)]
+            )
+            for i in range(min(exercises, total_sets))
+        ]
+    )
+
+
+def measure(create, db, workout_data, user_id, repeat):
+    """Return (median seconds, statements per call) for one creation path"""
+    statements = 0
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        nonlocal statements
+        statements += 1
+
+    timings = []
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            create(db, workout_data, user_id)
+            timings.append(time.perf_counter() - start)
+            db.expunge_all()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return statistics.median(timings), statements / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--exercises", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    user = User(username=f"bench-{uuid.uuid4().hex[:8]}", email=f"{uuid.uuid4().hex}@bench.local", password="!")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    try:
+        # Warm the catalog cache so both paths skip exercise creation
+        create_workout_session(db, build_workout(args.exercises, args.exercises), user_id)
+
+        print(f"{'sets':>6} {'path':>8} {'median ms':>10} {'statements':>11}")
+        for size in args.sizes:
+            workout_data = build_workout(size, args.exercises)
+            for label, create in (("per-row", create_workout_session_per_row), ("bulk", create_workout_session)):
+                seconds, statements = measure(create, db, workout_data, user_id, args.repeat)
+                print(f"{size:>6} {label:>8} {seconds * 1000:>10.1f} {statements:>11.0f}")
+    finally:
+        db.rollback()
+        db.delete(db.get(User, user_id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
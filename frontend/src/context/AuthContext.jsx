@@ -31,6 +31,7 @@ export const AuthProvider = ({ children }) => {
       setUser(response.data);
     } catch (error) {
       localStorage.removeItem('token');
+      localStorage.removeItem('refreshToken');
       localStorage.removeItem('user');
     } finally {
       setLoading(false);
@@ -43,9 +44,10 @@ export const AuthProvider = ({ children }) => {
     formData.append('password', password);
 
     const response = await authAPI.login(formData);
-    const { access_token } = response.data;
+    const { access_token, refresh_token } = response.data;
     
     localStorage.setItem('token', access_token);
+    localStorage.setItem('refreshToken', refresh_token);
     await loadUser();
     return response.data;
   };
@@ -56,7 +58,10 @@ export const AuthProvider = ({ children }) => {
   };
 
   const logout = () => {
+    // Revoke server-side too; the local session ends either way
+    authAPI.logout(localStorage.getItem('token'), localStorage.getItem('refreshToken')).catch(() => {});
     localStorage.removeItem('token');
+    localStorage.removeItem('refreshToken');
     localStorage.removeItem('user');
     setUser(null);
   };
@@ -1,22 +1,32 @@
 import { useState, useEffect } from 'react';
 import Navbar from '../components/Navbar';
-import { workoutAPI } from '../services/api';
+import { analyticsAPI } from '../services/api';
 import './Analytics.css';
 
 const Analytics = () => {
-  const [workouts, setWorkouts] = useState([]);
+  const [calendars, setCalendars] = useState({});
+  const [summary, setSummary] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const [timeRange, setTimeRange] = useState('all'); // 'day', 'week', 'month', 'all'
 
   useEffect(() => {
-    loadWorkouts();
+    loadCalendars();
   }, []);
 
-  const loadWorkouts = async () => {
+  useEffect(() => {
+    loadSummary();
+  }, [timeRange]);
+
+  const loadCalendars = async () => {
     try {
-      const response = await workoutAPI.getWorkouts();
-      setWorkouts(response.data);
+      // The calendar spans at most 8 weeks, so it touches this year and maybe the last
+      const year = new Date().getFullYear();
+      const responses = await Promise.all([
+        analyticsAPI.getCalendar(year - 1),
+        analyticsAPI.getCalendar(year),
+      ]);
+      setCalendars(Object.fromEntries(responses.map(r => [r.data.year, r.data])));
     } catch (err) {
       setError('Failed to load workout data');
     } finally {
@@ -24,7 +34,16 @@ const Analytics = () => {
     }
   };
 
-  if (loading) {
+  const loadSummary = async () => {
+    try {
+      const response = await analyticsAPI.getSummary(timeRange);
+      setSummary(response.data);
+    } catch (err) {
+      setError('Failed to load workout statistics');
+    }
+  };
+
+  if (loading || !summary) {
     return (
       <>
         <Navbar />
@@ -35,80 +54,31 @@ const Analytics = () => {
     );
   }
 
-  // Filter workouts by time range
-  const filterWorkoutsByTimeRange = (workoutsList) => {
-    if (timeRange === 'all') return workoutsList;
+  const currentCalendar = calendars[new Date().getFullYear()];
+  const currentStreak = currentCalendar ? currentCalendar.current_streak : 0;
+  const longestStreak = currentCalendar ? currentCalendar.longest_streak : 0;
 
-    const now = new Date();
-    const startOfDay = new Date(now.getFullYear(), now.getMonth(), now.getDate());
-    
-    let cutoffDate;
-    switch (timeRange) {
-      case 'day':
-        cutoffDate = startOfDay;
-        break;
-      case 'week':
-        cutoffDate = new Date(startOfDay);
-        cutoffDate.setDate(cutoffDate.getDate() - 7);
-        break;
-      case 'month':
-        cutoffDate = new Date(startOfDay);
-        cutoffDate.setMonth(cutoffDate.getMonth() - 1);
-        break;
-      default:
-        return workoutsList;
-    }
-
-    return workoutsList.filter(w => {
-      const workoutDate = new Date(w.completed_at || w.date);
-      return workoutDate >= cutoffDate;
-    });
+  // Completed workouts on a day, read from the per-year count arrays
+  const getWorkoutCount = (date) => {
+    const calendar = calendars[date.getFullYear()];
+    if (!calendar) return 0;
+    const dayOfYear = Math.round(
+      (Date.UTC(date.getFullYear(), date.getMonth(), date.getDate()) - Date.UTC(date.getFullYear(), 0, 1)) / 86400000
+    );
+    return calendar.counts[dayOfYear] || 0;
   };
 
-  const filteredWorkouts = filterWorkoutsByTimeRange(workouts);
-  const activeWorkouts = filteredWorkouts.filter(w => !w.is_completed);
-  const completedWorkouts = filteredWorkouts.filter(w => w.is_completed);
-
-  // Calculate statistics (use filtered workouts)
-  const totalWorkouts = filteredWorkouts.length;
-  const completionRate = totalWorkouts > 0 
-    ? Math.round((completedWorkouts.length / totalWorkouts) * 100) 
-    : 0;
-  
-  const totalVolume = filteredWorkouts.reduce((total, workout) => {
-    return total + (workout.exercises?.reduce((exTotal, exercise) => {
-      return exTotal + (exercise.sets?.reduce((setTotal, set) => {
-        return setTotal + (set.reps * set.weight);
-      }, 0) || 0);
-    }, 0) || 0);
-  }, 0);
-
-  const totalExercises = filteredWorkouts.reduce((total, workout) => {
-    return total + (workout.exercises?.length || 0);
-  }, 0);
-
-  const totalSets = filteredWorkouts.reduce((total, workout) => {
-    return total + (workout.exercises?.reduce((exTotal, exercise) => {
-      return exTotal + (exercise.sets?.length || 0);
-    }, 0) || 0);
-  }, 0);
-
-  // Get last 7 days workouts for activity streak
-  const last7Days = completedWorkouts.filter(w => {
-    const workoutDate = new Date(w.completed_at || w.date);
-    const daysDiff = Math.floor((new Date() - workoutDate) / (1000 * 60 * 60 * 24));
-    return daysDiff <= 7;
-  }).length;
-
-  // Average exercises per workout
-  const avgExercises = totalWorkouts > 0 
-    ? (totalExercises / totalWorkouts).toFixed(1) 
-    : 0;
-
-  // Average volume per workout
-  const avgVolume = completedWorkouts.length > 0 
-    ? (totalVolume / completedWorkouts.length).toFixed(0) 
-    : 0;
+  // Statistics are aggregated server-side for the selected time range
+  const totalWorkouts = summary.total_workouts;
+  const completedCount = summary.completed_workouts;
+  const inProgressCount = summary.in_progress_workouts;
+  const completionRate = Math.round(summary.completion_rate);
+  const totalVolume = summary.total_volume;
+  const totalExercises = summary.total_exercises;
+  const totalSets = summary.total_sets;
+  const last7Days = summary.completed_last_7_days;
+  const avgExercises = summary.avg_exercises_per_workout.toFixed(1);
+  const avgVolume = summary.avg_volume_per_workout.toFixed(0);
 
   // Generate calendar data based on time range filter
   const generateCalendarData = () => {
@@ -142,19 +112,8 @@ const Analytics = () => {
       const currentDate = new Date(startDate);
       currentDate.setDate(startDate.getDate() + i);
       
-      // Check if there's a completed workout on this day
-      const hasWorkout = completedWorkouts.some(w => {
-        const workoutDate = new Date(w.completed_at || w.date);
-        workoutDate.setHours(0, 0, 0, 0);
-        return workoutDate.getTime() === currentDate.getTime();
-      });
-      
-      // Count workouts on this day
-      const workoutCount = completedWorkouts.filter(w => {
-        const workoutDate = new Date(w.completed_at || w.date);
-        workoutDate.setHours(0, 0, 0, 0);
-        return workoutDate.getTime() === currentDate.getTime();
-      }).length;
+      const workoutCount = getWorkoutCount(currentDate);
+      const hasWorkout = workoutCount > 0;
       
       days.push({
         date: new Date(currentDate),
@@ -221,7 +180,7 @@ const Analytics = () => {
           <div className="stat-card">
             <div className="stat-icon">✅</div>
             <div className="stat-content">
-              <div className="stat-value">{completedWorkouts.length}</div>
+              <div className="stat-value">{completedCount}</div>
               <div className="stat-label">Completed</div>
             </div>
           </div>
@@ -229,7 +188,7 @@ const Analytics = () => {
           <div className="stat-card">
             <div className="stat-icon">⏳</div>
             <div className="stat-content">
-              <div className="stat-value">{activeWorkouts.length}</div>
+              <div className="stat-value">{inProgressCount}</div>
               <div className="stat-label">In Progress</div>
             </div>
           </div>
@@ -294,6 +253,9 @@ const Analytics = () => {
         {/* Workout Activity Calendar */}
         <div className="activity-calendar card">
           <h3>Workout Activity</h3>
+          <p className="calendar-streaks">
+            Current streak: <strong>{currentStreak}</strong> day{currentStreak !== 1 ? 's' : ''} · Longest: <strong>{longestStreak}</strong> day{longestStreak !== 1 ? 's' : ''}
+          </p>
           <div className="calendar-legend">
             <span>Less</span>
             <div className="legend-item level-0"></div>
@@ -358,7 +320,7 @@ const Analytics = () => {
           <div className="insights-section">
             <div className="insight-card card">
               <h3>🎯 Your Progress</h3>
-              <p>You've completed <strong>{completedWorkouts.length}</strong> workouts with a total volume of <strong>{totalVolume.toFixed(0)} kg</strong>.</p>
+              <p>You've completed <strong>{completedCount}</strong> workouts with a total volume of <strong>{totalVolume.toFixed(0)} kg</strong>.</p>
               <p>Keep up the great work! You're averaging <strong>{avgExercises}</strong> exercises per workout.</p>
             </div>
           </div>
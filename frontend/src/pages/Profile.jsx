@@ -6,7 +6,7 @@ import { userAPI } from '../services/api';
 import './Profile.css';
 
 const Profile = () => {
-  const { user, logout } = useAuth();
+  const { user, login, logout } = useAuth();
   const navigate = useNavigate();
   const [editing, setEditing] = useState(false);
   const [username, setUsername] = useState(user?.username || '');
@@ -117,6 +117,11 @@ const Profile = () => {
       }
 
       await userAPI.updateUser(updateData);
+      
+      // Changing the password revokes existing tokens, so sign in again with it
+      if (updateData.password) {
+        await login(updateData.username || user.username, updateData.password);
+      }
       setSuccess('Profile updated successfully!');
       setEditing(false);
       setPassword('');
@@ -23,12 +23,44 @@ api.interceptors.request.use(
   }
 );
 
-// Handle 401 errors
+// Exchange the stored refresh token for new tokens (shared by concurrent 401s)
+let refreshPromise = null;
+const refreshTokens = () => {
+  if (!refreshPromise) {
+    const refreshToken = localStorage.getItem('refreshToken');
+    refreshPromise = axios
+      .post(`${API_BASE_URL}/api/auth/refresh`, { refresh_token: refreshToken })
+      .then((response) => {
+        localStorage.setItem('token', response.data.access_token);
+        localStorage.setItem('refreshToken', response.data.refresh_token);
+        return response.data.access_token;
+      })
+      .finally(() => {
+        refreshPromise = null;
+      });
+  }
+  return refreshPromise;
+};
+
+// Handle 401 errors: renew the access token once, otherwise log out
 api.interceptors.response.use(
   (response) => response,
-  (error) => {
-    if (error.response?.status === 401) {
+  async (error) => {
+    const original = error.config;
+    const isAuthCall = original?.url?.startsWith('/api/auth/');
+    if (error.response?.status === 401 && !isAuthCall && !original._retried && localStorage.getItem('refreshToken')) {
+      original._retried = true;
+      try {
+        const token = await refreshTokens();
+        original.headers.Authorization = `Bearer ${token}`;
+        return api(original);
+      } catch (refreshError) {
+        // Fall through to logout
+      }
+    }
+    if (error.response?.status === 401 && !isAuthCall) {
       localStorage.removeItem('token');
+      localStorage.removeItem('refreshToken');
       localStorage.removeItem('user');
       window.location.href = '/login';
     }
@@ -42,6 +74,9 @@ export const authAPI = {
   login: (credentials) => api.post('/api/auth/login', credentials, {
     headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
   }),
+  logout: (accessToken, refreshToken) => api.post('/api/auth/logout', { refresh_token: refreshToken }, {
+    headers: { Authorization: `Bearer ${accessToken}` },
+  }),
 };
 
 // User endpoints
@@ -55,6 +90,8 @@ export const userAPI = {
 export const workoutAPI = {
   getWorkouts: (skip = 0, limit = 100) => 
     api.get(`/api/workouts?skip=${skip}&limit=${limit}`),
+  getWorkoutSummaries: (skip = 0, limit = 100) => 
+    api.get(`/api/workouts/summary?skip=${skip}&limit=${limit}`),
   getWorkout: (id) => api.get(`/api/workouts/${id}`),
   createWorkout: (workoutData) => api.post('/api/workouts', workoutData),
   updateWorkout: (id, workoutData) => api.put(`/api/workouts/${id}`, workoutData),
@@ -62,12 +99,22 @@ export const workoutAPI = {
   addExercise: (workoutId, exerciseData) => 
     api.post(`/api/workouts/${workoutId}/exercises`, exerciseData),
   deleteExercise: (exerciseId) => api.delete(`/api/workouts/exercises/${exerciseId}`),
+  renameExercise: (exerciseId, name) => api.patch(`/api/workouts/exercises/${exerciseId}`, { name }),
+  addSet: (exerciseId, setData) => api.post(`/api/workouts/exercises/${exerciseId}/sets`, setData),
+  updateSet: (setId, setData) => api.patch(`/api/workouts/sets/${setId}`, setData),
+  deleteSet: (setId) => api.delete(`/api/workouts/sets/${setId}`),
   toggleExerciseComplete: (workoutId, exerciseId) => 
     api.patch(`/api/workouts/${workoutId}/exercises/${exerciseId}/complete`),
   markWorkoutComplete: (workoutId) => 
     api.patch(`/api/workouts/${workoutId}/complete`),
 };
 
+// Analytics endpoints
+export const analyticsAPI = {
+  getSummary: (range = 'all') => api.get(`/api/analytics/summary?range=${range}`),
+  getCalendar: (year) => api.get(`/api/analytics/calendar?year=${year}`),
+};
+
 // Sleep tracking endpoints
 export const sleepAPI = {
   getSleepLogs: (skip = 0, limit = 30) => 
@@ -75,6 +122,8 @@ export const sleepAPI = {
   getSleepLog: (id) => api.get(`/api/tracking/sleep/${id}`),
   createSleepLog: (data) => api.post('/api/tracking/sleep', data),
   updateSleepLog: (id, data) => api.put(`/api/tracking/sleep/${id}`, data),
+  // Create or replace the log for a date (YYYY-MM-DD)
+  putSleepLogForDate: (date, data) => api.put(`/api/tracking/sleep/by-date/${date}`, data),
   deleteSleepLog: (id) => api.delete(`/api/tracking/sleep/${id}`),
 };
 
@@ -85,6 +134,8 @@ export const nutritionAPI = {
   getNutritionLog: (id) => api.get(`/api/tracking/nutrition/${id}`),
   createNutritionLog: (data) => api.post('/api/tracking/nutrition', data),
   updateNutritionLog: (id, data) => api.put(`/api/tracking/nutrition/${id}`, data),
+  // Create or replace the log for a date (YYYY-MM-DD)
+  putNutritionLogForDate: (date, data) => api.put(`/api/tracking/nutrition/by-date/${date}`, data),
   deleteNutritionLog: (id) => api.delete(`/api/tracking/nutrition/${id}`),
 };
 
@@ -0,0 +1,68 @@
+"""
+Benchmark password hashing on this host and suggest hasher parameters.
+
+Raises the cost of the chosen hasher until one verification takes at
+least the target time, then prints the settings to put in the
+environment. Existing hashes are upgraded on each user's next login.
+
+Usage: python scripts/calibrate_password_hasher.py [pbkdf2_sha256|scrypt] [target_ms]
+"""
+
+import sys
+import time
+
+from app.services.hashers import PBKDF2SHA256Hasher, ScryptHasher
+
+
+# Number of timed verifications per candidate (the fastest one is used)
+ROUNDS = 3
+
+
+def time_verify(hasher) -> float:
+    """Return the fastest of ROUNDS verifications, in milliseconds."""
+    encoded = hasher.encode("calibration-password")
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        hasher.verify("calibration-password", encoded)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def calibrate_pbkdf2(target_ms: float) -> tuple:
+    """PBKDF2 cost is linear in iterations, so scale from one measurement."""
+    sample = 100000
+    elapsed = time_verify(PBKDF2SHA256Hasher(iterations=sample))
+    iterations = max(sample, int(sample * target_ms / elapsed) // 1000 * 1000)
+    elapsed = time_verify(PBKDF2SHA256Hasher(iterations=iterations))
+    return {"PASSWORD_HASHER": "pbkdf2_sha256", "PBKDF2_ITERATIONS": iterations}, elapsed
+
+
+def calibrate_scrypt(target_ms: float) -> tuple:
+    """scrypt's N must be a power of two, so double it until the target is met."""
+    n = 2 ** 14
+    elapsed = time_verify(ScryptHasher(n=n))
+    while elapsed < target_ms and n < 2 ** 20:
+        n *= 2
+        elapsed = time_verify(ScryptHasher(n=n))
+    return {"PASSWORD_HASHER": "scrypt", "SCRYPT_N": n, "SCRYPT_R": 8, "SCRYPT_P": 1}, elapsed
+
+
+def main():
+    algorithm = sys.argv[1] if len(sys.argv) > 1 else "pbkdf2_sha256"
+    target_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 100.0
+    
+    calibrators = {"pbkdf2_sha256": calibrate_pbkdf2, "scrypt": calibrate_scrypt}
+    if algorithm not in calibrators:
+        print(f"❌ Unknown hasher {algorithm!r}, expected one of: {', '.join(calibrators)}")
+        sys.exit(1)
+    
+    print(f"Calibrating {algorithm} for ~{target_ms:.0f} ms per verification...")
+    params, elapsed = calibrators[algorithm](target_ms)
+    print(f"✓ One verification takes {elapsed:.0f} ms with:")
+    for name, value in params.items():
+        print(f"{name}={value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ from datetime import datetime, timedelta
 from app.db.database import SessionLocal
 from app.db.models import User, WorkoutSession, Exercise, WorkoutSet, SleepLog, NutritionLog
 from app.services.auth import hash_password
+from app.services.catalog import resolve_exercises
+from app.services.daily_stats import rebuild_daily_stats
+from app.services.records import rebuild_personal_records
 import random
 
 def create_demo_user():
@@ -101,6 +104,12 @@ def create_demo_user():
             }
         ]
         
+        catalog = resolve_exercises(db, [
+            ex_template["name"]
+            for template in workout_templates
+            for ex_template in template["exercises"]
+        ])
+        
         workout_count = 0
         completed_count = 0
         
@@ -129,6 +138,7 @@ def create_demo_user():
                 exercise = Exercise(
                     name=ex_template["name"],
                     session_id=workout.id,
+                    catalog_id=catalog[ex_template["name"]][0],
                     is_completed=days_ago > 0
                 )
                 db.add(exercise)
@@ -156,6 +166,10 @@ def create_demo_user():
         
         print(f"✓ Created {workout_count} workouts ({completed_count} completed, {workout_count - completed_count} in progress)")
         
+        # Workouts were inserted directly, so derive the analytics tables from them
+        rebuild_daily_stats(db, user_id=demo_user.id)
+        rebuild_personal_records(db, user_id=demo_user.id)
+        
         # Create sleep logs for the last 45 days
         sleep_count = 0
         for days_ago in range(45, -1, -1):
@@ -0,0 +1,29 @@
+"""
+Delete expired refresh tokens and access token revocations.
+
+Revocations are only needed until the revoked token would have expired
+anyway, so this keeps the revocation list each process loads small.
+Run it periodically (e.g. daily from cron).
+
+Usage: python scripts/purge_expired_tokens.py
+"""
+
+from app.db.database import SessionLocal
+from app.services.tokens import purge_expired_tokens
+
+
+def main():
+    db = SessionLocal()
+    try:
+        deleted = purge_expired_tokens(db)
+        print(f"✓ Deleted {deleted} expired token rows")
+    except Exception as e:
+        print(f"❌ Error purging tokens: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Rebuild the user_daily_stats rollup from workout data.
+
+Use it to backfill the rollup after deploying it on an existing database,
+or to repair it after data was written outside the API.
+
+Usage: python scripts/rebuild_daily_stats.py [user_id]
+"""
+
+import sys
+
+from app.db.database import SessionLocal
+from app.services.daily_stats import rebuild_daily_stats
+
+
+def main():
+    user_id = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    
+    db = SessionLocal()
+    try:
+        rows = rebuild_daily_stats(db, user_id=user_id)
+        scope = f"user {user_id}" if user_id is not None else "all users"
+        print(f"✓ Rebuilt {rows} daily stats rows for {scope}")
+    except Exception as e:
+        print(f"❌ Error rebuilding daily stats: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
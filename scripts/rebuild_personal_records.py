@@ -0,0 +1,33 @@
+"""
+Rebuild the personal_records table from workout data.
+
+Use it to backfill records after deploying them on an existing database,
+or to repair them after data was written outside the API.
+
+Usage: python scripts/rebuild_personal_records.py [user_id]
+"""
+
+import sys
+
+from app.db.database import SessionLocal
+from app.services.records import rebuild_personal_records
+
+
+def main():
+    user_id = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    
+    db = SessionLocal()
+    try:
+        records = rebuild_personal_records(db, user_id=user_id)
+        scope = f"user {user_id}" if user_id is not None else "all users"
+        print(f"✓ Rebuilt {records} personal records for {scope}")
+    except Exception as e:
+        print(f"❌ Error rebuilding personal records: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
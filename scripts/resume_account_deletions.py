@@ -0,0 +1,36 @@
+"""
+Finish account deletions that did not complete.
+
+Purges run in the API process after the deletion request; if that process
+stopped mid-purge (restart, crash) or a purge failed, the job is left
+pending, running or failed. Purging is idempotent, so this simply runs each
+unfinished job again. Run it after deploys or periodically (e.g. from cron).
+
+Usage: python scripts/resume_account_deletions.py
+"""
+
+from app.db.database import SessionLocal
+from app.services.account_deletion import get_unfinished_account_deletion_jobs, purge_account
+
+
+def main():
+    db = SessionLocal()
+    try:
+        job_ids = get_unfinished_account_deletion_jobs(db)
+    finally:
+        db.close()
+
+    failed = 0
+    for job_id in job_ids:
+        try:
+            purge_account(job_id)
+            print(f"✓ Completed account deletion {job_id}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ Error purging account deletion {job_id}: {e}")
+
+    print(f"✓ Processed {len(job_ids)} unfinished account deletions ({failed} failed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,10 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.main import app
-from app.db.database import Base, get_db
-from app.services.auth import create_user
+from app.db.database import Base, enable_sqlite_foreign_keys, get_db
+from app.services.auth import create_user, password_pool, user_cache
+from app.services.catalog import clear_exercise_cache
+from app.services.tokens import revoked_access_tokens
 
 
 # Use the SAME Postgres DB but in a clean state for each test
@@ -14,6 +16,7 @@ from app.core.config import settings
 
 # Create test engine (use same DB as production for integration tests)
 engine = create_engine(settings.DATABASE_URL)
+enable_sqlite_foreign_keys(engine)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -26,20 +29,41 @@ def override_get_db():
         db.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def hash_passwords_in_threads():
+    """Hash in threads: each test client's shutdown stops the worker processes, and respawning them is slow"""
+    workers = password_pool.workers
+    password_pool.workers = 0
+    yield
+    password_pool.workers = workers
+
+
 @pytest.fixture(scope="function", autouse=True)
 def reset_db():
     """Reset database before each test"""
     # Clear all data but keep tables
-    from app.db.models import WorkoutSet, Exercise, WorkoutSession, SleepLog, NutritionLog, User
+    from app.db.models import (
+        WorkoutSet, Exercise, ExerciseAlias, ExerciseCatalog, WorkoutSession,
+        SleepLog, NutritionLog, UserDailyStats, PersonalRecord, RefreshToken,
+        RevokedToken, RevokedTokenVersion, AccountDeletionJob, User
+    )
     
     db = TestingSessionLocal()
     try:
         # Delete in correct order to respect foreign keys
+        db.query(UserDailyStats).delete()
+        db.query(PersonalRecord).delete()
         db.query(WorkoutSet).delete()
         db.query(Exercise).delete()
+        db.query(ExerciseAlias).delete()
+        db.query(ExerciseCatalog).delete()
         db.query(WorkoutSession).delete()
         db.query(SleepLog).delete()
         db.query(NutritionLog).delete()
+        db.query(RefreshToken).delete()
+        db.query(RevokedToken).delete()
+        db.query(RevokedTokenVersion).delete()
+        db.query(AccountDeletionJob).delete()
         db.query(User).delete()
         db.commit()
     except Exception as e:
@@ -47,6 +71,9 @@ def reset_db():
         print(f"Error resetting DB: {e}")
     finally:
         db.close()
+    clear_exercise_cache()
+    user_cache.clear()
+    revoked_access_tokens.clear()
     yield
 
 
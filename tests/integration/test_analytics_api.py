@@ -0,0 +1,131 @@
+from datetime import datetime
+import pytest
+from fastapi import status
+
+
+def _create_workout(client, auth_headers, title, exercises):
+    response = client.post(
+        "/api/workouts",
+        headers=auth_headers,
+        json={"title": title, "exercises": exercises}
+    )
+    return response.json()
+
+
+def test_analytics_summary(client, auth_headers):
+    """Test aggregated workout statistics"""
+    workout = _create_workout(client, auth_headers, "Push", [
+        {"name": "Bench Press", "sets": [{"reps": 10, "weight": 60.0}, {"reps": 8, "weight": 70.0}]},
+        {"name": "Dips", "sets": [{"reps": 12, "weight": 0.0}]},
+    ])
+    _create_workout(client, auth_headers, "Pull", [
+        {"name": "Row", "sets": [{"reps": 10, "weight": 50.0}]},
+    ])
+    client.patch(f"/api/workouts/{workout['id']}/complete", headers=auth_headers)
+    
+    response = client.get("/api/analytics/summary?range=week", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["range"] == "week"
+    assert data["total_workouts"] == 2
+    assert data["completed_workouts"] == 1
+    assert data["in_progress_workouts"] == 1
+    assert data["completion_rate"] == 50.0
+    assert data["total_exercises"] == 3
+    assert data["total_sets"] == 4
+    assert data["total_reps"] == 40
+    assert data["total_volume"] == 10 * 60.0 + 8 * 70.0 + 10 * 50.0
+    assert data["completed_last_7_days"] == 1
+
+
+def test_analytics_summary_empty(client, auth_headers):
+    """Test statistics for a user without workouts"""
+    response = client.get("/api/analytics/summary", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["range"] == "all"
+    assert data["total_workouts"] == 0
+    assert data["total_volume"] == 0.0
+
+
+def test_analytics_summary_invalid_range(client, auth_headers):
+    """Test statistics with an unknown time range"""
+    response = client.get("/api/analytics/summary?range=decade", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_personal_records(client, auth_headers):
+    """Test listing personal records"""
+    _create_workout(client, auth_headers, "Push", [
+        {"name": "Bench Press", "sets": [{"reps": 5, "weight": 100.0}, {"reps": 8, "weight": 90.0}]},
+        {"name": "Dips", "sets": [{"reps": 12, "weight": 10.0}]},
+    ])
+    
+    response = client.get("/api/analytics/records", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [record["exercise_name"] for record in data] == ["Bench Press", "Dips"]
+    assert data[0]["max_weight"] == 100.0
+    assert data[0]["max_weight_reps"] == 5
+    
+    response = client.get("/api/analytics/records?exercise=Dips", headers=auth_headers)
+    assert [record["exercise_name"] for record in response.json()] == ["Dips"]
+
+
+def test_exercise_progression(client, auth_headers):
+    """Test per-workout progression for one exercise"""
+    _create_workout(client, auth_headers, "Push", [
+        {"name": "Bench Press", "sets": [{"reps": 10, "weight": 60.0}, {"reps": 1, "weight": 80.0}]},
+        {"name": "Dips", "sets": [{"reps": 12, "weight": 0.0}]},
+    ])
+    _create_workout(client, auth_headers, "Push", [
+        {"name": "bench  press", "sets": [{"reps": 5, "weight": 85.0}]},
+    ])
+    
+    response = client.get("/api/analytics/exercises/BENCH PRESS/progression", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["exercise_name"] == "Bench Press"
+    assert data["total_points"] == 2
+    first, second = data["points"]
+    assert first["top_set_weight"] == 80.0
+    assert first["volume"] == 10 * 60.0 + 80.0
+    assert first["estimated_1rm"] == pytest.approx(80.0)
+    assert second["estimated_1rm"] == pytest.approx(85.0 * (1 + 5 / 30))
+
+
+def test_exercise_progression_unknown(client, auth_headers):
+    """Test progression for an exercise that was never logged"""
+    response = client.get("/api/analytics/exercises/Snatch/progression", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_training_calendar(client, auth_headers):
+    """Test per-day completed workout counts follow completion changes"""
+    workout = _create_workout(client, auth_headers, "Push", [
+        {"name": "Bench Press", "sets": [{"reps": 10, "weight": 60.0}]},
+    ])
+    client.patch(f"/api/workouts/{workout['id']}/complete", headers=auth_headers)
+    day = datetime.fromisoformat(workout["date"]).date()
+    
+    response = client.get(f"/api/analytics/calendar?year={day.year}", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data["counts"]) in (365, 366)
+    assert data["counts"][day.timetuple().tm_yday - 1] == 1
+    assert sum(data["counts"]) == 1
+    assert data["current_streak"] == 1
+    assert data["longest_streak"] == 1
+    
+    exercise_id = workout["exercises"][0]["id"]
+    client.patch(f"/api/workouts/{workout['id']}/exercises/{exercise_id}/complete", headers=auth_headers)
+    
+    response = client.get(f"/api/analytics/calendar?year={day.year}", headers=auth_headers)
+    assert sum(response.json()["counts"]) == 0
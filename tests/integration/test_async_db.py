@@ -0,0 +1,151 @@
+import pytest
+from fastapi import status
+
+from app.core.config import settings
+from app.db.async_database import get_async_engine, get_async_sessionmaker, to_async_url
+
+
+@pytest.fixture
+def async_db(monkeypatch):
+    """Serve service calls through the async engine for one test"""
+    monkeypatch.setattr(settings, "DB_ASYNC", True)
+    yield
+    # The engine's connections belong to the test client's event loop
+    get_async_engine().sync_engine.dispose()
+    get_async_engine.cache_clear()
+    get_async_sessionmaker.cache_clear()
+
+
+def test_to_async_url():
+    """Test sync URLs are mapped to async drivers"""
+    assert to_async_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert to_async_url("sqlite:////tmp/app.db") == "sqlite+aiosqlite:////tmp/app.db"
+
+
+def test_workouts_with_async_engine(client, auth_headers, async_db):
+    """Test the workout endpoints work end to end on the async engine"""
+    response = client.post(
+        "/api/workouts",
+        headers=auth_headers,
+        json={"title": "Push", "exercises": [
+            {"name": "Bench Press", "sets": [{"reps": 5, "weight": 100.0}]}
+        ]}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    workout = response.json()
+    assert workout["exercises"][0]["sets"][0]["weight"] == 100.0
+    
+    response = client.get("/api/workouts", headers=auth_headers)
+    assert [w["id"] for w in response.json()] == [workout["id"]]
+    
+    response = client.get("/api/workouts/summary", headers=auth_headers)
+    assert response.json()[0]["set_count"] == 1
+    
+    response = client.delete(f"/api/workouts/{workout['id']}", headers=auth_headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    
+    response = client.get("/api/analytics/summary", headers=auth_headers)
+    assert response.json()["total_workouts"] == 0
+
+
+def test_analytics_with_async_engine(client, auth_headers, async_db):
+    """Test the analytics endpoints work end to end on the async engine"""
+    client.post(
+        "/api/workouts",
+        headers=auth_headers,
+        json={"title": "Legs", "exercises": [
+            {"name": "Squat", "sets": [{"reps": 5, "weight": 120.0}]}
+        ]}
+    )
+    
+    response = client.get("/api/analytics/records?exercise=squat", headers=auth_headers)
+    assert response.json()[0]["max_weight"] == 120.0
+    
+    response = client.get("/api/analytics/exercises/Squat/progression", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["exercise_name"] == "Squat"
+    
+    response = client.get("/api/analytics/calendar", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_tracking_upserts_with_async_engine(client, auth_headers, async_db):
+    """Test creating and replacing daily logs on the async engine"""
+    response = client.post(
+        "/api/tracking/sleep", headers=auth_headers, json={"date": "2024-01-15", "hours": 7, "quality": 3}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    
+    response = client.put(
+        "/api/tracking/sleep/by-date/2024-01-15", headers=auth_headers, json={"hours": 8, "quality": 4}
+    )
+    assert response.json()["hours"] == 8
+    
+    response = client.put(
+        "/api/tracking/nutrition/by-date/2024-01-15", headers=auth_headers, json={"calories": 2200, "protein": 140}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_tracking_crud_with_async_engine(client, auth_headers, async_db):
+    """Test listing, updating and deleting daily logs on the async engine"""
+    log = client.post(
+        "/api/tracking/nutrition",
+        headers=auth_headers,
+        json={"date": "2024-01-15", "calories": 2000, "protein": 120}
+    ).json()
+    
+    response = client.get("/api/tracking/nutrition", headers=auth_headers)
+    assert [row["id"] for row in response.json()] == [log["id"]]
+    
+    response = client.put(f"/api/tracking/nutrition/{log['id']}", headers=auth_headers, json={"calories": 2400})
+    assert response.json()["calories"] == 2400
+    
+    response = client.delete(f"/api/tracking/nutrition/{log['id']}", headers=auth_headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    response = client.get(f"/api/tracking/nutrition/{log['id']}", headers=auth_headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_dashboard_with_async_engine(client, auth_headers, async_db):
+    """Test the dashboard works end to end on the async engine"""
+    response = client.get("/api/dashboard", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["user"]["username"] == "testuser"
+
+
+def test_login_with_async_engine(client, test_user, async_db):
+    """Test authentication on the async engine"""
+    response = client.post(
+        "/api/auth/login",
+        data={"username": "testuser", "password": "testpassword123"}
+    )
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert "access_token" in response.json()
+
+
+def test_metrics_report_connection_pools(client, auth_headers, async_db, monkeypatch):
+    """Test /metrics reports the sync and async connection pools"""
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-token")
+    client.get("/api/workouts", headers=auth_headers)
+    
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["db_pool"]["pool_size"] == settings.DB_POOL_SIZE
+    assert data["async_db_pool"]["checkouts"] >= 1
+    assert data["async_db_pool"]["checked_out"] == 0
+
+
+def test_metrics_require_token(client, monkeypatch):
+    """Test /metrics is hidden without METRICS_TOKEN and rejects a wrong token"""
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+    assert client.get("/metrics").status_code == status.HTTP_404_NOT_FOUND
+    
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-token")
+    assert client.get("/metrics").status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.get("/metrics", headers={"Authorization": "Bearer wrong"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
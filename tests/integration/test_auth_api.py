@@ -1,5 +1,7 @@
 import pytest
+from datetime import timedelta
 from fastapi import status
+from app.services.auth import create_access_token
 
 
 def test_register_user(client):
@@ -90,3 +92,91 @@ def test_login_nonexistent_user(client):
     )
     
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_login_rejected_when_hashing_pool_full(client, test_user, monkeypatch):
+    """Test logins are shed with 503 when the hashing queue is full"""
+    from app.services.auth import password_pool
+    monkeypatch.setattr(password_pool, "max_pending", 0)
+    
+    response = client.post(
+        "/api/auth/login",
+        data={"username": "testuser", "password": "testpassword123"}
+    )
+    
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+
+
+def _login(client):
+    response = client.post(
+        "/api/auth/login",
+        data={"username": "testuser", "password": "testpassword123"}
+    )
+    return response.json()
+
+
+def test_refresh_token_rotation(client, test_user):
+    """Test refresh tokens issue new tokens and can only be used once"""
+    tokens = _login(client)
+    assert tokens["refresh_token"]
+    
+    response = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == status.HTTP_200_OK
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    
+    headers = {"Authorization": f"Bearer {rotated['access_token']}"}
+    assert client.get("/api/users/me", headers=headers).status_code == status.HTTP_200_OK
+    
+    # Reusing a rotated token revokes the whole chain
+    response = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.post("/api/auth/refresh", json={"refresh_token": rotated["refresh_token"]})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_refresh_invalid_token(client):
+    """Test refreshing with an unknown token"""
+    response = client.post("/api/auth/refresh", json={"refresh_token": "not-a-token"})
+    
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_logout_revokes_tokens(client, test_user):
+    """Test logout revokes the access token and its refresh token"""
+    tokens = _login(client)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    
+    response = client.post(
+        "/api/auth/logout",
+        headers=headers,
+        json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    
+    assert client.get("/api/workouts", headers=headers).status_code == status.HTTP_401_UNAUTHORIZED
+    assert client.get("/api/users/me", headers=headers).status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    # Other sessions are unaffected
+    other = _login(client)
+    headers = {"Authorization": f"Bearer {other['access_token']}"}
+    assert client.get("/api/workouts", headers=headers).status_code == status.HTTP_200_OK
+
+
+def test_logout_with_expired_access_token(client, test_user):
+    """Test logout still revokes the refresh token once the access token has expired"""
+    tokens = _login(client)
+    expired = create_access_token({"sub": "testuser"}, expires_delta=timedelta(minutes=-1))
+    
+    response = client.post(
+        "/api/auth/logout",
+        headers={"Authorization": f"Bearer {expired}"},
+        json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    
+    response = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,49 @@
+from datetime import date, timedelta
+from fastapi import status
+
+
+def test_dashboard(client, auth_headers):
+    """Test the combined dashboard response"""
+    for title in ["Push", "Pull", "Legs"]:
+        client.post(
+            "/api/workouts",
+            headers=auth_headers,
+            json={"title": title, "exercises": [
+                {"name": "Squat", "sets": [{"reps": 5, "weight": 100.0}]}
+            ]}
+        )
+    today = date.today()
+    client.post(
+        "/api/tracking/sleep",
+        headers=auth_headers,
+        json={"date": today.isoformat(), "hours": 8, "quality": 4}
+    )
+    client.post(
+        "/api/tracking/sleep",
+        headers=auth_headers,
+        json={"date": (today - timedelta(days=30)).isoformat(), "hours": 6, "quality": 2}
+    )
+    client.post(
+        "/api/tracking/nutrition",
+        headers=auth_headers,
+        json={"date": today.isoformat(), "calories": 2500, "protein": 150}
+    )
+    
+    response = client.get("/api/dashboard?workouts=2", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["user"]["username"] == "testuser"
+    assert [workout["title"] for workout in data["recent_workouts"]] == ["Legs", "Pull"]
+    assert data["recent_workouts"][0]["set_count"] == 1
+    assert len(data["sleep_logs"]) == 1
+    assert len(data["nutrition_logs"]) == 1
+    assert data["stats"]["range"] == "week"
+    assert data["stats"]["total_workouts"] == 3
+
+
+def test_dashboard_unauthorized(client):
+    """Test the dashboard requires authentication"""
+    response = client.get("/api/dashboard")
+    
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
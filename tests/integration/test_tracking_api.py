@@ -0,0 +1,117 @@
+import pytest
+from fastapi import status
+
+
+def test_create_sleep_log(client, auth_headers):
+    """Test creating a sleep log"""
+    response = client.post(
+        "/api/tracking/sleep",
+        headers=auth_headers,
+        json={"date": "2024-01-15", "hours": 7.5, "quality": 4}
+    )
+    
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert data["date"] == "2024-01-15"
+    assert data["hours"] == 7.5
+
+
+def test_create_duplicate_sleep_log(client, auth_headers):
+    """Test creating two sleep logs for the same date"""
+    payload = {"date": "2024-01-15", "hours": 7.5, "quality": 4}
+    client.post("/api/tracking/sleep", headers=auth_headers, json=payload)
+    
+    response = client.post("/api/tracking/sleep", headers=auth_headers, json=payload)
+    
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_put_sleep_log_by_date(client, auth_headers):
+    """Test PUT by date creates the day's sleep log, then replaces it in place"""
+    url = "/api/tracking/sleep/by-date/2024-01-15"
+    created = client.put(url, headers=auth_headers, json={"hours": 6, "quality": 2, "notes": "late"})
+    assert created.status_code == status.HTTP_200_OK
+    
+    replaced = client.put(url, headers=auth_headers, json={"hours": 8, "quality": 5})
+    
+    data = replaced.json()
+    assert data["id"] == created.json()["id"]
+    assert data["date"] == "2024-01-15"
+    assert data["hours"] == 8
+    assert data["notes"] is None
+    logs = client.get("/api/tracking/sleep", headers=auth_headers).json()
+    assert len(logs) == 1
+
+
+def test_sleep_logs_cursor_pagination(client, auth_headers):
+    """Test paging through sleep logs with keyset cursors"""
+    for day in range(1, 6):
+        client.post(
+            "/api/tracking/sleep",
+            headers=auth_headers,
+            json={"date": f"2024-01-0{day}", "hours": 8, "quality": 3}
+        )
+    
+    first_page = client.get("/api/tracking/sleep?limit=3", headers=auth_headers)
+    cursor = first_page.headers["X-Next-Cursor"]
+    second_page = client.get(
+        f"/api/tracking/sleep?limit=3&cursor={cursor}",
+        headers=auth_headers
+    )
+    
+    dates = [log["date"] for log in first_page.json() + second_page.json()]
+    assert dates == ["2024-01-05", "2024-01-04", "2024-01-03", "2024-01-02", "2024-01-01"]
+    assert "X-Next-Cursor" not in second_page.headers
+
+
+def test_tracking_page_size_is_bounded(client, auth_headers):
+    """Test oversized or negative page parameters are rejected"""
+    for path in ("/api/tracking/sleep", "/api/tracking/nutrition"):
+        assert client.get(f"{path}?limit=1000000", headers=auth_headers).status_code == 422
+        assert client.get(f"{path}?limit=0", headers=auth_headers).status_code == 422
+        assert client.get(f"{path}?skip=-1", headers=auth_headers).status_code == 422
+        assert client.get(f"{path}?limit=100", headers=auth_headers).status_code == status.HTTP_200_OK
+
+
+def test_create_nutrition_log(client, auth_headers):
+    """Test creating a nutrition log"""
+    response = client.post(
+        "/api/tracking/nutrition",
+        headers=auth_headers,
+        json={"date": "2024-01-15", "calories": 2500, "protein": 150.0}
+    )
+    
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["calories"] == 2500
+
+
+def test_nutrition_logs_cursor_pagination(client, auth_headers):
+    """Test paging through nutrition logs with keyset cursors"""
+    for day in range(1, 4):
+        client.post(
+            "/api/tracking/nutrition",
+            headers=auth_headers,
+            json={"date": f"2024-01-0{day}", "calories": 2000, "protein": 120.0}
+        )
+    
+    first_page = client.get("/api/tracking/nutrition?limit=2", headers=auth_headers)
+    cursor = first_page.headers["X-Next-Cursor"]
+    second_page = client.get(
+        f"/api/tracking/nutrition?limit=2&cursor={cursor}",
+        headers=auth_headers
+    )
+    
+    assert [log["date"] for log in second_page.json()] == ["2024-01-01"]
+
+
+def test_put_nutrition_log_by_date(client, auth_headers):
+    """Test PUT by date upserts the day's nutrition log"""
+    url = "/api/tracking/nutrition/by-date/2024-01-15"
+    client.put(url, headers=auth_headers, json={"calories": 1800, "protein": 120})
+    
+    response = client.put(url, headers=auth_headers, json={"calories": 2400, "protein": 160, "water": 2.5})
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["calories"] == 2400
+    logs = client.get("/api/tracking/nutrition", headers=auth_headers).json()
+    assert [(log["date"], log["water"]) for log in logs] == [("2024-01-15", 2.5)]
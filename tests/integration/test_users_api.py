@@ -1,5 +1,6 @@
 import pytest
 from fastapi import status
+from app.services.account_deletion import purge_account
 
 
 def test_get_current_user(client, auth_headers):
@@ -35,10 +36,99 @@ def test_update_user(client, auth_headers):
 
 def test_delete_user(client, auth_headers):
     """Test deleting user account"""
+    client.post(
+        "/api/workouts",
+        headers=auth_headers,
+        json={"title": "Push", "exercises": [{"name": "Bench Press", "sets": [{"reps": 5, "weight": 80.0}]}]}
+    )
+    client.post("/api/tracking/sleep", headers=auth_headers, json={"date": "2024-01-15", "hours": 8, "quality": 4})
+    
     response = client.delete("/api/users/me", headers=auth_headers)
     
-    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    job = response.json()
+    assert response.headers["Location"] == f"/api/users/deletion-jobs/{job['id']}"
     
-    # Verify user can no longer access protected routes
+    # Verify user can no longer access protected routes or log in
     response = client.get("/api/users/me", headers=auth_headers)
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.get("/api/workouts", headers=auth_headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.post("/api/auth/login", data={"username": "testuser", "password": "testpassword123"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    # The test client runs the background purge before returning
+    job = client.get(f"/api/users/deletion-jobs/{job['id']}").json()
+    assert job["status"] == "completed"
+    assert job["rows_deleted"] >= 5  # workout, sleep log, rollup, record, user
+    assert job["finished_at"] is not None
+
+
+def test_delete_user_revokes_other_sessions(client, auth_headers, monkeypatch):
+    """Test deleting the account rejects tokens from other logins, during and after the purge"""
+    response = client.post("/api/auth/login", data={"username": "testuser", "password": "testpassword123"})
+    other_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    
+    # Keep the purge pending
+    monkeypatch.setattr("app.api.routers.users.purge_account", lambda job_id: None)
+    job = client.delete("/api/users/me", headers=auth_headers).json()
+    
+    response = client.get("/api/workouts", headers=other_headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.post("/api/workouts", headers=other_headers, json={"title": "Push"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    monkeypatch.undo()
+    purge_account(job["id"])
+    
+    response = client.post("/api/workouts", headers=other_headers, json={"title": "Push"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.post(
+        "/api/tracking/sleep", headers=other_headers, json={"date": "2024-01-15", "hours": 8, "quality": 4}
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_update_user_refreshes_cached_user(client, auth_headers):
+    """Test profile changes are visible on the next request despite the user cache"""
+    client.get("/api/users/me", headers=auth_headers)
+    
+    client.put("/api/users/me", headers=auth_headers, json={"fitness_goal": "Strength"})
+    response = client.get("/api/users/me", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["fitness_goal"] == "Strength"
+
+
+def test_token_survives_username_change(client, auth_headers):
+    """Test tokens identify the user by ID, not by username"""
+    client.put("/api/users/me", headers=auth_headers, json={"username": "renamed"})
+    
+    response = client.get("/api/users/me", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["username"] == "renamed"
+
+
+def test_password_change_revokes_tokens(client, auth_headers):
+    """Test changing the password invalidates previously issued tokens"""
+    client.put("/api/users/me", headers=auth_headers, json={"password": "newpassword123"})
+    
+    response = client.get("/api/users/me", headers=auth_headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    # Endpoints that trust token claims reject the old token as well
+    response = client.get("/api/workouts", headers=auth_headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.post("/api/workouts", headers=auth_headers, json={"title": "Stale"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    response = client.post(
+        "/api/auth/login",
+        data={"username": "testuser", "password": "newpassword123"}
+    )
+    token = response.json()["access_token"]
+    response = client.get("/api/users/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == status.HTTP_200_OK
+    response = client.get("/api/workouts", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == status.HTTP_200_OK
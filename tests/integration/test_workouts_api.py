@@ -194,3 +194,207 @@ def test_delete_exercise(client, auth_headers):
     response = client.delete(f"/api/workouts/exercises/{exercise_id}", headers=auth_headers)
     
     assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+def test_list_workout_summaries(client, auth_headers):
+    """Test listing workouts in summary mode"""
+    client.post(
+        "/api/workouts",
+        headers=auth_headers,
+        json={
+            "title": "Summary Workout",
+            "exercises": [
+                {
+                    "name": "Bench Press",
+                    "sets": [
+                        {"reps": 10, "weight": 60.0},
+                        {"reps": 8, "weight": 65.0}
+                    ]
+                },
+                {"name": "Plank", "sets": []}
+            ]
+        }
+    )
+    
+    response = client.get("/api/workouts/summary", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["title"] == "Summary Workout"
+    assert data[0]["exercise_count"] == 2
+    assert data[0]["set_count"] == 2
+    assert data[0]["total_volume"] == 10 * 60.0 + 8 * 65.0
+    assert "exercises" not in data[0]
+
+
+def test_list_workouts_cursor_pagination(client, auth_headers):
+    """Test paging through workouts with keyset cursors"""
+    for i in range(5):
+        client.post(
+            "/api/workouts",
+            headers=auth_headers,
+            json={"title": f"Workout {i}", "exercises": []}
+        )
+    
+    seen = []
+    response = client.get("/api/workouts?limit=2", headers=auth_headers)
+    for _ in range(3):
+        assert response.status_code == status.HTTP_200_OK
+        seen.extend(workout["id"] for workout in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        response = client.get(
+            f"/api/workouts?limit=2&cursor={cursor}",
+            headers=auth_headers
+        )
+    
+    assert cursor is None
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+def test_list_workouts_invalid_cursor(client, auth_headers):
+    """Test listing workouts with a malformed cursor"""
+    response = client.get("/api/workouts?cursor=garbage", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_toggle_exercise_completion(client, auth_headers):
+    """Test the workout completes with its last exercise and reopens when one is undone"""
+    workout = client.post(
+        "/api/workouts",
+        headers=auth_headers,
+        json={"title": "Legs", "exercises": [
+            {"name": "Squat", "sets": [{"reps": 5, "weight": 100.0}]},
+            {"name": "Lunge", "sets": [{"reps": 10, "weight": 20.0}]}
+        ]}
+    ).json()
+    first, second = (exercise["id"] for exercise in workout["exercises"])
+    url = f"/api/workouts/{workout['id']}/exercises/{{}}/complete"
+    
+    response = client.patch(url.format(first), headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["is_completed"] is False
+    
+    data = client.patch(url.format(second), headers=auth_headers).json()
+    assert data["is_completed"] is True
+    assert data["completed_at"] is not None
+    assert client.get("/api/analytics/summary", headers=auth_headers).json()["completed_workouts"] == 1
+    
+    data = client.patch(url.format(first), headers=auth_headers).json()
+    assert data["is_completed"] is False
+    assert data["completed_at"] is None
+    assert [exercise["is_completed"] for exercise in data["exercises"]] == [False, True]
+    assert client.get("/api/analytics/summary", headers=auth_headers).json()["completed_workouts"] == 0
+
+
+def test_toggle_exercise_in_other_workout(client, auth_headers):
+    """Test an exercise cannot be toggled through a workout it does not belong to"""
+    workouts = [
+        client.post(
+            "/api/workouts",
+            headers=auth_headers,
+            json={"title": title, "exercises": [{"name": "Row", "sets": []}]}
+        ).json()
+        for title in ("A", "B")
+    ]
+    exercise_id = workouts[1]["exercises"][0]["id"]
+    
+    response = client.patch(
+        f"/api/workouts/{workouts[0]['id']}/exercises/{exercise_id}/complete",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_mark_workout_complete(client, auth_headers):
+    """Test completing a workout completes every exercise and counts it once"""
+    workout = client.post(
+        "/api/workouts",
+        headers=auth_headers,
+        json={"title": "Pull", "exercises": [{"name": name, "sets": []} for name in ("Row", "Curl", "Shrug")]}
+    ).json()
+    url = f"/api/workouts/{workout['id']}/complete"
+    
+    data = client.patch(url, headers=auth_headers).json()
+    again = client.patch(url, headers=auth_headers).json()
+    
+    assert data["is_completed"] is True
+    assert all(exercise["is_completed"] for exercise in data["exercises"])
+    assert again["completed_at"] == data["completed_at"]
+    assert client.get("/api/analytics/summary", headers=auth_headers).json()["completed_workouts"] == 1
+    
+    response = client.patch("/api/workouts/999999/complete", headers=auth_headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def _summary_totals(client, auth_headers):
+    summary = client.get("/api/analytics/summary", headers=auth_headers).json()
+    return summary["total_sets"], summary["total_reps"], summary["total_volume"]
+
+
+def test_add_update_delete_set(client, auth_headers):
+    """Test single-set endpoints return the set and keep totals and records in step"""
+    workout = client.post(
+        "/api/workouts",
+        headers=auth_headers,
+        json={"title": "Push", "exercises": [{"name": "Bench Press", "sets": [{"reps": 5, "weight": 80.0}]}]}
+    ).json()
+    exercise_id = workout["exercises"][0]["id"]
+    
+    response = client.post(
+        f"/api/workouts/exercises/{exercise_id}/sets",
+        headers=auth_headers,
+        json={"reps": 3, "weight": 100.0}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    new_set = response.json()
+    assert new_set["exercise_id"] == exercise_id
+    assert _summary_totals(client, auth_headers) == (2, 8, 700.0)
+    records = client.get("/api/analytics/records", headers=auth_headers).json()
+    assert records[0]["max_weight"] == 100.0
+    assert records[0]["best_volume"] == 700.0
+    
+    response = client.patch(f"/api/workouts/sets/{new_set['id']}", headers=auth_headers, json={"weight": 90.0})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {**new_set, "weight": 90.0}
+    assert _summary_totals(client, auth_headers) == (2, 8, 670.0)
+    records = client.get("/api/analytics/records", headers=auth_headers).json()
+    assert records[0]["max_weight"] == 90.0
+    
+    response = client.delete(f"/api/workouts/sets/{new_set['id']}", headers=auth_headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert _summary_totals(client, auth_headers) == (1, 5, 400.0)
+    records = client.get("/api/analytics/records", headers=auth_headers).json()
+    assert records[0]["max_weight"] == 80.0
+    
+    response = client.patch(f"/api/workouts/sets/{new_set['id']}", headers=auth_headers, json={"reps": 1})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_rename_exercise_moves_records(client, auth_headers):
+    """Test renaming an exercise to another movement moves its records"""
+    workout = client.post(
+        "/api/workouts",
+        headers=auth_headers,
+        json={"title": "Legs", "exercises": [{"name": "Squat", "sets": [{"reps": 5, "weight": 120.0}]}]}
+    ).json()
+    exercise_id = workout["exercises"][0]["id"]
+    
+    response = client.patch(
+        f"/api/workouts/exercises/{exercise_id}",
+        headers=auth_headers,
+        json={"name": "Front Squat"}
+    )
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["name"] == "Front Squat"
+    assert data["catalog_id"] != workout["exercises"][0]["catalog_id"]
+    assert len(data["sets"]) == 1
+    records = client.get("/api/analytics/records", headers=auth_headers).json()
+    assert [(r["exercise_name"], r["max_weight"]) for r in records] == [("Front Squat", 120.0)]
@@ -0,0 +1,61 @@
+from datetime import date, timedelta
+
+from app.db.models import AccountDeletionJob, Exercise, SleepLog, User, WorkoutSession, WorkoutSet
+from app.schemas.workouts import ExerciseCreate, WorkoutSessionCreate, WorkoutSetCreate
+from app.services.account_deletion import purge_account, request_account_deletion
+from app.services.auth import authenticate_user, create_user
+from app.services.workouts import create_workout_session
+
+
+def test_purge_account_in_batches(db):
+    """Test a purge removes the user's rows across several batches and leaves others alone"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    other = create_user(db, "other", "other@example.com", "password123")
+    workout_data = WorkoutSessionCreate(
+        title="Legs",
+        exercises=[ExerciseCreate(name="Squat", sets=[WorkoutSetCreate(reps=5, weight=100.0)] * 3)]
+    )
+    for _ in range(5):
+        create_workout_session(db, workout_data, user.id)
+    create_workout_session(db, workout_data, other.id)
+    db.add_all(
+        SleepLog(user_id=user.id, date=date(2024, 1, 1) + timedelta(days=i), hours=8, quality=3)
+        for i in range(4)
+    )
+    db.commit()
+    user_id = user.id
+    
+    job = request_account_deletion(db, user)
+    assert job.status == "pending"
+    assert authenticate_user(db, "testuser", "password123") is None
+    
+    purge_account(job.id, batch_size=2)
+    
+    db.expire_all()
+    job = db.get(AccountDeletionJob, job.id)
+    assert job.status == "completed"
+    # 15 sets, 5 exercises, 5 workouts, 4 sleep logs, 1 rollup day, 1 record, 1 user
+    assert job.rows_deleted == 32
+    assert db.get(User, user_id) is None
+    assert db.query(WorkoutSession).count() == 1
+    assert db.query(Exercise).count() == 1
+    assert db.query(WorkoutSet).count() == 3
+    assert db.query(SleepLog).count() == 0
+
+
+def test_purge_account_failure_is_recorded(db, monkeypatch, caplog):
+    """Test a failed purge is logged and kept on the job instead of raised"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    job = request_account_deletion(db, user)
+    
+    def fail(*args, **kwargs):
+        raise RuntimeError("database went away")
+    monkeypatch.setattr("app.services.account_deletion._delete_batch", fail)
+    
+    purge_account(job.id)
+    
+    db.expire_all()
+    job = db.get(AccountDeletionJob, job.id)
+    assert job.status == "failed"
+    assert job.error == "database went away"
+    assert "database went away" in caplog.text
@@ -0,0 +1,43 @@
+from datetime import date, datetime, timezone
+from app.services.analytics import compute_streaks, get_range_start, lttb_indices
+
+
+def test_lttb_keeps_short_series():
+    """Test series within the threshold are returned unchanged"""
+    assert lttb_indices([0, 1, 2], [5, 6, 7], 10) == [0, 1, 2]
+    assert lttb_indices([], [], 10) == []
+
+
+def test_lttb_downsamples_and_keeps_peaks():
+    """Test downsampling keeps endpoints and outliers"""
+    xs = list(range(100))
+    ys = [0.0] * 100
+    ys[37] = 50.0
+    
+    indices = lttb_indices(xs, ys, 10)
+    
+    assert len(indices) == 10
+    assert indices[0] == 0
+    assert indices[-1] == 99
+    assert indices == sorted(indices)
+    assert 37 in indices
+
+
+def test_compute_streaks():
+    """Test current and longest streaks from active days"""
+    days = [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 10), date(2024, 1, 11)]
+    
+    assert compute_streaks(days, date(2024, 1, 11)) == (2, 3)
+    assert compute_streaks(days, date(2024, 1, 12)) == (2, 3)
+    assert compute_streaks(days, date(2024, 1, 13)) == (0, 3)
+    assert compute_streaks([], date(2024, 1, 13)) == (0, 0)
+
+
+def test_range_start_counts_today():
+    """Test rolling ranges span exactly their number of calendar days, today included"""
+    now = datetime(2024, 3, 15, 18, 30, tzinfo=timezone.utc)
+    
+    assert get_range_start("day", now) == datetime(2024, 3, 15, tzinfo=timezone.utc)
+    assert get_range_start("week", now) == datetime(2024, 3, 9, tzinfo=timezone.utc)
+    assert get_range_start("month", now) == datetime(2024, 2, 15, tzinfo=timezone.utc)
+    assert get_range_start("all", now) is None
@@ -1,5 +1,13 @@
 import pytest
-from app.services.auth import hash_password, verify_password, create_access_token, decode_access_token
+from app.services.auth import (
+    hash_password,
+    verify_password,
+    create_access_token,
+    create_user_access_token,
+    create_user,
+    decode_access_token,
+    get_cached_user,
+)
 
 
 def test_hash_password():
@@ -65,3 +73,32 @@ def test_decode_invalid_token():
     decoded = decode_access_token(invalid_token)
     
     assert decoded is None
+
+
+def test_user_access_token_claims(db):
+    """Test user tokens carry the user ID and token version"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    
+    decoded = decode_access_token(create_user_access_token(user))
+    
+    assert decoded.username == "testuser"
+    assert decoded.user_id == user.id
+    assert decoded.token_version == 0
+
+
+def test_cached_user_reloaded_for_newer_token_version(db):
+    """Test a token newer than the cached user bypasses the stale cache entry"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    user_id = user.id
+    get_cached_user(db, user_id)
+    
+    # Another process bumps the version after this one cached the user
+    user.token_version += 1
+    db.commit()
+    db.expunge_all()
+    
+    assert get_cached_user(db, user_id).token_version == 0
+    db.expunge_all()
+    assert get_cached_user(db, user_id, min_token_version=1).token_version == 1
+    db.expunge_all()
+    assert get_cached_user(db, user_id).token_version == 1
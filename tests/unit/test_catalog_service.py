@@ -0,0 +1,88 @@
+import pytest
+from sqlalchemy import event, text
+from app.db.models import ExerciseAlias
+from app.services.auth import create_user
+from app.services.catalog import (
+    clear_exercise_cache,
+    find_exercise,
+    normalize_exercise_name,
+    resolve_exercise,
+    resolve_exercises,
+)
+from app.services.records import get_personal_records
+from app.services.workouts import create_workout_session
+from app.schemas.workouts import WorkoutSessionCreate, ExerciseCreate, WorkoutSetCreate
+
+
+def test_normalize_exercise_name():
+    """Test exercise name normalization"""
+    assert normalize_exercise_name("  Bench   Press ") == "bench press"
+    assert normalize_exercise_name("BENCH PRESS") == "bench press"
+
+
+def test_resolve_exercises_merges_spellings(db):
+    """Test differently spelled names resolve to one catalog entry"""
+    resolved = resolve_exercises(db, ["Bench Press", "bench  press", "Squat"])
+    
+    assert resolved["Bench Press"] == resolved["bench  press"]
+    assert resolved["Bench Press"][1] == "Bench Press"
+    assert resolved["Squat"][0] != resolved["Bench Press"][0]
+
+
+def test_resolve_exercise_survives_cache_clear(db):
+    """Test resolution is stable when served from the database"""
+    first = resolve_exercise(db, "Deadlift")
+    clear_exercise_cache()
+    
+    assert resolve_exercise(db, "deadlift") == first
+    assert find_exercise(db, "DEADLIFT") == first
+
+
+def test_create_uses_callers_connection(db):
+    """Test unknown names are added on the session's connection, without a second checkout"""
+    checkouts = []
+    
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.append(connection_record)
+    
+    db.execute(text("SELECT 1"))  # The session now holds its connection
+    engine = db.get_bind()
+    event.listen(engine, "checkout", on_checkout)
+    try:
+        created = resolve_exercise(db, "Zercher Squat")
+    finally:
+        event.remove(engine, "checkout", on_checkout)
+    db.commit()
+    
+    assert checkouts == []
+    assert find_exercise(db, "zercher squat") == created
+
+
+def test_find_exercise_unknown(db):
+    """Test looking up an unknown exercise does not create it"""
+    assert find_exercise(db, "Underwater Basket Weaving") is None
+    assert find_exercise(db, "Underwater Basket Weaving") is None
+
+
+def test_alias_resolves_to_catalog_entry(db):
+    """Test an alias resolves to its canonical exercise"""
+    catalog_id, name = resolve_exercise(db, "Barbell Bench Press")
+    db.add(ExerciseAlias(alias="bb bench", catalog_id=catalog_id))
+    db.commit()
+    
+    assert resolve_exercise(db, "BB Bench") == (catalog_id, name)
+
+
+def test_workouts_share_catalog_history(db):
+    """Test records combine history across spellings of an exercise"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    for name, weight in (("Bench Press", 80.0), ("bench press", 90.0)):
+        create_workout_session(db, WorkoutSessionCreate(
+            title="Push",
+            exercises=[ExerciseCreate(name=name, sets=[WorkoutSetCreate(reps=5, weight=weight)])]
+        ), user.id)
+    
+    records = get_personal_records(db, user.id)
+    
+    assert [record.exercise_name for record in records] == ["Bench Press"]
+    assert records[0].max_weight == 90.0
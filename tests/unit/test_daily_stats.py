@@ -0,0 +1,81 @@
+import pytest
+from app.db.models import UserDailyStats
+from app.services.auth import create_user
+from app.services.daily_stats import rebuild_daily_stats, workout_day
+from app.services.workouts import (
+    create_workout_session,
+    add_exercise_to_workout,
+    delete_exercise,
+    delete_workout_session,
+)
+from app.schemas.workouts import WorkoutSessionCreate, ExerciseCreate, WorkoutSetCreate
+
+
+def _stats(db, user_id):
+    """Return the user's rollup rows as comparable dicts"""
+    db.expire_all()
+    rows = db.query(UserDailyStats).filter(UserDailyStats.user_id == user_id).all()
+    return {
+        row.day: (row.workouts, row.completed_workouts, row.exercises, row.sets, row.reps, row.volume)
+        for row in rows
+    }
+
+
+def test_create_workout_updates_daily_stats(db):
+    """Test creating a workout adds its totals to the rollup"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    workout_data = WorkoutSessionCreate(
+        title="Leg Day",
+        exercises=[
+            ExerciseCreate(name="Squat", sets=[
+                WorkoutSetCreate(reps=5, weight=100.0),
+                WorkoutSetCreate(reps=5, weight=110.0),
+            ]),
+            ExerciseCreate(name="Lunge", sets=[WorkoutSetCreate(reps=10, weight=20.0)]),
+        ]
+    )
+    
+    workout = create_workout_session(db, workout_data, user.id)
+    
+    stats = _stats(db, user.id)
+    assert len(stats) == 1
+    assert stats[workout_day(workout.date)] == (1, 0, 2, 3, 20, 5 * 100.0 + 5 * 110.0 + 10 * 20.0)
+
+
+def test_exercise_changes_update_daily_stats(db):
+    """Test adding and deleting exercises adjusts the rollup"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    workout = create_workout_session(db, WorkoutSessionCreate(title="Push", exercises=[]), user.id)
+    
+    exercise = add_exercise_to_workout(
+        db,
+        workout.id,
+        ExerciseCreate(name="Bench Press", sets=[WorkoutSetCreate(reps=8, weight=80.0)]),
+        user.id
+    )
+    assert list(_stats(db, user.id).values()) == [(1, 0, 1, 1, 8, 640.0)]
+    
+    delete_exercise(db, exercise.id, user.id)
+    assert list(_stats(db, user.id).values()) == [(1, 0, 0, 0, 0, 0.0)]
+    
+    delete_workout_session(db, workout.id, user.id)
+    assert list(_stats(db, user.id).values()) == [(0, 0, 0, 0, 0, 0.0)]
+
+
+def test_rebuild_daily_stats_matches_incremental(db):
+    """Test a full rebuild reproduces the incrementally maintained rollup"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    for title in ("A", "B"):
+        create_workout_session(db, WorkoutSessionCreate(
+            title=title,
+            exercises=[ExerciseCreate(name="Row", sets=[
+                WorkoutSetCreate(reps=10, weight=50.0),
+                WorkoutSetCreate(reps=8, weight=55.0),
+            ])]
+        ), user.id)
+    incremental = _stats(db, user.id)
+    
+    rows = rebuild_daily_stats(db, user_id=user.id)
+    
+    assert rows == 1
+    assert _stats(db, user.id) == incremental
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from app.db.pool import InstrumentedQueuePool
+
+
+@pytest.fixture
+def pool_engine(tmp_path):
+    """Engine with a one-connection pool and no overflow"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_pool_metrics_count_checkouts(pool_engine):
+    """Test checkouts and new connections are counted"""
+    for _ in range(3):
+        with pool_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    
+    metrics = pool_engine.pool.metrics()
+    
+    assert metrics["checkouts"] == 3
+    assert metrics["connects"] == 1
+    assert metrics["checked_out"] == 0
+    assert metrics["idle"] == 1
+    assert metrics["checkout_ms_max"] >= metrics["checkout_ms_mean"] > 0
+
+
+def test_pool_metrics_report_checked_out_and_timeouts(pool_engine):
+    """Test held connections and exhausted-pool timeouts are reported"""
+    with pool_engine.connect():
+        assert pool_engine.pool.metrics()["checked_out"] == 1
+        
+        with pytest.raises(exc.TimeoutError):
+            pool_engine.connect()
+    
+    metrics = pool_engine.pool.metrics()
+    assert metrics["checkout_timeouts"] == 1
+    assert metrics["checked_out"] == 0
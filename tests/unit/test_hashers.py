@@ -0,0 +1,68 @@
+import pytest
+from app.core.config import settings
+from app.services.auth import authenticate_user, create_user, password_needs_rehash, verify_password
+from app.services.hashers import (
+    HASHERS,
+    PBKDF2SHA256Hasher,
+    ScryptHasher,
+    get_hasher,
+    identify_hasher,
+    register_hasher,
+)
+
+
+@pytest.mark.parametrize("hasher", [PBKDF2SHA256Hasher(iterations=1000), ScryptHasher(n=2 ** 10)])
+def test_hasher_round_trip(hasher):
+    """Test each hasher verifies its own hashes"""
+    encoded = hasher.encode("secret")
+    
+    assert encoded.startswith(hasher.algorithm + "$")
+    assert hasher.verify("secret", encoded) is True
+    assert hasher.verify("wrong", encoded) is False
+    assert verify_password("secret", encoded) is True
+
+
+def test_identify_hasher():
+    """Test the hasher is chosen from the algorithm prefix"""
+    assert isinstance(identify_hasher(ScryptHasher(n=2 ** 10).encode("secret")), ScryptHasher)
+    with pytest.raises(ValueError):
+        identify_hasher("md5$abc")
+
+
+def test_register_hasher(monkeypatch):
+    """Test hashers added to the registry are used for hashing and verifying"""
+    class FastPBKDF2Hasher(PBKDF2SHA256Hasher):
+        algorithm = "pbkdf2_fast"
+    
+    monkeypatch.setattr("app.services.hashers.HASHERS", dict(HASHERS))
+    register_hasher("pbkdf2_fast", lambda: FastPBKDF2Hasher(iterations=10))
+    monkeypatch.setattr(settings, "PASSWORD_HASHER", "pbkdf2_fast")
+    
+    encoded = get_hasher().encode("secret")
+    assert encoded.startswith("pbkdf2_fast$10$")
+    assert verify_password("secret", encoded) is True
+    assert password_needs_rehash(encoded) is False
+
+
+def test_password_needs_rehash(monkeypatch):
+    """Test hashes with other parameters or algorithms are flagged"""
+    monkeypatch.setattr(settings, "PBKDF2_ITERATIONS", 1000)
+    
+    assert password_needs_rehash(PBKDF2SHA256Hasher(iterations=1000).encode("secret")) is False
+    assert password_needs_rehash(PBKDF2SHA256Hasher(iterations=2000).encode("secret")) is True
+    assert password_needs_rehash(ScryptHasher(n=2 ** 10).encode("secret")) is True
+
+
+def test_rehash_on_login(db, monkeypatch):
+    """Test login replaces a hash made with outdated parameters"""
+    monkeypatch.setattr(settings, "PBKDF2_ITERATIONS", 1000)
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    
+    monkeypatch.setattr(settings, "PASSWORD_HASHER", "scrypt")
+    monkeypatch.setattr(settings, "SCRYPT_N", 2 ** 10)
+    assert authenticate_user(db, "testuser", "password123") is not None
+    
+    db.refresh(user)
+    assert user.password.startswith("scrypt$1024$8$1$")
+    assert authenticate_user(db, "testuser", "password123") is not None
+    assert authenticate_user(db, "testuser", "wrong") is None
@@ -0,0 +1,29 @@
+import pytest
+from datetime import date, datetime, timezone
+
+from app.services.pagination import encode_cursor, decode_cursor
+
+
+def test_cursor_round_trip_datetime():
+    """Test encoding and decoding a datetime cursor"""
+    position = datetime(2024, 5, 17, 18, 30, 15, 123456, tzinfo=timezone.utc)
+    cursor = encode_cursor(position, 42)
+    
+    assert decode_cursor(cursor) == (position, 42)
+
+
+def test_cursor_round_trip_date():
+    """Test encoding and decoding a date cursor"""
+    cursor = encode_cursor(date(2024, 5, 17), 7)
+    
+    decoded_value, decoded_id = decode_cursor(cursor)
+    
+    assert decoded_value.date() == date(2024, 5, 17)
+    assert decoded_id == 7
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "eyJkIjoxfQ"])
+def test_decode_invalid_cursor(cursor):
+    """Test decoding malformed cursors"""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
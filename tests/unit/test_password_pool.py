@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from app.core.password_pool import PasswordHashingBusy, PasswordHashingPool
+from app.services.auth import hash_password, verify_password
+
+
+def test_pool_hashes_in_worker_process():
+    """Test hashing jobs run in the process pool"""
+    pool = PasswordHashingPool(workers=1, max_pending=2)
+    try:
+        hashed = asyncio.run(pool.run(hash_password, "secret"))
+        
+        assert verify_password("secret", hashed)
+        assert pool.stats()["pending"] == 0
+    finally:
+        pool.shutdown()
+
+
+def test_pool_rejects_when_full():
+    """Test jobs beyond the queue bound are rejected immediately"""
+    pool = PasswordHashingPool(workers=0, max_pending=1)
+    
+    async def burst():
+        return await asyncio.gather(
+            pool.run(hash_password, "first"),
+            pool.run(hash_password, "second"),
+            return_exceptions=True
+        )
+    
+    first, second = asyncio.run(burst())
+    
+    assert first.startswith("pbkdf2_sha256$")
+    assert isinstance(second, PasswordHashingBusy)
+    assert pool.stats()["rejected"] == 1
+
+
+def test_pool_spawns_workers():
+    """Test workers are spawned, not forked from the threaded server process"""
+    pool = PasswordHashingPool(workers=1, max_pending=1)
+    try:
+        assert pool._get_executor()._mp_context.get_start_method() == "spawn"
+    finally:
+        pool.shutdown()
+
+
+def test_pool_shut_down_with_app(monkeypatch):
+    """Test the app's lifespan stops the worker processes on shutdown"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.services.auth import password_pool
+    
+    monkeypatch.setattr(password_pool, "workers", 1)
+    with TestClient(app):
+        password_pool._get_executor()
+        assert password_pool._executor is not None
+    
+    assert password_pool._executor is None
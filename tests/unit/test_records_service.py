@@ -0,0 +1,90 @@
+import pytest
+from app.db.models import PersonalRecord
+from app.services.auth import create_user
+from app.services.records import estimated_1rm, get_personal_records, rebuild_personal_records
+from app.services.workouts import create_workout_session, delete_exercise
+from app.schemas.workouts import WorkoutSessionCreate, ExerciseCreate, WorkoutSetCreate
+
+
+def _bench(*sets):
+    return WorkoutSessionCreate(
+        title="Push",
+        exercises=[ExerciseCreate(
+            name="Bench Press",
+            sets=[WorkoutSetCreate(reps=reps, weight=weight) for reps, weight in sets]
+        )]
+    )
+
+
+def _records(db, user_id):
+    db.expire_all()
+    return {
+        record.exercise_name: (
+            record.max_weight, record.max_weight_reps, record.best_e1rm, record.best_volume
+        )
+        for record in get_personal_records(db, user_id)
+    }
+
+
+def test_estimated_1rm():
+    """Test the Epley one-rep max estimate"""
+    assert estimated_1rm(100.0, 1) == 100.0
+    assert estimated_1rm(100.0, 10) == pytest.approx(133.33, abs=0.01)
+
+
+def test_records_raised_on_create(db):
+    """Test new sets raise personal records"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    
+    create_workout_session(db, _bench((10, 80.0), (5, 90.0)), user.id)
+    create_workout_session(db, _bench((3, 90.0), (12, 70.0)), user.id)
+    
+    max_weight, reps, e1rm, volume = _records(db, user.id)["Bench Press"]
+    assert max_weight == 90.0
+    assert reps == 5
+    assert e1rm == pytest.approx(estimated_1rm(80.0, 10))
+    assert volume == 10 * 80.0 + 5 * 90.0
+
+
+def test_records_recomputed_on_delete(db):
+    """Test deleting the record-setting exercise lowers the record"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    create_workout_session(db, _bench((5, 80.0)), user.id)
+    heavy = create_workout_session(db, _bench((5, 100.0)), user.id)
+    
+    delete_exercise(db, heavy.exercises[0].id, user.id)
+    
+    assert _records(db, user.id)["Bench Press"][0] == 80.0
+
+
+def test_rebuild_personal_records_matches_incremental(db):
+    """Test a full rebuild reproduces incrementally maintained records"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    create_workout_session(db, _bench((8, 60.0), (8, 60.0)), user.id)
+    create_workout_session(db, _bench((6, 70.0), (4, 70.0)), user.id)
+    incremental = _records(db, user.id)
+    
+    db.query(PersonalRecord).delete()
+    db.commit()
+    count = rebuild_personal_records(db, user_id=user.id)
+    
+    assert count == 1
+    assert _records(db, user.id) == incremental
+
+
+def test_records_merge_repeated_exercise_in_one_workout(db):
+    """Test two entries of one exercise in a workout compete for each record"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    workout_data = WorkoutSessionCreate(
+        title="Push",
+        exercises=[
+            ExerciseCreate(name="Bench Press", sets=[WorkoutSetCreate(reps=10, weight=80.0)]),
+            ExerciseCreate(name="bench press", sets=[WorkoutSetCreate(reps=3, weight=100.0)]),
+        ]
+    )
+    
+    create_workout_session(db, workout_data, user.id)
+    
+    assert _records(db, user.id)["Bench Press"] == (
+        100.0, 3, pytest.approx(estimated_1rm(100.0, 3)), 800.0
+    )
@@ -0,0 +1,29 @@
+import inspect
+from fastapi.routing import APIRoute
+
+from app.api import deps
+from app.db import database
+from app.main import app
+
+
+# Handlers that receive get_db's Session because current_user is attached to
+# it; they only touch it through run_service, which uses the thread pool
+SYNC_SESSION_HANDLERS = {
+    ("PUT", "/api/users/me"),
+    ("DELETE", "/api/users/me"),
+}
+
+
+def test_async_handlers_do_not_take_blocking_sessions():
+    """Test async def handlers get their session from get_service_db, not get_db"""
+    blocking = []
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or not inspect.iscoroutinefunction(route.endpoint):
+            continue
+        calls = {dependency.call for dependency in route.dependant.dependencies}
+        takes_sync_session = bool(calls & {deps.get_db, database.get_db})
+        for method in route.methods:
+            if takes_sync_session and (method, route.path) not in SYNC_SESSION_HANDLERS:
+                blocking.append(f"{method} {route.path}")
+    
+    assert blocking == []
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+from app.db.models import RefreshToken, RevokedToken, RevokedTokenVersion, User
+from app.schemas.users import TokenData
+from app.services.auth import create_user
+from app.services.tokens import (
+    RevocationList,
+    issue_refresh_token,
+    purge_expired_tokens,
+    revoke_access_token,
+    revoke_user_access_tokens,
+)
+
+
+def test_revocation_list_reload(db):
+    """Test revocations stored by another process are picked up on reload"""
+    now = datetime.now(timezone.utc)
+    db.add(RevokedToken(jti="expired", expires_at=now - timedelta(minutes=1)))
+    db.add(RevokedToken(jti="active", expires_at=now + timedelta(minutes=5)))
+    db.commit()
+    
+    revoked = RevocationList(reload_interval=60)
+    assert revoked.is_stale()
+    revoked.reload(db)
+    
+    assert not revoked.is_stale()
+    assert "active" in revoked
+    assert "expired" not in revoked
+
+
+def test_revoke_user_access_tokens(db):
+    """Test a version bump revokes older tokens, here and after a reload elsewhere"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    user_id = user.id
+    
+    assert revoke_user_access_tokens(db, user_id) == 1
+    assert revoke_user_access_tokens(db, user_id) == 2
+    db.commit()
+    
+    assert db.get(User, user_id).token_version == 2
+    assert db.get(RevokedTokenVersion, user_id).min_version == 2
+    
+    revoked = RevocationList(reload_interval=60)
+    revoked.reload(db)
+    assert revoked.rejects(TokenData(username="testuser", user_id=user_id, token_version=1))
+    assert not revoked.rejects(TokenData(username="testuser", user_id=user_id, token_version=2))
+    assert not revoked.rejects(TokenData(username="other", user_id=user_id + 1, token_version=0))
+
+
+def test_purge_expired_tokens(db):
+    """Test expired refresh tokens and revocations are deleted"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    issue_refresh_token(db, user.id)
+    now = datetime.now(timezone.utc)
+    db.add(RefreshToken(
+        user_id=user.id, token_hash="old", family_id="f", expires_at=now - timedelta(days=1)
+    ))
+    db.commit()
+    revoke_access_token(db, "gone", now - timedelta(minutes=1))
+    revoke_access_token(db, "kept", now + timedelta(minutes=5))
+    db.add(RevokedTokenVersion(user_id=user.id, min_version=1, expires_at=now - timedelta(minutes=1)))
+    db.commit()
+    
+    assert purge_expired_tokens(db) == 3
+    assert db.query(RefreshToken).count() == 1
+    assert [row.jti for row in db.query(RevokedToken)] == ["kept"]
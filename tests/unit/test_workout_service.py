@@ -1,4 +1,6 @@
 import pytest
+from sqlalchemy import event
+
 from app.services.workouts import (
     create_workout_session,
     get_workout_session,
@@ -6,7 +8,13 @@ from app.services.workouts import (
     update_workout_session,
     delete_workout_session,
 )
-from app.schemas.workouts import WorkoutSessionCreate, WorkoutSessionUpdate, ExerciseCreate, WorkoutSetCreate
+from app.schemas.workouts import (
+    WorkoutSession as WorkoutSessionSchema,
+    WorkoutSessionCreate,
+    WorkoutSessionUpdate,
+    ExerciseCreate,
+    WorkoutSetCreate,
+)
 from app.services.auth import create_user
 
 
@@ -119,3 +127,123 @@ def test_delete_workout_session(db):
     # Verify deletion
     retrieved = get_workout_session(db, workout.id, user.id)
     assert retrieved is None
+
+
+def _count_list_queries(db, user_id):
+    """Count statements needed to list and fully serialize a user's workouts"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        db.expire_all()
+        workouts = get_user_workouts(db, user_id)
+        for workout in workouts:
+            WorkoutSessionSchema.model_validate(workout)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return len(statements)
+
+
+def test_get_user_workouts_query_count_is_constant(db):
+    """Test listing workouts does not issue a query per workout or exercise"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    workout_data = WorkoutSessionCreate(
+        title="Full Body",
+        exercises=[
+            ExerciseCreate(
+                name=name,
+                sets=[WorkoutSetCreate(reps=10, weight=50.0) for _ in range(3)]
+            )
+            for name in ("Squat", "Bench Press", "Row")
+        ]
+    )
+
+    for _ in range(2):
+        create_workout_session(db, workout_data, user.id)
+    small_page = _count_list_queries(db, user.id)
+
+    for _ in range(8):
+        create_workout_session(db, workout_data, user.id)
+    large_page = _count_list_queries(db, user.id)
+
+    assert small_page == large_page
+
+
+def _count_create_statements(db, user_id, exercise_count, sets_per_exercise):
+    """Count statements needed to create one workout of the given size"""
+    workout_data = WorkoutSessionCreate(
+        title="Volume Day",
+        exercises=[
+            ExerciseCreate(
+                name="Squat",
+                sets=[WorkoutSetCreate(reps=5, weight=100.0 + i) for i in range(sets_per_exercise)]
+            )
+            for _ in range(exercise_count)
+        ]
+    )
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        workout = create_workout_session(db, workout_data, user_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert sum(len(exercise.sets) for exercise in workout.exercises) == exercise_count * sets_per_exercise
+    return len(statements)
+
+
+def test_create_workout_statement_count_is_constant(db):
+    """Test creating a workout does not issue statements per set"""
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    # Create the catalog entry, then look it up committed so the cache is
+    # warm for both runs
+    _count_create_statements(db, user.id, 1, 1)
+    _count_create_statements(db, user.id, 1, 1)
+
+    # Exercise rows are batched too on Postgres; SQLite returns their IDs
+    # in order only when inserting one row at a time
+    small = _count_create_statements(db, user.id, 3, 1)
+    large = _count_create_statements(db, user.id, 3, 20)
+
+    assert small == large
+
+
+def test_delete_workout_cascades_in_database(db):
+    """Test deleting a workout removes its exercises and sets without loading them"""
+    from app.db.models import Exercise, WorkoutSet
+    
+    user = create_user(db, "testuser", "test@example.com", "password123")
+    workout = create_workout_session(db, WorkoutSessionCreate(
+        title="Full Body",
+        exercises=[
+            ExerciseCreate(name=name, sets=[WorkoutSetCreate(reps=5, weight=50.0)] * 4)
+            for name in ("Squat", "Bench Press", "Row")
+        ]
+    ), user.id)
+    user_id, workout_id = user.id, workout.id
+    db.expunge_all()
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        assert delete_workout_session(db, workout_id, user_id) is True
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert not [s for s in statements if s.startswith(("DELETE FROM exercises", "DELETE FROM workout_sets"))]
+    assert db.query(Exercise).count() == 0
+    assert db.query(WorkoutSet).count() == 0